@@ -3,13 +3,24 @@
 
 r"""Bounding box analysis
 
+Notes
+-----
+Axis aligned bounding boxes can be cached (BoundingBox(..., use_cache=True)) by shape (same TShape and Location),
+options and triangulation state. The cache holds references to at most _CACHE_MAX_SIZE shapes,
+the oldest entries are dropped first. Use clear_cache() if the geometry of a shape is modified in place
+
 """
 
 import logging
 
+import numpy as np
 import OCC.Bnd
 import OCC.BRepBndLib
+import OCC.BRep
 import OCC.gp
+import OCC.TopAbs
+import OCC.TopExp
+import OCC.TopLoc
 import OCC.TopoDS
 
 import aocutils.geom.point
@@ -21,16 +32,81 @@ import aocutils.mesh
 logger = logging.getLogger(__name__)
 
 
+# (shape hash, tol, use_triangulation, optimal, triangulation state) -> list of (shape, bounds)
+_cache = dict()
+# (key, shape) of the cached bounds, oldest first
+_cache_entries = list()
+_CACHE_MAX_SIZE = 4096
+
+
+def clear_cache():
+    r"""Forget all the cached bounding boxes"""
+    _cache.clear()
+    del _cache_entries[:]
+
+
+def _triangulation_state(shape):
+    r"""Number of triangulated faces and total number of triangles of a shape"""
+    n_faces, n_triangles = 0, 0
+    explorer = OCC.TopExp.TopExp_Explorer(shape, OCC.TopAbs.TopAbs_FACE)
+    location = OCC.TopLoc.TopLoc_Location()
+    while explorer.More():
+        triangulation = OCC.BRep.BRep_Tool_Triangulation(OCC.TopoDS.topods_Face(explorer.Current()), location)
+        if not triangulation.IsNull():
+            n_faces += 1
+            n_triangles += triangulation.GetObject().NbTriangles()
+        explorer.Next()
+    return n_faces, n_triangles
+
+
+def _cached_bounds(shape, key):
+    r"""Cached bounds of a shape for the key, or None"""
+    for cached_shape, bounds in _cache.get(key, list()):
+        if cached_shape.IsSame(shape):
+            return bounds
+    return None
+
+
+def _cache_bounds(shape, key, bounds):
+    r"""Cache the bounds of a shape for the key, dropping the oldest entry if the cache is full"""
+    if len(_cache_entries) >= _CACHE_MAX_SIZE:
+        oldest_key, oldest_shape = _cache_entries.pop(0)
+        bucket = _cache[oldest_key]
+        bucket[:] = [(cached_shape, cached_bounds) for cached_shape, cached_bounds in bucket
+                     if cached_shape is not oldest_shape]
+        if len(bucket) == 0:
+            del _cache[oldest_key]
+    _cache.setdefault(key, list()).append((shape, bounds))
+    _cache_entries.append((key, shape))
+
+
 class BoundingBox(object):
     r"""Wrapper class for a bounding box
 
+    Parameters
+    ----------
+    shape : OCC.TopoDS.TopoDS_Shape
+    tol : float (optional)
+        Gap added in all directions
+    use_triangulation : bool (optional)
+        If True (the default), the triangulation of the faces is used when it exists (fast).
+        If False, the box is computed from the geometry
+    optimal : bool (optional)
+        If True, compute a tight box that does not include the tolerances of the sub-shapes
+        (brepbndlib_AddOptimal if available in the OCC version, brepbndlib_AddClose otherwise).
+        The default is False
+    use_cache : bool (optional)
+        Reuse the bounds computed for the same shape with the same options and, if use_triangulation is True,
+        the same triangulation. The default is False
+
     Notes
     -----
     Mesh the shape before instantiating a BoundingBox if required, infinite recursion would be created by calling
     mesh.py's mesh() method
 
     """
-    def __init__(self, shape, tol=aocutils.tolerance.OCCUTILS_DEFAULT_TOLERANCE):
+    def __init__(self, shape, tol=aocutils.tolerance.OCCUTILS_DEFAULT_TOLERANCE, use_triangulation=True,
+                 optimal=False, use_cache=False):
         if isinstance(shape, OCC.TopoDS.TopoDS_Shape) or issubclass(shape.__class__, OCC.TopoDS.TopoDS_Shape):
             self._shape = shape
         else:
@@ -39,10 +115,31 @@ class BoundingBox(object):
             raise aocutils.exceptions.WrongTopologicalType(msg)
         # self._shape = shape
         self._tol = tol
+        bounds = None
+        if use_cache:
+            key = (shape.HashCode(2147483647), tol, use_triangulation, optimal,
+                   _triangulation_state(shape) if use_triangulation else None)
+            bounds = _cached_bounds(shape, key)
+
+        if bounds is None:
+            bbox = OCC.Bnd.Bnd_Box()
+            bbox.SetGap(tol)
+            if optimal:
+                add_optimal = getattr(OCC.BRepBndLib, "brepbndlib_AddOptimal", None)
+                if add_optimal is not None:
+                    add_optimal(self._shape, bbox, use_triangulation, False)
+                else:
+                    OCC.BRepBndLib.brepbndlib_AddClose(self._shape, bbox)
+            else:
+                OCC.BRepBndLib.brepbndlib_Add(self._shape, bbox, use_triangulation)
+            bounds = bbox.Get()
+            if use_cache:
+                _cache_bounds(shape, key, bounds)
+
+        # the gap is included in the bounds
         self._bbox = OCC.Bnd.Bnd_Box()
-        self._bbox.SetGap(tol)
-        OCC.BRepBndLib.brepbndlib_Add(self._shape, self._bbox)
-        self.x_min, self.y_min, self.z_min, self.x_max, self.y_max, self.z_max = self._bbox.Get()
+        self._bbox.Update(*bounds)
+        self.x_min, self.y_min, self.z_min, self.x_max, self.y_max, self.z_max = bounds
 
     @property
     def bnd_box(self):
@@ -101,3 +198,95 @@ class BoundingBox(object):
         """
         return aocutils.geom.point.Point.midpoint(OCC.gp.gp_Pnt(self.x_min, self.y_min, self.z_min),
                                                   OCC.gp.gp_Pnt(self.x_max, self.y_max, self.z_max))
+
+
+class OrientedBoundingBox(object):
+    r"""Oriented bounding box along the principal axes of the triangulation vertices of a shape
+
+    The axes come from a principal component analysis (PCA) of the vertices : the box is usually tight for
+    elongated or box-like shapes, but it is not the minimum volume oriented bounding box
+
+    Parameters
+    ----------
+    shape : OCC.TopoDS.TopoDS_Shape
+    tol : float (optional)
+        Gap added in all directions
+    factor : float (optional)
+        Meshing factor used if the shape is not meshed yet, see aocutils.mesh.mesh()
+
+    Notes
+    -----
+    The box bounds the triangulation : the linear deflection of the mesh is not accounted for.
+    As a side effect, the shape is meshed (aocutils.mesh.triangulation()) if it is not meshed yet
+
+    """
+    def __init__(self, shape, tol=aocutils.tolerance.OCCUTILS_DEFAULT_TOLERANCE, factor=4000.):
+        vertices = aocutils.mesh.triangulation(shape, factor=factor)[0]
+        if len(vertices) == 0:
+            msg = "Cannot compute an oriented bounding box without triangulation"
+            logger.error(msg)
+            raise aocutils.exceptions.WrongTopologicalType(msg)
+        mean = vertices.mean(axis=0)
+        # rows of axes are the principal directions
+        axes = np.linalg.svd(vertices - mean, full_matrices=False)[2]
+        if np.linalg.det(axes) < 0:
+            axes[2] = -axes[2]
+        local = (vertices - mean).dot(axes.T)
+        local_min, local_max = local.min(axis=0) - tol, local.max(axis=0) + tol
+        self._axes = axes
+        self._half_sizes = (local_max - local_min) / 2.
+        self._centre = mean + ((local_max + local_min) / 2.).dot(axes)
+
+    @property
+    def centre(self):
+        r"""Centre of the box
+
+        Returns
+        -------
+        np.ndarray
+            (3,)
+
+        """
+        return self._centre
+
+    @property
+    def axes(self):
+        r"""Directions of the box edges, as rows of a right-handed rotation matrix
+
+        Returns
+        -------
+        np.ndarray
+            (3, 3)
+
+        """
+        return self._axes
+
+    @property
+    def half_sizes(self):
+        r"""Half dimensions of the box along its axes
+
+        Returns
+        -------
+        np.ndarray
+            (3,)
+
+        """
+        return self._half_sizes
+
+    @property
+    def volume(self):
+        r"""Volume of the box"""
+        return float(np.prod(2 * self._half_sizes))
+
+    @property
+    def corners(self):
+        r"""The 8 corners of the box
+
+        Returns
+        -------
+        np.ndarray
+            (8, 3)
+
+        """
+        signs = np.array([[i, j, k] for i in (-1, 1) for j in (-1, 1) for k in (-1, 1)], dtype=np.float64)
+        return self._centre + (signs * self._half_sizes).dot(self._axes)
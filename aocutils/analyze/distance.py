@@ -4,9 +4,17 @@
 r"""distance
 """
 
+import logging
+
+import numpy as np
 import OCC.BRepExtrema
 
+import aocutils.analyze.spatial
 import aocutils.common
+import aocutils.parallel
+import aocutils.tolerance
+
+logger = logging.getLogger(__name__)
 
 
 class MinimumDistance(object):
@@ -61,3 +69,120 @@ class MinimumDistance(object):
         """
         assert self._nb_solutions == len(self._points_pairs)
         return self._nb_solutions
+
+
+def _pair_distance(shape_1, shape_2):
+    r"""Minimum distance and the first solution points of a pair of shapes
+
+    Returns
+    -------
+    tuple
+        (distance, (x, y, z) on shape_1, (x, y, z) on shape_2), all NaN if there is no solution
+
+    """
+    md = MinimumDistance(shape_1, shape_2)
+    if md.nb_solutions == 0:
+        logger.warning("No minimum distance solution between a pair of shapes")
+        return np.nan, (np.nan,) * 3, (np.nan,) * 3
+    pnt_1, pnt_2 = md.point_pairs[0]
+    return md.minimum_distance, pnt_1.Coord(), pnt_2.Coord()
+
+
+def candidate_pairs(shapes, threshold=np.inf, tolerance=aocutils.tolerance.OCCUTILS_DEFAULT_TOLERANCE):
+    r"""Pairs of shapes whose bounding boxes are closer than threshold
+
+    Parameters
+    ----------
+    shapes : list[OCC.TopoDS.TopoDS_Shape]
+    threshold : float (optional)
+        The default is infinite (all pairs)
+    tolerance : float (optional)
+        Gap of the bounding boxes
+
+    Returns
+    -------
+    np.ndarray
+        (K, 2) int32 pairs of indices into shapes, i < j
+
+    """
+    shapes = list(shapes)
+    n = len(shapes)
+    if n < 2:
+        return np.zeros((0, 2), dtype=np.int32)
+    if not np.isfinite(threshold):
+        i, j = np.triu_indices(n, 1)
+        return np.column_stack([i, j]).astype(np.int32)
+    tree = aocutils.analyze.spatial.BoundingBoxTree(shapes, tolerance)
+    boxes = tree.boxes + np.array([-threshold] * 3 + [threshold] * 3)
+    i, j = tree.query_boxes(boxes)
+    keep = i < j
+    pairs = np.column_stack([i[keep], j[keep]]).astype(np.int32)
+    if len(pairs) > 0:
+        pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+    logger.debug("%i candidate pairs out of %i" % (len(pairs), n * (n - 1) // 2))
+    return pairs
+
+
+def minimum_distances(shapes, threshold=np.inf, processes=None,
+                      tolerance=aocutils.tolerance.OCCUTILS_DEFAULT_TOLERANCE):
+    r"""Minimum distances between all the pairs of shapes closer than threshold
+
+    The pairs are pruned with the bounding boxes, the exact distance is only computed for the remaining ones
+
+    Parameters
+    ----------
+    shapes : list[OCC.TopoDS.TopoDS_Shape]
+    threshold : float (optional)
+        Maximum distance of interest. The default is infinite (all pairs)
+    processes : int (optional)
+        If not None, the exact distances are computed in a pool of processes. The default is None
+    tolerance : float (optional)
+        Gap of the bounding boxes
+
+    Returns
+    -------
+    pairs : np.ndarray
+        (K, 2) int32 pairs of indices into shapes, i < j
+    distances : np.ndarray
+        (K,) minimum distances, not greater than threshold. Pairs without solution are dropped
+    points : np.ndarray
+        (K, 2, 3) closest points on each shape of the pair (first solution)
+
+    """
+    shapes = list(shapes)
+    pairs = candidate_pairs(shapes, threshold, tolerance)
+    if processes is None:
+        results = [_pair_distance(shapes[i], shapes[j]) for i, j in pairs]
+    else:
+        results = aocutils.parallel.pool_map_shapes(_pair_distance, [(shapes[i], shapes[j]) for i, j in pairs],
+                                                    processes=processes)
+
+    distances = np.array([result[0] for result in results], dtype=np.float64)
+    points = np.array([(result[1], result[2]) for result in results], dtype=np.float64).reshape(-1, 2, 3)
+    keep = distances <= threshold
+    return pairs[keep], distances[keep], points[keep]
+
+
+def distance_matrix(pairs, distances, n):
+    r"""Symmetric sparse matrix of the distances returned by minimum_distances()
+
+    Parameters
+    ----------
+    pairs : np.ndarray
+        (K, 2)
+    distances : np.ndarray
+        (K,)
+    n : int
+        Number of shapes
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        (n, n). Zero distances (contacts) are explicitly stored
+
+    """
+    # scipy is only needed here
+    import scipy.sparse
+    rows = np.concatenate([pairs[:, 0], pairs[:, 1]])
+    cols = np.concatenate([pairs[:, 1], pairs[:, 0]])
+    return scipy.sparse.csr_matrix((np.concatenate([distances, distances]), (rows, cols)), shape=(n, n))
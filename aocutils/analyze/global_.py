@@ -6,6 +6,7 @@ r"""analyze/global_.py
 
 import logging
 
+import numpy as np
 import OCC.GProp
 import OCC.BRepGProp
 
@@ -32,42 +33,81 @@ class GlobalProperties(object):
     surfacic_types = ["face", "shell"]
     volumic_types = ["solid"]
 
-    def __init__(self, shape):
+    def __init__(self, shape, eps=None):
         self.shape = shape
         self._topo_type = aocutils.types.topo_lut[self.shape.ShapeType()]
-        self._system = None
+        self._eps = eps
+        # (GProp_GProps, error) once integrated
+        self._integration = None
 
     @property
     def topo_type(self):
         r"""Topological geom_type"""
         return self._topo_type
 
-    @property
-    def system(self):
-        r"""Initialise the GProp_GProps depending on the topological type
-
-        Notes
-        -----
-        geom_type could be abstracted with TopoDS... instead of using _topo_type
+    def _integrate(self):
+        r"""Integrate the properties on first call
 
         Returns
         -------
-        OCC.GProp.GProp_GProps
+        tuple
+            (OCC.GProp.GProp_GProps, error estimate or None)
 
         """
-        self._system = OCC.GProp.GProp_GProps()
+        if self._integration is not None:
+            return self._integration
 
+        system = OCC.GProp.GProp_GProps()
+        error = None
         if self._topo_type in GlobalProperties.surfacic_types:
-            OCC.BRepGProp.brepgprop_SurfaceProperties(self.shape, self._system)
+            if self._eps is None:
+                OCC.BRepGProp.brepgprop_SurfaceProperties(self.shape, system)
+            else:
+                error = OCC.BRepGProp.brepgprop_SurfaceProperties(self.shape, system, self._eps)
         elif self._topo_type in GlobalProperties.linear_types:
-            OCC.BRepGProp.brepgprop_LinearProperties(self.shape, self._system)
+            if self._eps is not None:
+                logger.debug("eps is ignored for linear properties")
+            OCC.BRepGProp.brepgprop_LinearProperties(self.shape, system)
         elif self._topo_type in GlobalProperties.volumic_types:
-            OCC.BRepGProp.brepgprop_VolumeProperties(self.shape, self._system)
+            if self._eps is None:
+                OCC.BRepGProp.brepgprop_VolumeProperties(self.shape, system)
+            else:
+                error = OCC.BRepGProp.brepgprop_VolumeProperties(self.shape, system, self._eps)
         else:
             msg = "ShapeType is not linear, surfacic or volumic"
             logger.error(msg)
             raise aocutils.exceptions.WrongTopologicalType(msg)
-        return self._system
+        self._integration = system, error
+        return self._integration
+
+    @property
+    def system(self):
+        r"""The GProp_GProps depending on the topological type, integrated on first access
+
+        Notes
+        -----
+        geom_type could be abstracted with TopoDS... instead of using _topo_type
+
+        Returns
+        -------
+        OCC.GProp.GProp_GProps
+
+        """
+        system, _ = self._integrate()
+        return system
+
+    @property
+    def error(self):
+        r"""Estimation of the relative error of the integration
+
+        Returns
+        -------
+        float or None
+            None if no eps was given or for linear types
+
+        """
+        _, error = self._integrate()
+        return error
 
     @property
     def centre(self):
@@ -81,7 +121,8 @@ class GlobalProperties(object):
     @property
     def inertia(self):
         """Inertia matrix"""
-        return self.system.MatrixOfInertia(), self.system.MomentOfInertia()
+        system = self.system
+        return system.MatrixOfInertia(), system.MomentOfInertia()
 
     @property
     def area(self):
@@ -112,3 +153,51 @@ class GlobalProperties(object):
             logger.error(msg)
             raise aocutils.exceptions.WrongTopologicalType(msg)
         return self.system.Mass()
+
+    def properties(self):
+        r"""All the global properties from a single integration
+
+        Returns
+        -------
+        dict
+            topo_type : str
+            length, area or volume : float (depending on the topological type)
+            centre : np.ndarray (3,)
+            matrix_of_inertia : np.ndarray (3, 3) with respect to the centre
+            principal_moments : np.ndarray (3,)
+            error : float or None
+
+        """
+        system, error = self._integrate()
+        if self.topo_type in GlobalProperties.linear_types:
+            mass_name = "length"
+        elif self.topo_type in GlobalProperties.surfacic_types:
+            mass_name = "area"
+        else:
+            mass_name = "volume"
+        centre = system.CentreOfMass()
+        matrix = system.MatrixOfInertia()
+        return {"topo_type": self.topo_type,
+                mass_name: system.Mass(),
+                "centre": np.array([centre.X(), centre.Y(), centre.Z()]),
+                "matrix_of_inertia": np.array([[matrix.Value(i, j) for j in range(1, 4)] for i in range(1, 4)]),
+                "principal_moments": np.array(system.PrincipalProperties().Moments()),
+                "error": error}
+
+
+def global_properties(shapes, eps=None):
+    r"""Global properties of many shapes
+
+    Parameters
+    ----------
+    shapes : iterable[OCC.TopoDS.TopoDS_Shape]
+    eps : float (optional)
+        Integration precision for surfacic and volumic types
+
+    Returns
+    -------
+    list[dict]
+        GlobalProperties.properties() of each shape
+
+    """
+    return [GlobalProperties(shape, eps).properties() for shape in shapes]
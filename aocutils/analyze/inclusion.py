@@ -7,15 +7,19 @@ Functions
 ---------
 point_in_boundingbox
 point_in_solid
+points_in_solid
 
 """
 
 import logging
 
+import numpy as np
 import OCC.BRepClass3d
+import OCC.gp
 import OCC.TopAbs
 
 import aocutils.analyze.bounds
+import aocutils.parallel
 import aocutils.types
 import aocutils.exceptions
 import aocutils.tolerance
@@ -26,7 +30,9 @@ logger = logging.getLogger(__name__)
 def point_in_boundingbox(shape, pnt, tolerance=aocutils.tolerance.OCCUTILS_DEFAULT_TOLERANCE):
     r"""Is pnt inside the bounding box of solid?
 
-    This is a much speedier test than checking the TopoDS_Solid
+    This is a much speedier test than checking the TopoDS_Solid.
+    The bounding box of the shape is cached (see aocutils.analyze.bounds) : repeated tests against the same
+    shape do not recompute it
 
     Parameters
     ----------
@@ -40,12 +46,22 @@ def point_in_boundingbox(shape, pnt, tolerance=aocutils.tolerance.OCCUTILS_DEFAU
         True if pnt lies in boundingbox, False otherwise
 
     """
-    return not aocutils.analyze.bounds.BoundingBox(shape, tolerance).bnd_box.IsOut(pnt)
+    return not aocutils.analyze.bounds.BoundingBox(shape, tolerance, use_cache=True).bnd_box.IsOut(pnt)
+
+
+def _check_3d(shape):
+    r"""Raise WrongTopologicalType if shape cannot contain points"""
+    if aocutils.types.topo_lut[shape.ShapeType()] not in ["compound", "compsolid", "solid", "shell"]:
+        msg = "Cannot evaluate in/out position of a point in a 2D or less shape"
+        logger.error(msg)
+        raise aocutils.exceptions.WrongTopologicalType(msg)
 
 
 def point_in_solid(shape, pnt, tolerance=aocutils.tolerance.OCCUTILS_DEFAULT_TOLERANCE):
     r"""Is pnt inside solid?
 
+    Points outside the (cached) bounding box of shape are rejected without running the classifier
+
     Parameters
     ----------
     solid : TopoDS_Solid
@@ -58,16 +74,83 @@ def point_in_solid(shape, pnt, tolerance=aocutils.tolerance.OCCUTILS_DEFAULT_TOL
         True if pnt lies in solid, False otherwise
 
     """
-    if aocutils.types.topo_lut[shape.ShapeType()] not in ["compound", "compsolid", "solid", "shell"]:
-        msg = "Cannot evaluate in/out position of a point in a 2D or less shape"
-        logger.error(msg)
-        raise aocutils.exceptions.WrongTopologicalType(msg)
+    _check_3d(shape)
+
+    # the bounding box is cached by point_in_boundingbox(), the test is then much cheaper than the classification
+    if not point_in_boundingbox(shape, pnt, tolerance):
+        return False
 
     _in_solid = OCC.BRepClass3d.BRepClass3d_SolidClassifier(shape, pnt, tolerance)
-    logger.info('State : %s' % str(_in_solid.State()))
+    logger.debug('State : %s' % str(_in_solid.State()))
     if _in_solid.State() == OCC.TopAbs.TopAbs_ON:
         return None
     if _in_solid.State() == OCC.TopAbs.TopAbs_OUT:
         return False
     if _in_solid.State() == OCC.TopAbs.TopAbs_IN:
         return True
+
+
+def _classify(shape, points, tolerance):
+    r"""States of points with respect to shape, using a single classifier
+
+    Parameters
+    ----------
+    shape : TopoDS_Shape
+    points : np.ndarray
+        (N, 3)
+    tolerance : float
+
+    Returns
+    -------
+    np.ndarray
+        (N,) int8 OCC.TopAbs.TopAbs_State values
+
+    """
+    classifier = OCC.BRepClass3d.BRepClass3d_SolidClassifier(shape)
+    states = np.empty(len(points), dtype=np.int8)
+    pnt = OCC.gp.gp_Pnt()
+    for i, (x, y, z) in enumerate(points):
+        pnt.SetCoord(x, y, z)
+        classifier.Perform(pnt, tolerance)
+        states[i] = classifier.State()
+    return states
+
+
+def points_in_solid(shape, points, tolerance=aocutils.tolerance.OCCUTILS_DEFAULT_TOLERANCE, processes=None):
+    r"""States of many points with respect to a solid
+
+    The points outside the bounding box of the shape are OUT without further computation.
+    The other ones are classified by a single BRepClass3d_SolidClassifier loaded with the shape.
+
+    Parameters
+    ----------
+    shape : TopoDS_Shape
+        compound, compsolid, solid or shell
+    points : array_like
+        (N, 3) points
+    tolerance : float
+    processes : int (optional)
+        If not None, the points are split across a pool of processes. The default is None
+
+    Returns
+    -------
+    np.ndarray
+        (N,) int8 OCC.TopAbs.TopAbs_State values (TopAbs_IN, TopAbs_OUT or TopAbs_ON)
+
+    """
+    _check_3d(shape)
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    states = np.full(len(points), OCC.TopAbs.TopAbs_OUT, dtype=np.int8)
+
+    bb = aocutils.analyze.bounds.BoundingBox(shape, tolerance, use_cache=True).as_tuple
+    in_box = np.all((points >= bb[:3]) & (points <= bb[3:]), axis=1)
+    candidates = points[in_box]
+    logger.debug("%i points out of %i in the bounding box" % (len(candidates), len(points)))
+    if len(candidates) == 0:
+        return states
+
+    if processes is None:
+        states[in_box] = _classify(shape, candidates, tolerance)
+    else:
+        states[in_box] = aocutils.parallel.pool_map_chunks(_classify, shape, candidates, (tolerance,), processes)
+    return states
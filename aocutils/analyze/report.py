@@ -0,0 +1,85 @@
+#!/usr/bin/python
+# coding: utf-8
+
+r"""analyze/report.py
+
+Summary
+-------
+Mass properties and bounds of all the solids of a shape, as NumPy arrays
+
+"""
+
+import logging
+
+import numpy as np
+import OCC.BRepGProp
+import OCC.GProp
+
+import aocutils.analyze.bounds
+import aocutils.analyze.global_
+import aocutils.parallel
+import aocutils.tolerance
+import aocutils.topology
+
+logger = logging.getLogger(__name__)
+
+
+def _solid_report(solid, eps, tolerance):
+    r"""Volume, area, centre, matrix of inertia and bounds of a solid
+
+    Returns
+    -------
+    tuple
+
+    """
+    properties = aocutils.analyze.global_.GlobalProperties(solid, eps).properties()
+    surface_system = OCC.GProp.GProp_GProps()
+    if eps is None:
+        OCC.BRepGProp.brepgprop_SurfaceProperties(solid, surface_system)
+    else:
+        OCC.BRepGProp.brepgprop_SurfaceProperties(solid, surface_system, eps)
+    bounds = aocutils.analyze.bounds.BoundingBox(solid, tolerance).as_tuple
+    return (properties["volume"], surface_system.Mass(), properties["centre"], properties["matrix_of_inertia"],
+            bounds)
+
+
+def solids_report(shape, processes=None, eps=None, tolerance=aocutils.tolerance.OCCUTILS_DEFAULT_TOLERANCE):
+    r"""Mass properties and bounds of each solid of shape
+
+    Parameters
+    ----------
+    shape : OCC.TopoDS.TopoDS_Shape
+    processes : int (optional)
+        If not None, the solids are processed in a pool of processes. The default is None
+    eps : float (optional)
+        Integration precision, see aocutils.analyze.global_.GlobalProperties
+    tolerance : float (optional)
+        Gap of the bounding boxes
+
+    Returns
+    -------
+    dict
+        Arrays with one row per solid, in Topo(shape).solids order :
+        volume (N,), area (N,), centre (N, 3), matrix_of_inertia (N, 3, 3),
+        bounds (N, 6) [x_min, y_min, z_min, x_max, y_max, z_max]
+
+    """
+    solids = aocutils.topology.Topo(shape, return_iter=False).solids
+    logger.debug("Report on %i solids" % len(solids))
+    if processes is None:
+        rows = [_solid_report(solid, eps, tolerance) for solid in solids]
+    else:
+        rows = aocutils.parallel.pool_map_shapes(_solid_report, solids, (eps, tolerance), processes)
+
+    report = {"volume": np.zeros(len(rows)),
+              "area": np.zeros(len(rows)),
+              "centre": np.zeros((len(rows), 3)),
+              "matrix_of_inertia": np.zeros((len(rows), 3, 3)),
+              "bounds": np.zeros((len(rows), 6))}
+    for i, (volume, area, centre, matrix_of_inertia, bounds) in enumerate(rows):
+        report["volume"][i] = volume
+        report["area"][i] = area
+        report["centre"][i] = centre
+        report["matrix_of_inertia"][i] = matrix_of_inertia
+        report["bounds"][i] = bounds
+    return report
@@ -0,0 +1,321 @@
+#!/usr/bin/python
+# coding: utf-8
+
+r"""Spatial index of shapes
+
+Summary
+-------
+Axis aligned bounding box tree over a set of shapes (typically the faces, edges or solids of a shape).
+The tree only provides candidates : the exact tests have to be performed on the candidates by the caller.
+
+Boxes are stored as (N, 6) arrays of [x_min, y_min, z_min, x_max, y_max, z_max]
+
+"""
+
+import heapq
+import logging
+
+import numpy as np
+import OCC.TopAbs
+
+import aocutils.analyze.bounds
+import aocutils.exceptions
+import aocutils.tolerance
+import aocutils.topology
+
+logger = logging.getLogger(__name__)
+
+
+def _boxes_overlap(boxes, box):
+    r"""Which of boxes overlap box (or boxes, row wise)"""
+    return np.all(boxes[..., :3] <= box[..., 3:], axis=-1) & np.all(boxes[..., 3:] >= box[..., :3], axis=-1)
+
+
+def _min_distances(boxes, point):
+    r"""Distances from point to the closest points of boxes (0 inside)"""
+    return np.linalg.norm(np.maximum(np.maximum(boxes[:, :3] - point, point - boxes[:, 3:]), 0.), axis=1)
+
+
+def _max_distances(boxes, point):
+    r"""Distances from point to the farthest corners of boxes"""
+    return np.linalg.norm(np.maximum(np.abs(boxes[:, :3] - point), np.abs(boxes[:, 3:] - point)), axis=1)
+
+
+class BoundingBoxTree(object):
+    r"""Axis aligned bounding box tree
+
+    Parameters
+    ----------
+    shapes : list[OCC.TopoDS.TopoDS_Shape]
+        The shapes to index
+    tolerance : float (optional)
+        Gap added to the bounding boxes
+    leaf_size : int (optional)
+        Maximum number of shapes in a leaf
+
+    """
+    def __init__(self, shapes, tolerance=aocutils.tolerance.OCCUTILS_DEFAULT_TOLERANCE, leaf_size=8):
+        self._shapes = list(shapes)
+        if len(self._shapes) == 0:
+            msg = "Cannot build a BoundingBoxTree without shapes"
+            logger.error(msg)
+            raise aocutils.exceptions.WrongTopologicalType(msg)
+        self._boxes = np.array([aocutils.analyze.bounds.BoundingBox(shape, tolerance).as_tuple
+                                for shape in self._shapes], dtype=np.float64)
+        self._leaf_size = max(1, int(leaf_size))
+        self._build()
+
+    @classmethod
+    def from_shape(cls, shape, topology_type=OCC.TopAbs.TopAbs_FACE,
+                   tolerance=aocutils.tolerance.OCCUTILS_DEFAULT_TOLERANCE, leaf_size=8):
+        r"""Index the sub-shapes of a shape
+
+        Parameters
+        ----------
+        shape : OCC.TopoDS.TopoDS_Shape
+        topology_type : OCC.TopAbs.TopAbs_ShapeEnum (optional)
+            Type of the indexed sub-shapes. The default is TopAbs_FACE
+        tolerance : float (optional)
+        leaf_size : int (optional)
+
+        Returns
+        -------
+        BoundingBoxTree
+
+        """
+        sub_shapes = aocutils.topology.Topo(shape, return_iter=False)._loop_topo(topology_type)
+        return cls(sub_shapes, tolerance, leaf_size)
+
+    def _build(self):
+        r"""Build the tree as flat arrays (median split on the longest axis of the boxes centres)"""
+        centres = (self._boxes[:, :3] + self._boxes[:, 3:]) / 2.
+        self._order = np.arange(len(self._boxes), dtype=np.int32)
+        node_boxes, children, ranges = list(), list(), list()
+
+        # nodes are numbered in creation order, children are set when the node is split
+        stack = [(0, len(self._boxes), None, 0)]
+        while stack:
+            start, end, parent, side = stack.pop()
+            node = len(node_boxes)
+            if parent is not None:
+                children[parent][side] = node
+            indices = self._order[start:end]
+            boxes = self._boxes[indices]
+            node_boxes.append(np.concatenate([boxes[:, :3].min(axis=0), boxes[:, 3:].max(axis=0)]))
+            children.append([-1, -1])
+            ranges.append((start, end))
+            if end - start <= self._leaf_size:
+                continue
+            node_centres = centres[indices]
+            axis = np.argmax(node_centres.max(axis=0) - node_centres.min(axis=0))
+            self._order[start:end] = indices[np.argsort(node_centres[:, axis], kind="mergesort")]
+            middle = (start + end) // 2
+            stack.append((middle, end, node, 1))
+            stack.append((start, middle, node, 0))
+
+        self._node_boxes = np.array(node_boxes)
+        self._children = np.array(children, dtype=np.int32)
+        self._ranges = np.array(ranges, dtype=np.int32)
+
+    @property
+    def shapes(self):
+        r"""Indexed shapes
+
+        Returns
+        -------
+        list[OCC.TopoDS.TopoDS_Shape]
+
+        """
+        return self._shapes
+
+    @property
+    def boxes(self):
+        r"""Bounding boxes of the indexed shapes
+
+        Returns
+        -------
+        np.ndarray
+            (N, 6) [x_min, y_min, z_min, x_max, y_max, z_max]
+
+        """
+        return self._boxes
+
+    def __len__(self):
+        return len(self._shapes)
+
+    def query_boxes(self, boxes):
+        r"""Indexed shapes whose bounding box overlaps each of boxes
+
+        Parameters
+        ----------
+        boxes : array_like
+            (M, 6) [x_min, y_min, z_min, x_max, y_max, z_max]
+
+        Returns
+        -------
+        query_indices : np.ndarray
+            (K,) int32 indices into boxes
+        shape_indices : np.ndarray
+            (K,) int32 indices into shapes, query_indices[k] overlaps shape_indices[k]
+
+        """
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 6)
+        query_indices, shape_indices = list(), list()
+        stack = [(0, np.arange(len(boxes), dtype=np.int32))]
+        while stack:
+            node, active = stack.pop()
+            active = active[_boxes_overlap(boxes[active], self._node_boxes[node])]
+            if len(active) == 0:
+                continue
+            left, right = self._children[node]
+            if left == -1:
+                start, end = self._ranges[node]
+                candidates = self._order[start:end]
+                overlap = _boxes_overlap(boxes[active][:, np.newaxis, :], self._boxes[candidates][np.newaxis, :, :])
+                rows, cols = np.nonzero(overlap)
+                query_indices.append(active[rows])
+                shape_indices.append(candidates[cols])
+            else:
+                stack.append((right, active))
+                stack.append((left, active))
+        if len(query_indices) == 0:
+            return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int32)
+        return (np.concatenate(query_indices).astype(np.int32, copy=False),
+                np.concatenate(shape_indices).astype(np.int32, copy=False))
+
+    def query_box(self, box):
+        r"""Indexed shapes whose bounding box overlaps box
+
+        Parameters
+        ----------
+        box : array_like
+            [x_min, y_min, z_min, x_max, y_max, z_max]
+
+        Returns
+        -------
+        np.ndarray
+            Sorted int32 indices into shapes
+
+        """
+        return np.sort(self.query_boxes(box)[1])
+
+    def query_points(self, points):
+        r"""Indexed shapes whose bounding box contains each of points
+
+        Parameters
+        ----------
+        points : array_like
+            (M, 3) points
+
+        Returns
+        -------
+        point_indices : np.ndarray
+            (K,) int32 indices into points
+        shape_indices : np.ndarray
+            (K,) int32 indices into shapes, points[point_indices[k]] is in the box of shape_indices[k]
+
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        return self.query_boxes(np.hstack([points, points]))
+
+    def query_ray(self, origin, direction, max_distance=np.inf):
+        r"""Indexed shapes whose bounding box is hit by a ray
+
+        Parameters
+        ----------
+        origin : array_like
+            (3,) origin of the ray
+        direction : array_like
+            (3,) direction of the ray, does not have to be normalized
+        max_distance : float (optional)
+            Length of the ray, in units of direction. The default is infinite
+
+        Returns
+        -------
+        shape_indices : np.ndarray
+            int32 indices into shapes, sorted by entry parameter
+        entry_parameters : np.ndarray
+            Ray parameter at which each box is entered (0 if the origin is inside the box)
+
+        """
+        origin = np.asarray(origin, dtype=np.float64)
+        direction = np.asarray(direction, dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inverse = 1. / direction
+
+        def slabs(boxes):
+            with np.errstate(invalid="ignore"):
+                t_1 = (boxes[:, :3] - origin) * inverse
+                t_2 = (boxes[:, 3:] - origin) * inverse
+            # a parallel ray either lies within the slab (nan -> no constraint) or misses it
+            t_1 = np.where(np.isnan(t_1), -np.inf, t_1)
+            t_2 = np.where(np.isnan(t_2), np.inf, t_2)
+            t_entry = np.maximum(np.minimum(t_1, t_2).max(axis=1), 0.)
+            t_exit = np.minimum(np.maximum(t_1, t_2).min(axis=1), max_distance)
+            return t_entry, t_entry <= t_exit
+
+        shape_indices, entry_parameters = list(), list()
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if not slabs(self._node_boxes[node][np.newaxis, :])[1][0]:
+                continue
+            left, right = self._children[node]
+            if left == -1:
+                start, end = self._ranges[node]
+                candidates = self._order[start:end]
+                t_entry, hit = slabs(self._boxes[candidates])
+                shape_indices.append(candidates[hit])
+                entry_parameters.append(t_entry[hit])
+            else:
+                stack.extend([right, left])
+        if len(shape_indices) == 0:
+            return np.zeros(0, dtype=np.int32), np.zeros(0)
+        shape_indices = np.concatenate(shape_indices)
+        entry_parameters = np.concatenate(entry_parameters)
+        order = np.argsort(entry_parameters, kind="mergesort")
+        return shape_indices[order].astype(np.int32, copy=False), entry_parameters[order]
+
+    def nearest_candidates(self, point):
+        r"""Indexed shapes that may be the closest to point
+
+        A shape is a candidate if the distance from point to its bounding box is not greater than the smallest
+        distance from point to the farthest corner of a bounding box
+
+        Parameters
+        ----------
+        point : array_like
+            (3,)
+
+        Returns
+        -------
+        shape_indices : np.ndarray
+            int32 indices into shapes, sorted by lower bound of the distance
+        lower_bounds : np.ndarray
+            Distances from point to the bounding boxes
+
+        """
+        point = np.asarray(point, dtype=np.float64).reshape(3)
+        upper_bound = np.inf
+        shape_indices, lower_bounds = list(), list()
+        heap = [(0., 0)]
+        while heap:
+            distance, node = heapq.heappop(heap)
+            if distance > upper_bound:
+                break
+            left, right = self._children[node]
+            if left == -1:
+                start, end = self._ranges[node]
+                candidates = self._order[start:end]
+                boxes = self._boxes[candidates]
+                upper_bound = min(upper_bound, _max_distances(boxes, point).min())
+                shape_indices.append(candidates)
+                lower_bounds.append(_min_distances(boxes, point))
+            else:
+                for child in (left, right):
+                    heapq.heappush(heap, (_min_distances(self._node_boxes[child][np.newaxis, :], point)[0], child))
+        shape_indices = np.concatenate(shape_indices)
+        lower_bounds = np.concatenate(lower_bounds)
+        keep = lower_bounds <= upper_bound
+        order = np.argsort(lower_bounds[keep], kind="mergesort")
+        return shape_indices[keep][order].astype(np.int32, copy=False), lower_bounds[keep][order]
@@ -10,6 +10,7 @@ BaseObject is inherited by Vertex, Edge, Face, Shell, Solid
 """
 
 import logging
+import functools
 
 import OCC.BRepBuilderAPI
 import OCC.BRepCheck
@@ -21,6 +22,7 @@ import OCC.TopoDS
 import aocutils.common
 import aocutils.types
 import aocutils.topology
+import aocutils.analyze.bounds
 import aocutils.analyze.distance
 import aocutils.display.display
 import aocutils.brep.vertex_make
@@ -30,6 +32,35 @@ import aocutils.mesh
 logger = logging.getLogger(__name__)
 
 
+def cached_property(func):
+    r"""Decorator for a BaseObject property that is computed once per instance
+
+    The value is stored in the instance _property_cache and recomputed only after the cache has been invalidated
+    (i.e. when the wrapped instance is replaced)
+
+    Parameters
+    ----------
+    func : function
+        Getter of the property
+
+    Returns
+    -------
+    property
+
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    def getter(self):
+        try:
+            return self._property_cache[name]
+        except KeyError:
+            value = func(self)
+            self._property_cache[name] = value
+            return value
+    return property(getter)
+
+
 class BaseObject(object):
     """Base class for all objects
 
@@ -44,12 +75,33 @@ class BaseObject(object):
         self.tolerance = tolerance
         self._is_meshed = False
         self._mesh_factor = None
+        self._mesh_options = None
+        # values of the properties decorated with cached_property
+        self._property_cache = dict()
 
     @property
     def wrapped_instance(self):
         r"""The instance wrapped by the BaseObject"""
         return self._wrapped_instance
 
+    def _invalidate_cache(self):
+        r"""Forget the values of the properties decorated with cached_property"""
+        self._property_cache.clear()
+
+    def _replace_wrapped_instance(self, new_instance):
+        r"""Replace the wrapped instance and invalidate everything that was derived from it
+
+        Parameters
+        ----------
+        new_instance : TopoDS_Shape or subclass
+
+        """
+        self._wrapped_instance = new_instance
+        self._invalidate_cache()
+        self._is_meshed = False
+        self._mesh_factor = None
+        self._mesh_options = None
+
     @property
     def is_meshed(self):
         r"""Flag for meshing status
@@ -74,22 +126,67 @@ class BaseObject(object):
         """
         return self._mesh_factor
 
-    def mesh(self, factor=4000.):
+    def mesh(self, factor=4000., use_min_dim=False, angular_deflection=0.5, is_relative=False, parallel=False,
+             processes=None):
         r"""Mesh the wrapped instance
 
         Parameters
         ----------
         factor : float
             Division factor of the bounding box max dimension
+        use_min_dim : bool (optional)
+            Use the bounding box min dimension instead of the max dimension
+        angular_deflection : float (optional)
+            Angular deflection in radians
+        is_relative : bool (optional)
+            Linear deflection relative to the size of each edge
+        parallel : bool (optional)
+            Mesh the faces in parallel threads
+        processes : int (optional)
+            Mesh the sub-shapes of a compound in a pool of processes
+
+        Returns
+        -------
+        TopoDS_Shape
+            The meshed wrapped instance
+
+        Notes
+        -----
+        See aocutils.mesh.mesh()
+
+        When a pool of processes is used, the meshed compound is a new shape : it replaces the wrapped instance
+        and the shape the object was built with is left unmeshed. Use the returned shape (or wrapped_instance)
+
+        The shape is meshed again if any of factor, use_min_dim, angular_deflection and is_relative changed
 
         """
-        if self.is_meshed is False or self.mesh_factor != factor:
+        options = (factor, use_min_dim, angular_deflection, is_relative)
+        if self.is_meshed is False or self._mesh_options != options:
             logger.info("Meshing with factor %s" % str(factor))
-            aocutils.mesh.mesh(self._wrapped_instance, factor=factor)
+            meshed = aocutils.mesh.mesh(self._wrapped_instance, factor=factor, use_min_dim=use_min_dim,
+                                        angular_deflection=angular_deflection, is_relative=is_relative,
+                                        parallel=parallel, processes=processes, bounding_box=self.bounding_box)
+            if meshed is not self._wrapped_instance:
+                bounding_box = self.bounding_box
+                self._replace_wrapped_instance(meshed)
+                self._property_cache["bounding_box"] = bounding_box
             self._is_meshed = True
             self._mesh_factor = factor
+            self._mesh_options = options
         else:
             logger.info("Already meshed !")
+        return self._wrapped_instance
+
+    @cached_property
+    def bounding_box(self):
+        r"""Bounding box of the wrapped instance
+
+        Returns
+        -------
+        aocutils.analyze.bounds.BoundingBox
+
+        """
+        return aocutils.analyze.bounds.BoundingBox(self._wrapped_instance, self.tolerance, use_cache=True)
 
     @property
     def tshape(self):
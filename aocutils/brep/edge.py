@@ -8,6 +8,7 @@ from __future__ import print_function
 import logging
 # import functools
 
+import numpy as np
 import OCC.BRepAdaptor
 import OCC.BRepBuilderAPI
 import OCC.GCPnts
@@ -24,15 +25,20 @@ import OCC.ShapeAnalysis
 import OCC.BRep
 import OCC.BRepIntCurveSurface
 import OCC.BRepCheck
+import OCC.Extrema
+import OCC.GeomAbs
+import OCC.TColStd
 
 import aocutils.analyze.distance
 import aocutils.brep.base
 import aocutils.brep.edge_make
 import aocutils.common
 import aocutils.brep.vertex
+import aocutils.collections
 import aocutils.types
 import aocutils.exceptions
 import aocutils.math_
+import aocutils.parallel
 import aocutils.operations.interpolate
 import aocutils.fixes
 import aocutils.tolerance
@@ -40,6 +46,124 @@ import aocutils.display.display
 
 logger = logging.getLogger(__name__)
 
+# initial number of segments of the arc length table in each knot span (or C1 interval) of a curve
+ARC_LENGTH_SUBDIVISIONS = 4
+# maximum number of bisections of an initial segment of the arc length table
+ARC_LENGTH_MAX_DEPTH = 12
+# fractions of the segments of the arc length table where the interpolation error is checked
+_CHECK_FRACTIONS = np.array([0.25, 0.5, 0.75])
+
+# discretization modes of Edge.discretize()
+DISCRETIZE_ABSCISSA = "abscissa"
+DISCRETIZE_DEFLECTION = "deflection"
+DISCRETIZE_TANGENTIAL = "tangential"
+
+
+def _hermite_lengths(parameters, lengths, speeds, us):
+    r"""Arc lengths at us, by cubic Hermite interpolation of an arc length table
+
+    Parameters
+    ----------
+    parameters, lengths, speeds : np.ndarray
+        Arc length table : increasing parameters, cumulated lengths and norms of the first derivative
+    us : np.ndarray
+        Parameters in [parameters[0], parameters[-1]]
+
+    Returns
+    -------
+    np.ndarray
+
+    """
+    i = np.clip(np.searchsorted(parameters, us, side="right") - 1, 0, len(parameters) - 2)
+    h = parameters[i + 1] - parameters[i]
+    t = (us - parameters[i]) / h
+    t2, t3 = t * t, t * t * t
+    return ((2 * t3 - 3 * t2 + 1) * lengths[i] + (t3 - 2 * t2 + t) * h * speeds[i] +
+            (3 * t2 - 2 * t3) * lengths[i + 1] + (t3 - t2) * h * speeds[i + 1])
+
+
+def _hermite_parameters(parameters, lengths, speeds, ss, n_iter=8):
+    r"""Parameters at the arc lengths ss, by Newton inversion of the cubic Hermite interpolation of an arc length table
+
+    Parameters
+    ----------
+    parameters, lengths, speeds : np.ndarray
+        Arc length table : increasing parameters, cumulated lengths and norms of the first derivative
+    ss : np.ndarray
+        Arc lengths in [0, lengths[-1]]
+    n_iter : int (optional)
+        Number of Newton iterations
+
+    Returns
+    -------
+    np.ndarray
+
+    """
+    i = np.clip(np.searchsorted(lengths, ss, side="right") - 1, 0, len(parameters) - 2)
+    h = parameters[i + 1] - parameters[i]
+    s_0, s_1, m_0, m_1 = lengths[i], lengths[i + 1], speeds[i] * h, speeds[i + 1] * h
+    delta = s_1 - s_0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(delta > 0., (ss - s_0) / delta, 0.)
+    for _ in range(n_iter):
+        t2, t3 = t * t, t * t * t
+        value = (2 * t3 - 3 * t2 + 1) * s_0 + (t3 - 2 * t2 + t) * m_0 + (3 * t2 - 2 * t3) * s_1 + (t3 - t2) * m_1
+        slope = (6 * t2 - 6 * t) * (s_0 - s_1) + (3 * t2 - 4 * t + 1) * m_0 + (3 * t2 - 2 * t) * m_1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = np.where(slope > 0., (value - ss) / slope, 0.)
+        t = np.clip(t - step, 0., 1.)
+    return parameters[i] + t * h
+
+
+def _refined_arc_length_table(breaks, segment_length, speed, tolerance, max_depth=ARC_LENGTH_MAX_DEPTH):
+    r"""Arc length table, refined until its cubic Hermite interpolation matches the integrated arc length
+
+    Parameters
+    ----------
+    breaks : np.ndarray
+        Increasing initial parameters of the table
+    segment_length : callable
+        segment_length(a, b) is the arc length between the parameters a and b
+    speed : callable
+        speed(u) is the norm of the first derivative at the parameter u
+    tolerance : float
+        Maximum difference between the interpolated and the integrated arc lengths, checked at a quarter,
+        half and three quarters of each segment
+    max_depth : int (optional)
+        Maximum number of bisections of an initial segment
+
+    Returns
+    -------
+    parameters, lengths, speeds : np.ndarray
+
+    """
+    breaks = breaks.tolist()
+    speeds_at_breaks = [speed(u) for u in breaks]
+    parameters, lengths, speeds = [breaks[0]], [0.], [speeds_at_breaks[0]]
+    # segments (a, b, length, speed at a, speed at b, depth), the leftmost one on top of the stack
+    stack = [(a, b, segment_length(a, b), speed_a, speed_b, 0)
+             for a, b, speed_a, speed_b in zip(breaks[:-1], breaks[1:], speeds_at_breaks[:-1], speeds_at_breaks[1:])]
+    stack.reverse()
+    while stack:
+        a, b, length, speed_a, speed_b, depth = stack.pop()
+        if depth < max_depth:
+            h = b - a
+            # integrated and cubic Hermite interpolated arc lengths at a quarter, half and three quarters of the segment
+            partial_lengths = [segment_length(a, a + t * h) for t in _CHECK_FRACTIONS]
+            interpolated = ((3. - 2. * _CHECK_FRACTIONS) * _CHECK_FRACTIONS ** 2 * length +
+                            _CHECK_FRACTIONS * (1. - _CHECK_FRACTIONS) ** 2 * h * speed_a -
+                            _CHECK_FRACTIONS ** 2 * (1. - _CHECK_FRACTIONS) * h * speed_b)
+            if np.abs(partial_lengths - interpolated).max() > tolerance:
+                middle = a + h / 2.
+                speed_middle = speed(middle)
+                stack.append((middle, b, length - partial_lengths[1], speed_middle, speed_b, depth + 1))
+                stack.append((a, middle, partial_lengths[1], speed_a, speed_middle, depth + 1))
+                continue
+        parameters.append(b)
+        lengths.append(lengths[-1] + length)
+        speeds.append(speed_b)
+    return np.array(parameters), np.array(lengths), np.array(speeds)
+
 
 class Edge(aocutils.brep.base.BaseObject):
     r"""Wrapper for OCC.TopoDS.TopoDS_Edge
@@ -58,14 +182,11 @@ class Edge(aocutils.brep.base.BaseObject):
 
         aocutils.brep.base.BaseObject.__init__(self, topods_edge, name='edge')
 
-        self._adaptor = None
-        self._brep_local_props = None
-
     @property
     def topods_edge(self):
         return self._wrapped_instance
 
-    @property
+    @aocutils.brep.base.cached_property
     def adaptor(self):
         r"""Adaptor
 
@@ -74,9 +195,7 @@ class Edge(aocutils.brep.base.BaseObject):
         OCC.BRepAdaptor.BRepAdaptor_Curve
 
         """
-        if self._adaptor is None:
-            self._adaptor = OCC.BRepAdaptor.BRepAdaptor_Curve(self._wrapped_instance)
-        return self._adaptor
+        return OCC.BRepAdaptor.BRepAdaptor_Curve(self._wrapped_instance)
 
     # def to_adaptor_3d(self):
     #     r"""Abstract curve like geom_type into an adaptor3d
@@ -213,7 +332,7 @@ class Edge(aocutils.brep.base.BaseObject):
     #     """
     #     return OCC.BRepAdaptor.BRepAdaptor_Curve(self._wrapped_instance)
 
-    @property
+    @aocutils.brep.base.cached_property
     def curve_handle(self):
         r"""Curve handle
 
@@ -240,7 +359,7 @@ class Edge(aocutils.brep.base.BaseObject):
     #     brep_adaptor_hcurve.ChangeCurve().Initialize(self._wrapped_instance)
     #     return brep_adaptor_hcurve
 
-    @property
+    @aocutils.brep.base.cached_property
     def adaptor_handle(self):
         r"""Adaptor handle
 
@@ -250,7 +369,7 @@ class Edge(aocutils.brep.base.BaseObject):
         """
         return OCC.BRepAdaptor.BRepAdaptor_HCurve(self.adaptor)
 
-    @property
+    @aocutils.brep.base.cached_property
     def geom_curve_handle(self):
         r"""Geom curve handle
 
@@ -303,7 +422,7 @@ class Edge(aocutils.brep.base.BaseObject):
         """
         return OCC.GeomLProp.GeomLProp_CurveTool()
 
-    @property
+    @aocutils.brep.base.cached_property
     def brep_local_props(self):
         r"""Local properties of the curve
 
@@ -312,11 +431,9 @@ class Edge(aocutils.brep.base.BaseObject):
         OCC.BRepLProp.BRepLProp_CLProps
 
         """
-        if self._brep_local_props is None:
-            self._brep_local_props = OCC.BRepLProp.BRepLProp_CLProps(self.adaptor, 2, self.tolerance)
-        return self._brep_local_props
+        return OCC.BRepLProp.BRepLProp_CLProps(self.adaptor, 2, self.tolerance)
 
-    @property
+    @aocutils.brep.base.cached_property
     def domain(self):
         r"""u,v domain of the curve
 
@@ -339,7 +456,9 @@ class Edge(aocutils.brep.base.BaseObject):
     def length(self, lbound=None, ubound=None, tolerance=aocutils.tolerance.OCCUTILS_DEFAULT_TOLERANCE):
         r"""Curve length
 
-        If either lbound | ubound | both are given, than the length of the curve will be measured over that interval
+        If either lbound | ubound | both are given, than the length of the curve will be measured over that interval.
+        The total length is read from the arc length table of the edge if it has already been built
+        (e.g. by parameters_at_lengths()) and a finer tolerance is not requested
 
         Parameters
         ----------
@@ -364,6 +483,9 @@ class Edge(aocutils.brep.base.BaseObject):
             logger.error(msg)
             raise aocutils.exceptions.ParameterOutOfDomainException(msg)
 
+        if lbound is None and ubound is None and tolerance >= self.tolerance and \
+                "_arc_length_table" in self._property_cache:
+            return float(self._arc_length_table[1][-1])
         lbound = _min if lbound is None else lbound
         ubound = _max if ubound is None else ubound
         return OCC.GCPnts.GCPnts_AbscissaPoint().Length(self.adaptor, lbound, ubound, tolerance)
@@ -428,6 +550,11 @@ class Edge(aocutils.brep.base.BaseObject):
         -------
         Quantity_Parameter, gp_Pnt
 
+        Notes
+        -----
+        The projection is made on the whole underlying curve. Use projector() for a projection restricted to
+        the domain of the edge
+
         """
         if isinstance(pnt_or_vertex, OCC.TopoDS.TopoDS_Vertex):
             pnt_or_vertex = aocutils.brep.vertex.Vertex.to_pnt(pnt_or_vertex)
@@ -435,14 +562,33 @@ class Edge(aocutils.brep.base.BaseObject):
         project_point_on_curve = OCC.GeomAPI.GeomAPI_ProjectPointOnCurve(pnt_or_vertex, self.curve_handle)
         return project_point_on_curve.LowerDistanceParameter(), project_point_on_curve.NearestPoint()
 
+    @aocutils.brep.base.cached_property
+    def _curve_projector(self):
+        r"""CurveProjector of the edge"""
+        return CurveProjector(self._wrapped_instance)
+
+    def projector(self):
+        r"""Projector of points on the edge, loaded once per edge
+
+        Returns
+        -------
+        CurveProjector
+
+        """
+        return self._curve_projector
+
     def distance_on_curve(self, distance, close_parameter, estimate_parameter):
         r"""Returns the parameter if there is a parameter on the curve with a distance length from u
 
+        The parameter is found in the arc length table of the edge (see parameters_at_lengths())
+
         Parameters
         ----------
-        distance
-        close_parameter
-        estimate_parameter
+        distance : float
+            Signed arc length from close_parameter
+        close_parameter : float
+        estimate_parameter : float
+            Not needed by the arc length table lookup, kept for compatibility
 
         Returns
         -------
@@ -451,13 +597,11 @@ class Edge(aocutils.brep.base.BaseObject):
 
         Raises
         ------
-        OutOfBoundary
+        ParameterOutOfDomainException
             if no such parameter exists
         """
-        abscissa_point = OCC.GCPnts.GCPnts_AbscissaPoint(self.adaptor, distance, close_parameter, estimate_parameter,
-                                                         1e-5)
-        with aocutils.common.AssertIsDone(abscissa_point, 'could not compute distance on curve'):
-            return abscissa_point.Parameter()
+        start_length = self.lengths_at_parameters([close_parameter])[0]
+        return float(self.parameters_at_lengths([start_length + distance])[0])
 
     @property
     def midpoint(self):
@@ -819,14 +963,380 @@ class Edge(aocutils.brep.base.BaseObject):
         except KeyError:
             raise AssertionError('n of derivative is one of [1,2,3]')
 
-    def points_from_tangential_deflection(self):
-        r"""
+    # ======================================================================
+    # Batch evaluation : NumPy arrays of parameters in, NumPy arrays out
+    # ======================================================================
+
+    def _check_u_array_in_domain(self, us):
+        r"""Check that all the parameters of an array lie in the domain
+
+        Parameters
+        ----------
+        us : array_like
+            1D array of parameters
+
+        Returns
+        -------
+        numpy.ndarray
+            The parameters as a 1D float64 array
+
+        """
+        us = np.asarray(us, dtype=np.float64).ravel()
+        _min, _max = self.domain
+        if us.size > 0 and (us.min() < _min or us.max() > _max):
+            msg = "Parameters are outside of domain ranging from %s to %s" % (str(_min), str(_max))
+            logger.error(msg)
+            raise aocutils.exceptions.ParameterOutOfDomainException(msg)
+        return us
+
+    def parameters_to_points(self, us):
+        r"""Coordinates at the parameters us
+
+        Parameters
+        ----------
+        us : array_like
+            1D array of N parameters
+
+        Returns
+        -------
+        numpy.ndarray
+            (N, 3) float64 array of points
+
+        """
+        us = self._check_u_array_in_domain(us)
+        points = np.empty((us.size, 3), dtype=np.float64)
+        adaptor = self.adaptor
+        pnt = OCC.gp.gp_Pnt()
+        for i, u in enumerate(us.tolist()):
+            adaptor.D0(u, pnt)
+            points[i] = pnt.X(), pnt.Y(), pnt.Z()
+        return points
+
+    def tangents(self, us):
+        r"""Unit tangents at the parameters us
+
+        Parameters
+        ----------
+        us : array_like
+            1D array of N parameters
 
         Returns
         -------
+        numpy.ndarray
+            (N, 3) float64 array, rows are NaN where the tangent is not defined
 
         """
-        raise NotImplementedError
+        us = self._check_u_array_in_domain(us)
+        tangents = np.full((us.size, 3), np.nan, dtype=np.float64)
+        props = self.brep_local_props
+        ddd = OCC.gp.gp_Dir()
+        for i, u in enumerate(us.tolist()):
+            props.SetParameter(u)
+            if props.IsTangentDefined():
+                props.Tangent(ddd)
+                tangents[i] = ddd.X(), ddd.Y(), ddd.Z()
+        return tangents
+
+    def normals(self, us):
+        r"""Unit (main) normals at the parameters us
+
+        Parameters
+        ----------
+        us : array_like
+            1D array of N parameters
+
+        Returns
+        -------
+        numpy.ndarray
+            (N, 3) float64 array, rows are NaN where the normal is not defined (e.g. on straight portions)
+
+        """
+        us = self._check_u_array_in_domain(us)
+        normals = np.full((us.size, 3), np.nan, dtype=np.float64)
+        props = self.brep_local_props
+        a_dir = OCC.gp.gp_Dir()
+        for i, u in enumerate(us.tolist()):
+            props.SetParameter(u)
+            try:
+                props.Normal(a_dir)
+            except RuntimeError:
+                continue
+            normals[i] = a_dir.X(), a_dir.Y(), a_dir.Z()
+        return normals
+
+    def curvatures(self, us):
+        r"""Curvatures at the parameters us
+
+        Parameters
+        ----------
+        us : array_like
+            1D array of N parameters
+
+        Returns
+        -------
+        numpy.ndarray
+            (N,) float64 array
+
+        """
+        us = self._check_u_array_in_domain(us)
+        curvatures = np.empty(us.size, dtype=np.float64)
+        props = self.brep_local_props
+        for i, u in enumerate(us.tolist()):
+            props.SetParameter(u)
+            curvatures[i] = props.Curvature()
+        return curvatures
+
+    def derivatives(self, us, n):
+        r"""n-th derivatives at the parameters us
+
+        Parameters
+        ----------
+        us : array_like
+            1D array of N parameters
+        n : int
+            1, 2 or 3
+
+        Returns
+        -------
+        numpy.ndarray
+            (N, 3) float64 array
+
+        """
+        if n not in [1, 2, 3]:
+            raise AssertionError('n of derivative is one of [1,2,3]')
+        us = self._check_u_array_in_domain(us)
+        derivatives = np.empty((us.size, 3), dtype=np.float64)
+        if n < 3:
+            props = self.brep_local_props
+        else:
+            # brep_local_props is built for derivatives up to order 2
+            props = OCC.BRepLProp.BRepLProp_CLProps(self.adaptor, 3, self.tolerance)
+        derivative = {1: props.D1, 2: props.D2, 3: props.D3}[n]
+        for i, u in enumerate(us.tolist()):
+            props.SetParameter(u)
+            vec = derivative()
+            derivatives[i] = vec.X(), vec.Y(), vec.Z()
+        return derivatives
+
+    # ======================================================================
+    # Arc length parameterization : computed once per edge, then interpolated
+    # ======================================================================
+
+    @aocutils.brep.base.cached_property
+    def _arc_length_table(self):
+        r"""Parameters, cumulated arc lengths and speeds (norms of the first derivative) sampling the edge
+
+        Each knot span (B-splines) or C1 interval (other curves) is split in ARC_LENGTH_SUBDIVISIONS segments
+        (a single segment for lines), then the segments are bisected until the interpolated arc lengths are within
+        self.tolerance of the ones integrated by GCPnts_AbscissaPoint
+
+        Returns
+        -------
+        tuple[np.ndarray]
+
+        """
+        adaptor = self.adaptor
+        first, last = self.domain
+        if adaptor.GetType() == OCC.GeomAbs.GeomAbs_Line:
+            breaks = np.array([first, last])
+        else:
+            n_intervals = adaptor.NbIntervals(OCC.GeomAbs.GeomAbs_C1)
+            intervals = OCC.TColStd.TColStd_Array1OfReal(1, n_intervals + 1)
+            adaptor.Intervals(intervals, OCC.GeomAbs.GeomAbs_C1)
+            breaks = aocutils.collections.tcolstd_array1_of_real_to_array(intervals)
+            if adaptor.GetType() == OCC.GeomAbs.GeomAbs_BSplineCurve:
+                bspline = adaptor.BSpline().GetObject()
+                knots = OCC.TColStd.TColStd_Array1OfReal(1, bspline.NbKnots())
+                bspline.Knots(knots)
+                breaks = np.concatenate([breaks, aocutils.collections.tcolstd_array1_of_real_to_array(knots)])
+            breaks = np.unique(np.concatenate([[first, last], breaks[(breaks > first) & (breaks < last)]]))
+            breaks = np.concatenate([np.linspace(a, b, ARC_LENGTH_SUBDIVISIONS + 1)[:-1]
+                                     for a, b in zip(breaks[:-1], breaks[1:])] + [breaks[-1:]])
+
+        props = self.brep_local_props
+
+        def speed(u):
+            props.SetParameter(u)
+            return props.D1().Magnitude()
+
+        def segment_length(a, b):
+            return OCC.GCPnts.GCPnts_AbscissaPoint().Length(adaptor, a, b, self.tolerance)
+
+        return _refined_arc_length_table(breaks, segment_length, speed, self.tolerance)
+
+    def lengths_at_parameters(self, us):
+        r"""Arc lengths from the start of the edge at the parameters us
+
+        Parameters
+        ----------
+        us : array_like
+            1D array of N parameters
+
+        Returns
+        -------
+        numpy.ndarray
+            (N,) float64 array
+
+        """
+        us = self._check_u_array_in_domain(us)
+        return _hermite_lengths(*(self._arc_length_table + (us,)))
+
+    def parameters_at_lengths(self, lengths):
+        r"""Parameters at the arc lengths from the start of the edge
+
+        Parameters
+        ----------
+        lengths : array_like
+            1D array of N arc lengths, in [0, length()]
+
+        Returns
+        -------
+        numpy.ndarray
+            (N,) float64 array
+
+        """
+        lengths = np.asarray(lengths, dtype=np.float64).ravel()
+        total_length = self._arc_length_table[1][-1]
+        if lengths.size > 0 and (lengths.min() < 0. or lengths.max() > total_length):
+            msg = "Arc lengths are outside of the range from 0 to %s" % str(total_length)
+            logger.error(msg)
+            raise aocutils.exceptions.ParameterOutOfDomainException(msg)
+        return _hermite_parameters(*(self._arc_length_table + (lengths,)))
+
+    def uniform_parameters(self, n_pts, lbound=None, ubound=None):
+        r"""Parameters of n_pts points evenly spaced along the edge
+
+        The spacing is interpolated from the arc length table, i.e. exact within self.tolerance.
+        divide_by_number_of_points() integrates it with GCPnts_UniformAbscissa instead
+
+        Parameters
+        ----------
+        n_pts : int
+            At least 2
+        lbound : float (optional)
+            The default is the start of the domain
+        ubound : float (optional)
+            The default is the end of the domain
+
+        Returns
+        -------
+        numpy.ndarray
+            (n_pts,) float64 array
+
+        """
+        _min, _max = self.domain
+        bounds = self.lengths_at_parameters([_min if lbound is None else lbound, _max if ubound is None else ubound])
+        parameters = self.parameters_at_lengths(np.linspace(bounds[0], bounds[1], max(2, n_pts)))
+        # the ends are exact
+        parameters[[0, -1]] = _min if lbound is None else lbound, _max if ubound is None else ubound
+        return parameters
+
+    def uniform_points(self, n_pts, lbound=None, ubound=None):
+        r"""n_pts points evenly spaced along the edge
+
+        Parameters
+        ----------
+        n_pts : int
+            At least 2
+        lbound : float (optional)
+        ubound : float (optional)
+
+        Returns
+        -------
+        parameters : numpy.ndarray
+            (n_pts,) float64 array
+        points : numpy.ndarray
+            (n_pts, 3) float64 array
+
+        """
+        parameters = self.uniform_parameters(n_pts, lbound, ubound)
+        return parameters, self.parameters_to_points(parameters)
+
+    def discretization_parameters(self, mode=DISCRETIZE_DEFLECTION, deflection=1e-2, angular_deflection=0.1,
+                                  n_pts=None, distance=None):
+        r"""Parameters of a discretization of the edge, in increasing order
+
+        Parameters
+        ----------
+        mode : str (optional)
+            DISCRETIZE_ABSCISSA (GCPnts_UniformAbscissa, points evenly spaced along the edge),
+            DISCRETIZE_DEFLECTION (GCPnts_UniformDeflection, the default) or
+            DISCRETIZE_TANGENTIAL (GCPnts_TangentialDeflection)
+        deflection : float (optional)
+            Maximum distance between the edge and the polyline (deflection and tangential modes)
+        angular_deflection : float (optional)
+            Maximum angle (radians) between the tangents at consecutive points (tangential mode)
+        n_pts : int (optional)
+            Number of points (abscissa mode, exclusive with distance)
+        distance : float (optional)
+            Distance along the edge between consecutive points (abscissa mode, exclusive with n_pts)
+
+        Returns
+        -------
+        numpy.ndarray
+            (N,) float64 array
+
+        """
+        first, last = self.domain
+        if mode == DISCRETIZE_ABSCISSA:
+            if (n_pts is None) == (distance is None):
+                msg = "The abscissa mode needs either n_pts or distance"
+                logger.error(msg)
+                raise ValueError(msg)
+            if n_pts is not None:
+                algo = OCC.GCPnts.GCPnts_UniformAbscissa(self.adaptor, max(2, int(n_pts)), first, last)
+            else:
+                algo = OCC.GCPnts.GCPnts_UniformAbscissa(self.adaptor, float(distance), first, last)
+            if not algo.IsDone():
+                msg = 'GCPnts_UniformAbscissa is not done'
+                logger.error(msg)
+                raise aocutils.exceptions.UniformAbscissaException(msg)
+        elif mode == DISCRETIZE_DEFLECTION:
+            algo = OCC.GCPnts.GCPnts_UniformDeflection(self.adaptor, deflection, first, last)
+            if not algo.IsDone():
+                msg = 'GCPnts_UniformDeflection is not done'
+                logger.error(msg)
+                raise aocutils.exceptions.DiscretizationException(msg)
+        elif mode == DISCRETIZE_TANGENTIAL:
+            algo = OCC.GCPnts.GCPnts_TangentialDeflection(self.adaptor, first, last, angular_deflection, deflection)
+        else:
+            msg = "Unknown discretization mode : %s" % str(mode)
+            logger.error(msg)
+            raise ValueError(msg)
+        return np.array([algo.Parameter(i) for i in range(1, algo.NbPoints() + 1)], dtype=np.float64)
+
+    def discretize(self, mode=DISCRETIZE_DEFLECTION, deflection=1e-2, angular_deflection=0.1, n_pts=None,
+                   distance=None):
+        r"""Polyline approximating the edge, in increasing parameter order
+
+        See discretization_parameters() for the parameters
+
+        Returns
+        -------
+        numpy.ndarray
+            (N, 3) float64 array of points
+
+        """
+        return self.parameters_to_points(self.discretization_parameters(mode, deflection, angular_deflection,
+                                                                        n_pts, distance))
+
+    def points_from_tangential_deflection(self, angular_deflection=0.1, deflection=1e-2):
+        r"""Points of the tangential deflection discretization of the edge
+
+        Parameters
+        ----------
+        angular_deflection : float (optional)
+            Maximum angle (radians) between the tangents at consecutive points
+        deflection : float (optional)
+            Maximum distance between the edge and the polyline
+
+        Returns
+        -------
+        numpy.ndarray
+            (N, 3) float64 array of points
+
+        """
+        return self.discretize(DISCRETIZE_TANGENTIAL, deflection, angular_deflection)
 
     def make_offset(self, offset, vec):
         r"""Offset curve
@@ -864,3 +1374,99 @@ class Edge(aocutils.brep.base.BaseObject):
 
     def __ne__(self, other):
         return not self.__eq__(other)
+
+
+def _project_on_edge(shape, points, tolerance):
+    r"""Project points on an edge given as a TopoDS_Shape (function of the process pool mode of CurveProjector)"""
+    return CurveProjector(OCC.TopoDS.topods_Edge(shape), tolerance).project(points)
+
+
+class CurveProjector(object):
+    r"""Projection of points on an edge, with a single Extrema_ExtPC loaded with the edge adaptor
+
+    The projections are restricted to the domain of the edge : if no orthogonal projection is closer,
+    the closest end of the edge is returned
+
+    Parameters
+    ----------
+    topods_edge : OCC.TopoDS.TopoDS_Edge
+    tolerance : float (optional)
+        Parametric tolerance of the extrema search
+
+    """
+    def __init__(self, topods_edge, tolerance=aocutils.tolerance.OCCUTILS_DEFAULT_TOLERANCE):
+        self._topods_edge = topods_edge
+        self._tolerance = tolerance
+        self._adaptor = OCC.BRepAdaptor.BRepAdaptor_Curve(topods_edge)
+        self._first, self._last = self._adaptor.FirstParameter(), self._adaptor.LastParameter()
+        self._ends = np.array([self._adaptor.Value(self._first).Coord(), self._adaptor.Value(self._last).Coord()])
+        self._extrema = OCC.Extrema.Extrema_ExtPC()
+        self._extrema.Initialize(self._adaptor, self._first, self._last, tolerance)
+
+    def project_point(self, pnt):
+        r"""Parameter of the projection of a point
+
+        Parameters
+        ----------
+        pnt : OCC.gp.gp_Pnt
+
+        Returns
+        -------
+        float
+
+        """
+        return float(self.project(np.array([pnt.Coord()]))[0][0])
+
+    def _project(self, points):
+        r"""Project points with the Extrema_ExtPC of the projector"""
+        parameters = np.empty(len(points))
+        feet = np.empty((len(points), 3))
+        square_distances = np.full(len(points), np.inf)
+        pnt = OCC.gp.gp_Pnt()
+        for i, (x, y, z) in enumerate(points.tolist()):
+            pnt.SetCoord(x, y, z)
+            self._extrema.Perform(pnt)
+            if not self._extrema.IsDone():
+                continue
+            for n in range(1, self._extrema.NbExt() + 1):
+                square_distance = self._extrema.SquareDistance(n)
+                if square_distance < square_distances[i]:
+                    square_distances[i] = square_distance
+                    extremum = self._extrema.Point(n)
+                    parameters[i] = extremum.Parameter()
+                    feet[i] = extremum.Value().Coord()
+
+        # the closest point may be an end of the edge, which is not an orthogonal projection
+        for parameter, end in zip((self._first, self._last), self._ends):
+            end_square_distances = np.sum((points - end) ** 2, axis=1)
+            closer = end_square_distances < square_distances
+            parameters[closer] = parameter
+            feet[closer] = end
+            square_distances[closer] = end_square_distances[closer]
+        return parameters, feet, np.sqrt(square_distances)
+
+    def project(self, points, processes=None):
+        r"""Project many points
+
+        Parameters
+        ----------
+        points : array_like
+            (N, 3)
+        processes : int (optional)
+            If not None, the points are split across a pool of processes. The default is None
+
+        Returns
+        -------
+        parameters : np.ndarray
+            (N,) parameters of the projections on the edge
+        feet : np.ndarray
+            (N, 3) projected points
+        distances : np.ndarray
+            (N,) distances from points to their projections
+
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        if processes is None or len(points) == 0:
+            return self._project(points)
+        return aocutils.parallel.pool_map_chunks(_project_on_edge, self._topods_edge, points, (self._tolerance,),
+                                                 processes)
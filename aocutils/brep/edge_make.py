@@ -9,6 +9,7 @@ from __future__ import print_function
 import logging
 import functools
 
+import numpy as np
 import OCC.BRepAdaptor
 import OCC.BRepBuilderAPI
 import OCC.GCPnts
@@ -21,7 +22,6 @@ import OCC.BRepLProp
 import OCC.GeomLib
 import OCC.GCPnts
 import OCC.GeomAPI
-import OCC.ShapeAnalysis
 import OCC.BRep
 import OCC.BRepIntCurveSurface
 
@@ -111,7 +111,7 @@ def line(pnt1, pnt2):
 
 
 def geodesic_path(pnt_a, pnt_b, aoc_face, n_segments=20, _tolerance=0.1, n_iter=20):
-    r"""
+    r"""Approximate geodesic between 2 points on a face
 
     Parameters
     ----------
@@ -133,50 +133,70 @@ def geodesic_path(pnt_a, pnt_b, aoc_face, n_segments=20, _tolerance=0.1, n_iter=
     TopoDS_Edge
 
     """
-    uv_a, srf_pnt_a = aoc_face.project_vertex(pnt_a)
-    uv_b, srf_pnt_b = aoc_face.project_vertex(pnt_b)
+    return geodesic_paths([pnt_a], [pnt_b], aoc_face, n_segments, _tolerance, n_iter)[0]
 
-    path = []
-    for i in range(n_segments):
-        t = i / n_segments
-        u = uv_a[0] + t*(uv_b[0] - uv_a[0])
-        v = uv_a[1] + t*(uv_b[1] - uv_a[1])
-        path.append(aoc_face.parameter_to_point(u, v))
 
-    def project_pnts(x):
-        r"""Project points
+def geodesic_paths(pnts_a, pnts_b, aoc_face, n_segments=20, _tolerance=0.1, n_iter=20):
+    r"""Approximate geodesics between many pairs of points on the same face
 
-        Parameters
-        ----------
-        x
+    The paths start as straight lines in the (u, v) space of the face, crossing the seam of a periodic surface
+    when it is shorter. At each iteration, the polylines are smoothed in 3D, then their inner points are projected
+    back on the surface, starting from their previous (u, v) parameters. A path has converged when no point moved
+    by more than _tolerance during an iteration.
 
-        Returns
-        -------
-
-        """
-        return [aoc_face.project_vertex(j)[1] for j in x]
-
-    def poly_length(x):
-        r"""Poly length
-
-        Parameters
-        ----------
-        x
-
-        Returns
-        -------
-
-        """
-        return sum([x[j].Distance(x[j + 1]) for j in range(len(x) - 1)]) / len(x)
+    Parameters
+    ----------
+    pnts_a : list[OCC.gp.gp_Pnt]
+        points to start from
+    pnts_b : list[OCC.gp.gp_Pnt]
+        points to move towards
+    aoc_face
+        oacutils.brep.face.Face on which the points lie
+    n_segments : int
+        the number of segments each geodesic is built from
+    _tolerance : float
+        maximum displacement of the points of a converged path during an iteration
+    n_iter : int
+        maximum number of iterations
 
-    length = poly_length(path)
+    Returns
+    -------
+    list[TopoDS_Edge]
 
-    n = 0
-    while True:
-        path = aocutils.math_.smooth_pnts(path)
-        path = project_pnts(path)
-        newlength = poly_length(path)
-        if abs(newlength-length) < _tolerance or n == n_iter:
-            crv = aocutils.operations.interpolate.points_to_bspline(path)
-            return edge(crv)
-        n += 1
+    """
+    surface = aoc_face.surface
+    projector = aoc_face.projector()
+    uv_a = np.array([projector.project_point(pnt) for pnt in pnts_a]).reshape(-1, 2)
+    uv_b = np.array([projector.project_point(pnt) for pnt in pnts_b]).reshape(-1, 2)
+
+    # on a periodic surface, shift the end parameters by whole periods so that the straight lines do not go
+    # the long way round across the seam
+    periods = (aoc_face.adaptor.UPeriod() if aoc_face.is_u_periodic else None,
+               aoc_face.adaptor.VPeriod() if aoc_face.is_v_periodic else None)
+    for i, period in enumerate(periods):
+        if period is not None:
+            uv_b[:, i] -= period * np.round((uv_b[:, i] - uv_a[:, i]) / period)
+
+    # straight lines in (u, v) space, (paths, n_segments + 1, 2)
+    t = np.linspace(0., 1., n_segments + 1)[np.newaxis, :, np.newaxis]
+    uvs = uv_a[:, np.newaxis, :] + t * (uv_b - uv_a)[:, np.newaxis, :]
+    points = np.empty(uvs.shape[:2] + (3,))
+    pnt = OCC.gp.gp_Pnt()
+    for k, i in np.ndindex(*uvs.shape[:2]):
+        surface.D0(uvs[k, i, 0], uvs[k, i, 1], pnt)
+        points[k, i] = pnt.Coord()
+
+    active = np.ones(len(uvs), dtype=bool)
+    for n in range(n_iter):
+        smoothed = aocutils.math_.smooth_array(points[active])
+        for k, smoothed_path in zip(np.nonzero(active)[0], smoothed):
+            new_points = points[k].copy()
+            uvs[k, 1:-1], new_points[1:-1] = projector.project(smoothed_path[1:-1], initial_uv=uvs[k, 1:-1])[:2]
+            if np.linalg.norm(new_points - points[k], axis=1).max() < _tolerance:
+                active[k] = False
+            points[k] = new_points
+        if not active.any():
+            logger.debug("Geodesics converged in %i iterations" % (n + 1))
+            break
+
+    return [edge(aocutils.operations.interpolate.points_to_bspline(path)) for path in points]
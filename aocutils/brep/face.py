@@ -6,6 +6,7 @@ r"""face.py module of occutils
 import logging
 # import functools
 
+import numpy as np
 import OCC.BRepBuilderAPI
 import OCC.BRep
 import OCC.BRepTopAdaptor
@@ -57,11 +58,6 @@ class Face(aocutils.brep.base.BaseObject):
 
         aocutils.brep.base.BaseObject.__init__(self, topods_face, 'face')
 
-        self._surface_handle = None
-        self._adaptor = None
-        self._adaptor_handle = None
-        self._classify_uv = None
-
     @property
     def topods_face(self):
         return self._wrapped_instance
@@ -194,7 +190,7 @@ class Face(aocutils.brep.base.BaseObject):
         """
         return self._continuities()[self.adaptor.VContinuity()]
 
-    @property
+    @aocutils.brep.base.cached_property
     def domain(self):
         r"""The u,v domain of the curve
 
@@ -268,7 +264,7 @@ class Face(aocutils.brep.base.BaseObject):
         """
         return self.surface_handle.GetObject()
 
-    @property
+    @aocutils.brep.base.cached_property
     def surface_handle(self):
         r"""Surface handle
 
@@ -277,11 +273,9 @@ class Face(aocutils.brep.base.BaseObject):
         Handle <Geom_Surface>
 
         """
-        if self._surface_handle is None:
-            self._surface_handle = OCC.BRep.BRep_Tool_Surface(self._wrapped_instance)
-        return self._surface_handle
+        return OCC.BRep.BRep_Tool_Surface(self._wrapped_instance)
 
-    @property
+    @aocutils.brep.base.cached_property
     def adaptor(self):
         r"""Adaptor
 
@@ -290,11 +284,9 @@ class Face(aocutils.brep.base.BaseObject):
         OCC.BRepAdaptor.BRepAdaptor_Surface
 
         """
-        if self._adaptor is None:
-            self._adaptor = OCC.BRepAdaptor.BRepAdaptor_Surface(self._wrapped_instance)
-        return self._adaptor
+        return OCC.BRepAdaptor.BRepAdaptor_Surface(self._wrapped_instance)
 
-    @property
+    @aocutils.brep.base.cached_property
     def adaptor_handle(self):
         r"""Adaptor handle
 
@@ -303,10 +295,9 @@ class Face(aocutils.brep.base.BaseObject):
         OCC.BRepAdaptor.BRepAdaptor_HSurface
 
         """
-        if self._adaptor_handle is None:
-            self._adaptor_handle = OCC.BRepAdaptor.BRepAdaptor_HSurface()
-            self._adaptor_handle.Set(self.adaptor)
-        return self._adaptor_handle
+        adaptor_handle = OCC.BRepAdaptor.BRepAdaptor_HSurface()
+        adaptor_handle.Set(self.adaptor)
+        return adaptor_handle
 
     @property
     def is_closed(self):
@@ -379,6 +370,17 @@ class Face(aocutils.brep.base.BaseObject):
             return True
         return False
 
+    @aocutils.brep.base.cached_property
+    def _classify_uv(self):
+        r"""2D classifier of the (u, v) parameters with respect to the face boundaries
+
+        Returns
+        -------
+        OCC.BRepTopAdaptor.BRepTopAdaptor_FClass2d
+
+        """
+        return OCC.BRepTopAdaptor.BRepTopAdaptor_FClass2d(self._wrapped_instance, 1e-9)
+
     def on_trimmed(self, u, v):
         r"""Tests whether the surface at the u,v parameter has been trimmed
 
@@ -392,8 +394,6 @@ class Face(aocutils.brep.base.BaseObject):
         bool
 
         """
-        if self._classify_uv is None:
-            self._classify_uv = OCC.BRepTopAdaptor.BRepTopAdaptor_FClass2d(self._wrapped_instance, 1e-9)
         uv = OCC.gp.gp_Pnt2d(u, v)
         if self._classify_uv.Perform(uv) == OCC.TopAbs.TopAbs_IN:
             return True
@@ -446,9 +446,22 @@ class Face(aocutils.brep.base.BaseObject):
             u, v coordinates
 
         """
-        sas = OCC.ShapeAnalysis.ShapeAnalysis_Surface(self.surface_handle)
-        uv = sas.ValueOfUV(pt, self.tolerance)
-        return uv.X(), uv.Y()
+        return self.projector().project_point(pt)
+
+    @aocutils.brep.base.cached_property
+    def _surface_projector(self):
+        r"""SurfaceProjector of the face surface"""
+        return SurfaceProjector(self.surface_handle, self.tolerance)
+
+    def projector(self):
+        r"""Projector of points on the surface of the face, loaded once per face
+
+        Returns
+        -------
+        SurfaceProjector
+
+        """
+        return self._surface_projector
 
     def continuity_edge_face(self, edge, face):
         r"""compute the continuity between two faces at edge
@@ -493,11 +506,8 @@ class Face(aocutils.brep.base.BaseObject):
         if isinstance(pnt, OCC.TopoDS.TopoDS_Vertex):
             pnt = OCC.BRep.BRep_Tool.Pnt(pnt)
 
-        proj = OCC.GeomAPI.GeomAPI_ProjectPointOnSurf(pnt, self.surface_handle, tol)
-        # uv = proj.LowerDistanceParameters()
-        proj_pnt = proj.NearestPoint()
-
-        return proj.LowerDistanceParameters(), proj_pnt
+        uv = self.projector().project_point(pnt, tol)
+        return uv, self.surface.Value(uv[0], uv[1])
 
     def project_curve(self, other):
         r"""Project a curve on face(self)
@@ -740,6 +750,131 @@ class Face(aocutils.brep.base.BaseObject):
             logger.error(msg)
             raise aocutils.exceptions.TangentException(msg)
 
+    # ======================================================================
+    # Batch evaluation : NumPy arrays of (u, v) parameters in, NumPy arrays out
+    # ======================================================================
+
+    def _check_uv_arrays_in_domain(self, us, vs):
+        r"""Check that all the (u, v) parameters lie in the domain
+
+        Parameters
+        ----------
+        us : array_like
+        vs : array_like
+
+        Returns
+        -------
+        tuple[numpy.ndarray]
+            us and vs as 1D float64 arrays
+
+        """
+        us = np.asarray(us, dtype=np.float64).ravel()
+        vs = np.asarray(vs, dtype=np.float64).ravel()
+        u_min, u_max, v_min, v_max = self.domain
+        if us.size > 0 and (us.min() < u_min or us.max() > u_max):
+            msg = "Parameters u are outside of domain ranging from %s to %s" % (str(u_min), str(u_max))
+            logger.error(msg)
+            raise aocutils.exceptions.ParameterOutOfDomainException(msg)
+        if vs.size > 0 and (vs.min() < v_min or vs.max() > v_max):
+            msg = "Parameters v are outside of domain ranging from %s to %s" % (str(v_min), str(v_max))
+            logger.error(msg)
+            raise aocutils.exceptions.ParameterOutOfDomainException(msg)
+        return us, vs
+
+    def _evaluate(self, us, vs):
+        r"""Evaluate the surface properties at the (us[i], vs[i]) parameters
+
+        A single GeomLProp_SLProps is reused for all the parameters. As in local_props(), the parameters lying on the
+        domain bounds are moved slightly inside the domain to compute the differential properties.
+
+        Parameters
+        ----------
+        us : numpy.ndarray
+        vs : numpy.ndarray
+
+        Returns
+        -------
+        dict
+            See evaluate()
+
+        """
+        n = us.size
+        points = np.empty((n, 3), dtype=np.float64)
+        normals = np.full((n, 3), np.nan, dtype=np.float64)
+        curvatures = np.full((n, 4), np.nan, dtype=np.float64)  # gaussian, mean, min, max
+
+        u_min, u_max, v_min, v_max = self.domain
+        delta_u, delta_v = (u_max - u_min) / 1000., (v_max - v_min) / 1000.
+        props_us = np.where(us == u_min, us + delta_u, np.where(us == u_max, us - delta_u, us))
+        props_vs = np.where(vs == v_min, vs + delta_v, np.where(vs == v_max, vs - delta_v, vs))
+
+        surface = self.surface
+        props = OCC.GeomLProp.GeomLProp_SLProps(self.surface_handle, 2, 1e-6)
+        reverse = -1. if self.orientation == OCC.TopAbs.TopAbs_REVERSED else 1.
+        pnt = OCC.gp.gp_Pnt()
+        for i, (u, v, props_u, props_v) in enumerate(zip(us.tolist(), vs.tolist(),
+                                                         props_us.tolist(), props_vs.tolist())):
+            surface.D0(u, v, pnt)
+            points[i] = pnt.X(), pnt.Y(), pnt.Z()
+            props.SetParameters(props_u, props_v)
+            if props.IsNormalDefined():
+                norm = props.Normal()
+                normals[i] = norm.X(), norm.Y(), norm.Z()
+            if props.IsCurvatureDefined():
+                curvatures[i] = (props.GaussianCurvature(), props.MeanCurvature(), props.MinCurvature(),
+                                 props.MaxCurvature())
+        normals *= reverse
+
+        return {'uv': np.column_stack((us, vs)),
+                'points': points,
+                'normals': normals,
+                'gaussian_curvature': curvatures[:, 0],
+                'mean_curvature': curvatures[:, 1],
+                'min_curvature': curvatures[:, 2],
+                'max_curvature': curvatures[:, 3]}
+
+    def evaluate(self, uv):
+        r"""Points, normals and curvatures at scattered (u, v) parameters
+
+        Parameters
+        ----------
+        uv : array_like
+            (N, 2) array of (u, v) parameters
+
+        Returns
+        -------
+        dict
+            'uv' : (N, 2) parameters, 'points' : (N, 3) points, 'normals' : (N, 3) unit normals (NaN where undefined),
+            'gaussian_curvature', 'mean_curvature', 'min_curvature', 'max_curvature' : (N,) curvatures (NaN where
+            undefined). All arrays are float64.
+
+        """
+        uv = np.asarray(uv, dtype=np.float64).reshape(-1, 2)
+        us, vs = self._check_uv_arrays_in_domain(uv[:, 0], uv[:, 1])
+        return self._evaluate(us, vs)
+
+    def evaluate_grid(self, nu, nv):
+        r"""Points, normals and curvatures on a regular nu x nv grid spanning the (u, v) domain
+
+        Parameters
+        ----------
+        nu : int
+            Number of u values, at least 2
+        nv : int
+            Number of v values, at least 2
+
+        Returns
+        -------
+        dict
+            Same keys as evaluate(), the arrays are shaped (nu, nv, ...)
+
+        """
+        u_min, u_max, v_min, v_max = self.domain
+        us, vs = np.meshgrid(np.linspace(u_min, u_max, max(nu, 2)), np.linspace(v_min, v_max, max(nv, 2)),
+                             indexing='ij')
+        result = self._evaluate(us.ravel(), vs.ravel())
+        return dict((key, value.reshape(us.shape + value.shape[1:])) for key, value in result.items())
+
     def radius(self, u, v):
         r"""Radius at u
 
@@ -778,3 +913,88 @@ class Face(aocutils.brep.base.BaseObject):
 
     def __str__(self):
         return self.__repr__()
+
+
+class SurfaceProjector(object):
+    r"""Projection of points on a surface, with the surface analysis loaded once
+
+    Parameters
+    ----------
+    surface_handle : Handle <Geom_Surface>
+    tolerance : float (optional)
+        Precision of the projection
+
+    """
+    def __init__(self, surface_handle, tolerance=aocutils.tolerance.OCCUTILS_DEFAULT_TOLERANCE):
+        self._surface = surface_handle.GetObject()
+        self._surface_analysis = OCC.ShapeAnalysis.ShapeAnalysis_Surface(surface_handle)
+        self._tolerance = tolerance
+
+    def project_point(self, pnt, tolerance=None):
+        r"""(u, v) parameters of the projection of a point
+
+        Parameters
+        ----------
+        pnt : OCC.gp.gp_Pnt
+        tolerance : float (optional)
+            The default is the tolerance of the projector
+
+        Returns
+        -------
+        tuple[float]
+            u, v
+
+        """
+        uv = self._surface_analysis.ValueOfUV(pnt, self._tolerance if tolerance is None else tolerance)
+        return uv.X(), uv.Y()
+
+    def project(self, points, warm_start=False, initial_uv=None):
+        r"""Project many points
+
+        Parameters
+        ----------
+        points : array_like
+            (N, 3)
+        warm_start : bool (optional)
+            Start the search of each point from the (u, v) of the previous one. Useful for ordered streams of
+            points. The default is False
+        initial_uv : array_like (optional)
+            (N, 2) start of the search for each point, e.g. the (u, v) of the points before they moved.
+            Takes precedence over warm_start. The default is None
+
+        Returns
+        -------
+        uv : np.ndarray
+            (N, 2) parameters of the projections
+        projected : np.ndarray
+            (N, 3) projected points
+        distances : np.ndarray
+            (N,) distances from points to their projections
+
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        if initial_uv is not None:
+            initial_uv = np.asarray(initial_uv, dtype=np.float64).reshape(-1, 2)
+        uv = np.empty((len(points), 2))
+        projected = np.empty((len(points), 3))
+        pnt = OCC.gp.gp_Pnt()
+        surface_pnt = OCC.gp.gp_Pnt()
+        previous = None
+        for i, (x, y, z) in enumerate(points.tolist()):
+            pnt.SetCoord(x, y, z)
+            if initial_uv is not None:
+                start = OCC.gp.gp_Pnt2d(initial_uv[i, 0], initial_uv[i, 1])
+            elif warm_start:
+                start = previous
+            else:
+                start = None
+            if start is None:
+                result = self._surface_analysis.ValueOfUV(pnt, self._tolerance)
+            else:
+                result = self._surface_analysis.NextValueOfUV(start, pnt, self._tolerance)
+            previous = result
+            u, v = result.X(), result.Y()
+            uv[i] = u, v
+            self._surface.D0(u, v, surface_pnt)
+            projected[i] = surface_pnt.Coord()
+        return uv, projected, np.linalg.norm(projected - points, axis=1)
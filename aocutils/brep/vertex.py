@@ -84,8 +84,10 @@ class Vertex(aocutils.brep.base.BaseObject):
         """
         # TODO: perhaps should take an argument until which topological level
         # topological entities bound to the vertex should be updated too...
+        new_vertex = aocutils.brep.vertex_make.vertex(self._pnt)
         reshape = OCC.ShapeBuild.ShapeBuild_ReShape()
-        reshape.Replace(self._wrapped_instance, aocutils.brep.vertex_make.vertex(self._pnt))
+        reshape.Replace(self._wrapped_instance, new_vertex)
+        self._replace_wrapped_instance(new_vertex)
 
     @property
     def x(self):
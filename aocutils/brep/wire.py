@@ -9,6 +9,7 @@ Wire
 
 import logging
 
+import numpy as np
 import OCC.BRepBuilderAPI
 import OCC.TopoDS
 import OCC.Approx
@@ -16,11 +17,15 @@ import OCC.BRepAdaptor
 import OCC.GeomAbs
 import OCC.GeomConvert
 import OCC.BRepCheck
+import OCC.TopAbs
+import OCC.TopExp
 
 import aocutils.brep.base
+import aocutils.brep.edge
 import aocutils.common
 import aocutils.tolerance
 import aocutils.exceptions
+import aocutils.topology
 
 logger = logging.getLogger(__name__)
 
@@ -100,3 +105,45 @@ class Wire(aocutils.brep.base.BaseObject):
 
         """
         return OCC.BRepAdaptor.BRepAdaptor_CompCurve(self._wrapped_instance)
+
+    def discretize(self, mode=aocutils.brep.edge.DISCRETIZE_DEFLECTION, deflection=1e-2, angular_deflection=0.1,
+                   n_pts=None, distance=None):
+        r"""Polyline approximating the wire
+
+        The edges are discretized one by one (see aocutils.brep.edge.Edge.discretization_parameters()),
+        in the order of the wire traversal, reversed edges being traversed backwards.
+        The points of the vertices shared by consecutive edges are not duplicated : the polyline of a closed wire
+        does not repeat its first point at the end
+
+        Parameters
+        ----------
+        mode : str (optional)
+        deflection : float (optional)
+        angular_deflection : float (optional)
+        n_pts : int (optional)
+            Number of points per edge (abscissa mode)
+        distance : float (optional)
+            Distance between consecutive points along each edge (abscissa mode)
+
+        Returns
+        -------
+        numpy.ndarray
+            (N, 3) float64 array of points
+
+        """
+        edges = list(aocutils.topology.WireExplorer(self._wrapped_instance).ordered_edges)
+        polylines = list()
+        for topods_edge in edges:
+            points = aocutils.brep.edge.Edge(topods_edge).discretize(mode, deflection, angular_deflection, n_pts,
+                                                                      distance)
+            if topods_edge.Orientation() == OCC.TopAbs.TopAbs_REVERSED:
+                points = points[::-1]
+            # the first point is the last point of the previous edge
+            polylines.append(points if len(polylines) == 0 else points[1:])
+        if len(polylines) == 0:
+            return np.zeros((0, 3))
+
+        closed = OCC.TopExp.topexp_FirstVertex(edges[0], True).IsSame(OCC.TopExp.topexp_LastVertex(edges[-1], True))
+        if closed and sum(len(polyline) for polyline in polylines) > 1:
+            polylines[-1] = polylines[-1][:-1]
+        return np.concatenate(polylines)
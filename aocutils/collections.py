@@ -10,10 +10,26 @@ to_tcol_
 tcol_dim_1
 point_list_to_tcolgp_array1_of_pnt
 point2d_list_to_tcolgp_array1_of_pnt2d
+array_to_tcolgp_array1_of_pnt
+array_to_tcolgp_array1_of_pnt2d
+array_to_tcolstd_array1_of_real
+array_to_tcolgp_array2_of_pnt
+tcolgp_array1_of_pnt_to_array
+tcolgp_array1_of_pnt2d_to_array
+tcolstd_array1_of_real_to_array
+tcolgp_array2_of_pnt_to_array
+
+Notes
+-----
+The SWIG wrappers of the TCol* arrays do not expose their memory : the NumPy conversions copy the values,
+but without building Python lists of gp_Pnt in between
 
 """
 
+import numpy as np
+import OCC.gp
 import OCC.TColgp
+import OCC.TColStd
 import OCC.TCollection
 
 
@@ -86,13 +102,16 @@ def point_list_to_tcolgp_array1_of_pnt(li):
 
     Parameters
     ----------
-    li : list[OCC.gp.gp_Pnt]
+    li : list[OCC.gp.gp_Pnt] or np.ndarray
+        List of points or (N, 3) array
 
     Returns
     -------
     OCC.TColgp.TColgp_Array1OfPnt
 
     """
+    if isinstance(li, np.ndarray):
+        return array_to_tcolgp_array1_of_pnt(li)
     pts = OCC.TColgp.TColgp_Array1OfPnt(0, len(li) - 1)
     for n, i in enumerate(li):
         pts.SetValue(n, i)
@@ -112,3 +131,188 @@ def point2d_list_to_tcolgp_array1_of_pnt2d(li):
 
     """
     return tcol_dim_1(li, OCC.TColgp.TColgp_Array1OfPnt2d)
+
+
+def array_to_tcolgp_array1_of_pnt(array, start_at_one=False):
+    r"""Populate a OCC.TColgp.TColgp_Array1OfPnt from a NumPy array
+
+    Parameters
+    ----------
+    array : array_like
+        (N, 3)
+    start_at_one : bool
+        Determines if the first index of the OCC collection will be 0 or 1
+
+    Returns
+    -------
+    OCC.TColgp.TColgp_Array1OfPnt
+
+    """
+    array = np.asarray(array, dtype=np.float64).reshape(-1, 3)
+    lower = 1 if start_at_one else 0
+    pts = OCC.TColgp.TColgp_Array1OfPnt(lower, lower + len(array) - 1)
+    # SetValue copies the point : a single gp_Pnt is reused
+    pnt = OCC.gp.gp_Pnt()
+    for i, (x, y, z) in enumerate(array.tolist()):
+        pnt.SetCoord(x, y, z)
+        pts.SetValue(lower + i, pnt)
+    return pts
+
+
+def array_to_tcolgp_array1_of_pnt2d(array, start_at_one=False):
+    r"""Populate a OCC.TColgp.TColgp_Array1OfPnt2d from a NumPy array
+
+    Parameters
+    ----------
+    array : array_like
+        (N, 2)
+    start_at_one : bool
+        Determines if the first index of the OCC collection will be 0 or 1
+
+    Returns
+    -------
+    OCC.TColgp.TColgp_Array1OfPnt2d
+
+    """
+    array = np.asarray(array, dtype=np.float64).reshape(-1, 2)
+    lower = 1 if start_at_one else 0
+    pts = OCC.TColgp.TColgp_Array1OfPnt2d(lower, lower + len(array) - 1)
+    # SetValue copies the point : a single gp_Pnt2d is reused
+    pnt = OCC.gp.gp_Pnt2d()
+    for i, (x, y) in enumerate(array.tolist()):
+        pnt.SetCoord(x, y)
+        pts.SetValue(lower + i, pnt)
+    return pts
+
+
+def array_to_tcolstd_array1_of_real(array, start_at_one=False):
+    r"""Populate a OCC.TColStd.TColStd_Array1OfReal from a NumPy array
+
+    Parameters
+    ----------
+    array : array_like
+        (N,)
+    start_at_one : bool
+        Determines if the first index of the OCC collection will be 0 or 1
+
+    Returns
+    -------
+    OCC.TColStd.TColStd_Array1OfReal
+
+    """
+    array = np.asarray(array, dtype=np.float64).reshape(-1)
+    lower = 1 if start_at_one else 0
+    reals = OCC.TColStd.TColStd_Array1OfReal(lower, lower + len(array) - 1)
+    for i, value in enumerate(array.tolist()):
+        reals.SetValue(lower + i, value)
+    return reals
+
+
+def array_to_tcolgp_array2_of_pnt(array):
+    r"""Populate a OCC.TColgp.TColgp_Array2OfPnt from a NumPy array
+
+    Parameters
+    ----------
+    array : array_like
+        (N, M, 3)
+
+    Returns
+    -------
+    OCC.TColgp.TColgp_Array2OfPnt
+        Rows and columns indices start at 1
+
+    """
+    array = np.asarray(array, dtype=np.float64)
+    n, m = array.shape[:2]
+    pts = OCC.TColgp.TColgp_Array2OfPnt(1, n, 1, m)
+    # SetValue copies the point : a single gp_Pnt is reused
+    pnt = OCC.gp.gp_Pnt()
+    for i, row in enumerate(array.tolist()):
+        for j, (x, y, z) in enumerate(row):
+            pnt.SetCoord(x, y, z)
+            pts.SetValue(i + 1, j + 1, pnt)
+    return pts
+
+
+def tcolgp_array1_of_pnt_to_array(pts):
+    r"""Coordinates of the points of a OCC.TColgp.TColgp_Array1OfPnt
+
+    Parameters
+    ----------
+    pts : OCC.TColgp.TColgp_Array1OfPnt
+
+    Returns
+    -------
+    np.ndarray
+        (N, 3)
+
+    Notes
+    -----
+    pythonocc has no bulk accessor for the TColgp arrays : Value() returns a proxy of the point stored in the
+    array (a reference, the point is not copied), one proxy being created per point
+
+    """
+    return np.array([pts.Value(i).Coord() for i in range(pts.Lower(), pts.Upper() + 1)],
+                    dtype=np.float64).reshape(-1, 3)
+
+
+def tcolgp_array1_of_pnt2d_to_array(pts):
+    r"""Coordinates of the points of a OCC.TColgp.TColgp_Array1OfPnt2d
+
+    Parameters
+    ----------
+    pts : OCC.TColgp.TColgp_Array1OfPnt2d
+
+    Returns
+    -------
+    np.ndarray
+        (N, 2)
+
+    Notes
+    -----
+    pythonocc has no bulk accessor for the TColgp arrays : Value() returns a proxy of the point stored in the
+    array (a reference, the point is not copied), one proxy being created per point
+
+    """
+    return np.array([pts.Value(i).Coord() for i in range(pts.Lower(), pts.Upper() + 1)],
+                    dtype=np.float64).reshape(-1, 2)
+
+
+def tcolstd_array1_of_real_to_array(reals):
+    r"""Values of a OCC.TColStd.TColStd_Array1OfReal
+
+    Parameters
+    ----------
+    reals : OCC.TColStd.TColStd_Array1OfReal
+
+    Returns
+    -------
+    np.ndarray
+        (N,)
+
+    """
+    return np.fromiter((reals.Value(i) for i in range(reals.Lower(), reals.Upper() + 1)), dtype=np.float64,
+                       count=reals.Length())
+
+
+def tcolgp_array2_of_pnt_to_array(pts):
+    r"""Coordinates of the points of a OCC.TColgp.TColgp_Array2OfPnt
+
+    Parameters
+    ----------
+    pts : OCC.TColgp.TColgp_Array2OfPnt
+
+    Returns
+    -------
+    np.ndarray
+        (rows, columns, 3)
+
+    Notes
+    -----
+    pythonocc has no bulk accessor for the TColgp arrays : Value() returns a proxy of the point stored in the
+    array (a reference, the point is not copied), one proxy being created per point
+
+    """
+    return np.array([[pts.Value(i, j).Coord() for j in range(pts.LowerCol(), pts.UpperCol() + 1)]
+                     for i in range(pts.LowerRow(), pts.UpperRow() + 1)],
+                    dtype=np.float64).reshape(pts.ColLength(), pts.RowLength(), 3)
@@ -34,6 +34,11 @@ class BooleanCommonException(AocUtilsException):
     pass
 
 
+class BooleanFuseException(AocUtilsException):
+    r"""Something went wrong with a boolean fuse"""
+    pass
+
+
 class OffsetShapeException(AocUtilsException):
     r"""Something went wrong with an offset shape"""
     pass
@@ -59,6 +64,11 @@ class UniformAbscissaException(AocUtilsException):
     pass
 
 
+class DiscretizationException(AocUtilsException):
+    r"""Something went wrong while discretizing a curve"""
+    pass
+
+
 class CurveHandleException(AocUtilsException):
     r"""Curve handle exception"""
     pass
@@ -4,6 +4,10 @@
 r"""
 """
 
+import numpy as np
+
+import aocutils.collections
+
 
 class ThreeD(object):
     r"""3 dimensional object with x y z coordinates"""
@@ -66,3 +70,104 @@ class ThreeD(object):
     def z(self):
         r"""z coordinate"""
         return self._z
+
+
+class ThreeDArray(object):
+    r"""Many 3 dimensional objects backed by a contiguous (N, 3) float64 array
+
+    Parameters
+    ----------
+    array : array_like
+        (N, 3) coordinates
+
+    """
+    # OCC class of the items, used by to_gp()
+    _gp_class = None
+
+    def __init__(self, array):
+        self._array = np.ascontiguousarray(array, dtype=np.float64).reshape(-1, 3)
+
+    @classmethod
+    def from_gp(cls, gp_objects):
+        r"""Create from gp_Pnt, gp_Vec, gp_XYZ ... (anything with a Coord() method)
+
+        Parameters
+        ----------
+        gp_objects : iterable
+
+        """
+        return cls([gp_object.Coord() for gp_object in gp_objects])
+
+    def to_gp(self):
+        r"""Convert to a list of OCC objects
+
+        Returns
+        -------
+        list
+
+        """
+        gp_class = self._gp_class
+        return [gp_class(x, y, z) for x, y, z in self._array.tolist()]
+
+    @classmethod
+    def from_tcolgp(cls, tcolgp_array):
+        r"""Create from a OCC.TColgp.TColgp_Array1OfPnt
+
+        Parameters
+        ----------
+        tcolgp_array : OCC.TColgp.TColgp_Array1OfPnt
+
+        """
+        return cls(aocutils.collections.tcolgp_array1_of_pnt_to_array(tcolgp_array))
+
+    def to_tcolgp(self, start_at_one=False):
+        r"""Convert to a OCC.TColgp.TColgp_Array1OfPnt
+
+        Parameters
+        ----------
+        start_at_one : bool
+            Determines if the first index of the OCC collection will be 0 or 1
+
+        Returns
+        -------
+        OCC.TColgp.TColgp_Array1OfPnt
+
+        """
+        return aocutils.collections.array_to_tcolgp_array1_of_pnt(self._array, start_at_one)
+
+    @property
+    def array(self):
+        r"""The underlying (N, 3) array (not a copy)"""
+        return self._array
+
+    @property
+    def x(self):
+        r"""x coordinates"""
+        return self._array[:, 0]
+
+    @property
+    def y(self):
+        r"""y coordinates"""
+        return self._array[:, 1]
+
+    @property
+    def z(self):
+        r"""z coordinates"""
+        return self._array[:, 2]
+
+    def __len__(self):
+        return len(self._array)
+
+    def __getitem__(self, item):
+        r"""Row(s) of the array : an (3,) array for an integer, a new instance for a slice or an index array"""
+        if isinstance(item, (int, np.integer)):
+            return self._array[item]
+        return self.__class__(self._array[item])
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None and not copy:
+            return self._array
+        return np.array(self._array, dtype=dtype)
+
+    def __repr__(self):
+        return "%s(%s)" % (self.__class__.__name__, repr(self._array))
@@ -8,9 +8,11 @@ import logging
 
 import operator
 
+import numpy as np
 import OCC.gp
 
 import aocutils.geom._three_d
+import aocutils.geom.vector
 import aocutils.tolerance
 import aocutils.exceptions
 
@@ -103,3 +105,84 @@ class Point(aocutils.geom._three_d.ThreeD):
             msg = "Incompatible point geom_type for comparison"
             logger.critical(msg)
             raise TypeError(msg)
+
+
+class PointArray(aocutils.geom._three_d.ThreeDArray):
+    r"""Many 3D points backed by a contiguous (N, 3) float64 array
+
+    Parameters
+    ----------
+    array : array_like
+        (N, 3) coordinates
+
+    Examples
+    --------
+    >>> p = PointArray([[0, 0, 0], [2, 2, 2]])
+    >>> p.midpoints(PointArray([[2, 0, 0], [2, 2, 4]])).array
+    array([[1., 0., 0.],
+           [2., 2., 3.]])
+    """
+    _gp_class = OCC.gp.gp_Pnt
+
+    def translate(self, vectors):
+        r"""Translate the points
+
+        Parameters
+        ----------
+        vectors : VectorArray or array_like
+            (N, 3) or (3,)
+
+        Returns
+        -------
+        PointArray
+
+        """
+        return PointArray(self._array + np.asarray(vectors, dtype=np.float64))
+
+    def midpoints(self, other):
+        r"""Points in the middle of self and other
+
+        Parameters
+        ----------
+        other : PointArray or array_like
+
+        Returns
+        -------
+        PointArray
+
+        """
+        return PointArray((self._array + np.asarray(other, dtype=np.float64)) / 2.)
+
+    def distances(self, other):
+        r"""Distances to other points
+
+        Parameters
+        ----------
+        other : PointArray or array_like
+            (N, 3) or (3,)
+
+        Returns
+        -------
+        np.ndarray
+            (N,)
+
+        """
+        return np.linalg.norm(self._array - np.asarray(other, dtype=np.float64), axis=1)
+
+    def __sub__(self, other):
+        r"""Vectors from other points to self"""
+        return aocutils.geom.vector.VectorArray(self._array - np.asarray(other, dtype=np.float64))
+
+    def __eq__(self, other):
+        r"""Are the points equal to other (within the default tolerance)?
+
+        Returns
+        -------
+        np.ndarray
+            (N,) bool
+
+        """
+        return self.distances(other) <= aocutils.tolerance.OCCUTILS_DEFAULT_TOLERANCE
+
+    def __ne__(self, other):
+        return ~self.__eq__(other)
@@ -130,6 +130,8 @@ class Vector(aocutils.geom._three_d.ThreeD):
         """
         return Vector.from_xyz(self.X() / scalar, self.Y() / scalar,  self.Z() / scalar)
 
+    __truediv__ = __div__
+
     def __eq__(self, other):
         r"""Is self equal to other?
 
@@ -160,3 +162,157 @@ class Vector(aocutils.geom._three_d.ThreeD):
 
         """
         return OCC.gp.gp_Dir(self.gp_vec)
+
+
+class VectorArray(aocutils.geom._three_d.ThreeDArray):
+    r"""Many 3D vectors backed by a contiguous (N, 3) float64 array
+
+    Arithmetic operators work element wise with another VectorArray, a (N, 3) or (3,) array or a scalar
+
+    Parameters
+    ----------
+    array : array_like
+        (N, 3) coordinates
+
+    """
+    _gp_class = OCC.gp.gp_Vec
+
+    @classmethod
+    def from_points(cls, start, end):
+        r"""Create the vectors from start points to end points
+
+        Parameters
+        ----------
+        start : PointArray or array_like
+        end : PointArray or array_like
+
+        """
+        return cls(np.asarray(end, dtype=np.float64) - np.asarray(start, dtype=np.float64))
+
+    @property
+    def norms(self):
+        r"""Norms of the vectors
+
+        Returns
+        -------
+        np.ndarray
+            (N,)
+
+        """
+        return np.sqrt(np.einsum("ij,ij->i", self._array, self._array))
+
+    def normalized(self):
+        r"""Unit vectors
+
+        Raises
+        ------
+        aocutils.exceptions.ZeroNormVectorException
+            If any vector has a norm of 0
+
+        Returns
+        -------
+        VectorArray
+
+        """
+        norms = self.norms
+        if np.any(norms == 0):
+            msg = "Cannot normalize a vector of norm 0"
+            logger.error(msg)
+            raise aocutils.exceptions.ZeroNormVectorException(msg)
+        return VectorArray(self._array / norms[:, np.newaxis])
+
+    def dot(self, other):
+        r"""Dot products
+
+        Parameters
+        ----------
+        other : VectorArray or array_like
+
+        Returns
+        -------
+        np.ndarray
+            (N,)
+
+        """
+        other = np.broadcast_to(np.asarray(other, dtype=np.float64), self._array.shape)
+        return np.einsum("ij,ij->i", self._array, other)
+
+    def cross(self, other):
+        r"""Cross products
+
+        Parameters
+        ----------
+        other : VectorArray or array_like
+
+        Returns
+        -------
+        VectorArray
+
+        """
+        return VectorArray(np.cross(self._array, np.asarray(other, dtype=np.float64)))
+
+    def perpendicular(self, other):
+        r"""Vectors perpendicular to self and other
+
+        Parameters
+        ----------
+        other : VectorArray or array_like
+
+        Returns
+        -------
+        VectorArray
+
+        """
+        other = np.asarray(other, dtype=np.float64)
+        if np.any(self.norms == 0) or np.any(np.linalg.norm(other, axis=-1) == 0):
+            raise aocutils.exceptions.ZeroNormVectorException
+        return self.cross(other)
+
+    def is_perpendicular(self, other, angular_tolerance=aocutils.tolerance.OCCUTILS_DEFAULT_TOLERANCE):
+        r"""Are the vectors perpendicular to other?
+
+        Parameters
+        ----------
+        other : VectorArray or array_like
+        angular_tolerance : float
+            Tolerance on the angle between the vectors, in radians
+
+        Returns
+        -------
+        np.ndarray
+            (N,) bool
+
+        """
+        other = np.broadcast_to(np.asarray(other, dtype=np.float64), self._array.shape)
+        norms = self.norms * np.linalg.norm(other, axis=1)
+        if np.any(norms == 0):
+            raise aocutils.exceptions.ZeroNormVectorException
+        # |cos(angle)| = |sin(pi / 2 - angle)| <= sin(angular_tolerance)
+        return np.abs(self.dot(other)) / norms <= np.sin(angular_tolerance)
+
+    def __add__(self, other):
+        return VectorArray(self._array + np.asarray(other, dtype=np.float64))
+
+    def __sub__(self, other):
+        return VectorArray(self._array - np.asarray(other, dtype=np.float64))
+
+    def __neg__(self):
+        return VectorArray(-self._array)
+
+    def __mul__(self, scalar):
+        r"""Multiply by scalars (a number or (N,) numbers)"""
+        return VectorArray(self._array * _as_column(scalar))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, scalar):
+        r"""Divide by scalars (a number or (N,) numbers)"""
+        return VectorArray(self._array / _as_column(scalar))
+
+    __div__ = __truediv__
+
+
+def _as_column(scalar):
+    r"""A number stays a number, (N,) numbers become a (N, 1) column to broadcast on (N, 3) arrays"""
+    scalar = np.asarray(scalar, dtype=np.float64)
+    return scalar[:, np.newaxis] if scalar.ndim == 1 else scalar
@@ -9,6 +9,8 @@ Mathematical utilities
 
 """
 
+import numpy as np
+
 
 def roundlist(li, n_decimals=3):
     r"""Round all the elements of a list to n decimals
@@ -54,3 +56,23 @@ def smooth_pnts(pnts):
         smooth.append(pt)
     smooth.append(pnts[-1])
     return smooth
+
+
+def smooth_array(points):
+    r"""Smooth polylines : each inner point is replaced by the mean of itself and its 2 neighbours
+
+    Parameters
+    ----------
+    points : array_like
+        (..., N, D) coordinates of one or many polylines of N points
+
+    Returns
+    -------
+    np.ndarray
+        Smoothed coordinates, the first and last point of each polyline are unchanged
+
+    """
+    points = np.asarray(points, dtype=np.float64)
+    smooth = points.copy()
+    smooth[..., 1:-1, :] = (points[..., :-2, :] + points[..., 1:-1, :] + points[..., 2:, :]) / 3.
+    return smooth
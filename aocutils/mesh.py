@@ -17,14 +17,30 @@ BRepMesh_IncrementalMesh (const TopoDS_Shape &theShape, const Standard_Real theL
 
 import logging
 
+import numpy as np
+import OCC.BRep
 import OCC.BRepMesh
+import OCC.TopAbs
+import OCC.TopLoc
+import OCC.TopoDS
 
 import aocutils.analyze.bounds
+import aocutils.brep.compound_make
+import aocutils.collections
+import aocutils.parallel
+import aocutils.topology
 
 logger = logging.getLogger(__name__)
 
 
-def mesh(shape, factor=4000., use_min_dim=False):
+def _mesh_shape(shape, linear_deflection, is_relative, angular_deflection, parallel):
+    r"""Mesh shape and return it (function of the per-solid process pool)"""
+    OCC.BRepMesh.BRepMesh_IncrementalMesh(shape, linear_deflection, is_relative, angular_deflection, parallel)
+    return shape
+
+
+def mesh(shape, factor=4000., use_min_dim=False, angular_deflection=0.5, is_relative=False, parallel=False,
+         processes=None, bounding_box=None):
     r"""Mesh a shape
 
     Parameters
@@ -38,15 +54,112 @@ def mesh(shape, factor=4000., use_min_dim=False):
         The default is False (i.e. use max dimension)
         This is useful for long and thin objects where using the max dimension would result in a very coarse linear
         deflection in the other directions.
+    angular_deflection : float (optional)
+        Angular deflection in radians. The default is 0.5
+    is_relative : bool (optional)
+        If True, the linear deflection is relative to the size of each edge. The default is False
+    parallel : bool (optional)
+        If True, the faces are meshed in parallel threads by OCC. The default is False
+    processes : int (optional)
+        If not None and the shape is a compound, its sub-shapes (typically the solids of an assembly)
+        are meshed in a pool of processes and a new compound holding the triangulations is returned.
+        The default is None (no process pool)
+    bounding_box : aocutils.analyze.bounds.BoundingBox (optional)
+        Bounding box of the shape, computed if not provided
+
+    Returns
+    -------
+    OCC.TopoDS.TopoDS_Shape
+        The meshed shape : shape itself, or a new compound if a process pool has been used
 
     """
-    bb = aocutils.analyze.bounds.BoundingBox(shape)
+    if bounding_box is None:
+        bounding_box = aocutils.analyze.bounds.BoundingBox(shape, use_cache=True)
     if use_min_dim:
-        linear_deflection = bb.min_dimension / factor
-        logger.info("Linear deflection : %f" % linear_deflection)
-        OCC.BRepMesh.BRepMesh_IncrementalMesh(shape, linear_deflection)
+        linear_deflection = bounding_box.min_dimension / factor
     else:
-        linear_deflection = bb.max_dimension / factor
-        logger.info("Linear deflection : %f" % linear_deflection)
-        OCC.BRepMesh.BRepMesh_IncrementalMesh(shape, linear_deflection)
-    # return shape
+        linear_deflection = bounding_box.max_dimension / factor
+    logger.info("Linear deflection : %f" % linear_deflection)
+
+    if processes is not None and shape.ShapeType() == OCC.TopAbs.TopAbs_COMPOUND:
+        sub_shapes = list()
+        iterator = OCC.TopoDS.TopoDS_Iterator(shape)
+        while iterator.More():
+            sub_shapes.append(iterator.Value())
+            iterator.Next()
+        if len(sub_shapes) > 1:
+            logger.info("Meshing %i sub-shapes in a pool of processes" % len(sub_shapes))
+            meshed = aocutils.parallel.pool_map_shapes(_mesh_shape, sub_shapes,
+                                                       (linear_deflection, is_relative, angular_deflection, parallel),
+                                                       processes)
+            return aocutils.brep.compound_make.compound(meshed)
+
+    return _mesh_shape(shape, linear_deflection, is_relative, angular_deflection, parallel)
+
+
+def triangulation(shape, factor=4000., use_min_dim=False, angular_deflection=0.5, dtype=np.float64):
+    r"""Triangulation of a shape as NumPy arrays
+
+    The faces that do not have a triangulation yet trigger the meshing of the shape
+
+    Parameters
+    ----------
+    shape : OCC.TopoDS.TopoDS_Shape
+    factor : float (optional)
+        Meshing factor, see mesh()
+    use_min_dim : bool (optional)
+        See mesh()
+    angular_deflection : float (optional)
+        See mesh()
+    dtype : numpy dtype (optional)
+        dtype of the vertices array. The default is np.float64
+
+    Returns
+    -------
+    vertices : np.ndarray
+        (V, 3) coordinates of the vertices, face locations applied
+    triangles : np.ndarray
+        (F, 3) int32 indices of the vertices of each triangle,
+        counter clockwise when seen from outside the material (reversed faces are flipped)
+    face_ids : np.ndarray
+        (F,) int32 index of the face (in Topo(shape).faces order) each triangle belongs to
+
+    """
+    faces = aocutils.topology.Topo(shape, return_iter=False).faces
+    if any(OCC.BRep.BRep_Tool_Triangulation(face, OCC.TopLoc.TopLoc_Location()).IsNull() for face in faces):
+        mesh(shape, factor=factor, use_min_dim=use_min_dim, angular_deflection=angular_deflection)
+
+    vertices, triangles, face_ids = list(), list(), list()
+    offset = 0
+    for face_id, face in enumerate(faces):
+        location = OCC.TopLoc.TopLoc_Location()
+        triangulation_handle = OCC.BRep.BRep_Tool_Triangulation(face, location)
+        if triangulation_handle.IsNull():
+            logger.warning("Face %i has no triangulation, skipped" % face_id)
+            continue
+        poly_triangulation = triangulation_handle.GetObject()
+
+        nodes = poly_triangulation.Nodes()
+        face_vertices = aocutils.collections.tcolgp_array1_of_pnt_to_array(nodes)
+        if not location.IsIdentity():
+            trsf = location.Transformation()
+            matrix = np.array([[trsf.Value(row, col) for col in range(1, 5)] for row in range(1, 4)])
+            face_vertices = face_vertices.dot(matrix[:, :3].T) + matrix[:, 3]
+
+        poly_triangles = poly_triangulation.Triangles()
+        face_triangles = np.array([poly_triangles.Value(i).Get()
+                                   for i in range(poly_triangles.Lower(), poly_triangles.Upper() + 1)],
+                                  dtype=np.int32).reshape(-1, 3) - nodes.Lower()
+        if face.Orientation() == OCC.TopAbs.TopAbs_REVERSED:
+            face_triangles = face_triangles[:, [0, 2, 1]]
+
+        vertices.append(face_vertices)
+        triangles.append(face_triangles + offset)
+        face_ids.append(np.full(len(face_triangles), face_id, dtype=np.int32))
+        offset += len(face_vertices)
+
+    if len(vertices) == 0:
+        return np.zeros((0, 3), dtype=dtype), np.zeros((0, 3), dtype=np.int32), np.zeros(0, dtype=np.int32)
+    return (np.concatenate(vertices).astype(dtype, copy=False),
+            np.concatenate(triangles).astype(np.int32, copy=False),
+            np.concatenate(face_ids))
@@ -5,9 +5,17 @@ r"""Boolean operations"""
 
 import logging
 
+import OCC.BOPAlgo
 import OCC.BRepAlgoAPI
+import OCC.BRepLib
+import OCC.TopAbs
+import OCC.TopExp
+import OCC.TopTools
 
+import aocutils.analyze.bounds
+import aocutils.analyze.spatial
 import aocutils.exceptions
+import aocutils.parallel
 import aocutils.tolerance
 
 logger = logging.getLogger(__name__)
@@ -48,19 +56,97 @@ def common(shape_1, shape_2):
     return algo_common.Shape()
 
 
-def cut(shape_to_cut_from, cutting_shape):
+def _bop(arguments, tools, operation, exception_class, run_parallel=True):
+    r"""Boolean operation between many arguments and many tools in a single BOPAlgo_BOP run
+
+    Parameters
+    ----------
+    arguments : list[OCC.TopoDS.TopoDS_Shape]
+    tools : list[OCC.TopoDS.TopoDS_Shape]
+    operation : OCC.BOPAlgo.BOPAlgo_Operation
+    exception_class : subclass of aocutils.exceptions.AocUtilsException
+        Raised if the operation fails
+    run_parallel : bool (optional)
+        Use the OCC parallel mode. The default is True
+
+    Returns
+    -------
+    OCC.TopoDS.TopoDS_Shape
+
+    """
+    bop = OCC.BOPAlgo.BOPAlgo_BOP()
+    for argument in arguments:
+        bop.AddArgument(argument)
+    for tool in tools:
+        bop.AddTool(tool)
+    bop.SetOperation(operation)
+    bop.SetRunParallel(run_parallel)
+    bop.Perform()
+    if bop.ErrorStatus() != 0:
+        msg = "BOPAlgo_BOP failed with error status %i" % bop.ErrorStatus()
+        logger.error(msg)
+        raise exception_class(msg)
+    return bop.Shape()
+
+
+def _refine_edges(shape, arguments):
+    r"""Fuse the new edges of the result of a boolean operation lying on the same curve
+
+    Same post-processing as BRepAlgoAPI_BooleanOperation.RefineEdges() : the edges of the arguments are kept
+
+    Parameters
+    ----------
+    shape : OCC.TopoDS.TopoDS_Shape
+        Result of the boolean operation
+    arguments : list[OCC.TopoDS.TopoDS_Shape]
+        Arguments and tools of the boolean operation
+
+    Returns
+    -------
+    OCC.TopoDS.TopoDS_Shape
+
+    """
+    argument_edges = OCC.TopTools.TopTools_IndexedMapOfShape()
+    for argument in arguments:
+        OCC.TopExp.topexp_MapShapes(argument, OCC.TopAbs.TopAbs_EDGE, argument_edges)
+    fuse_edges = OCC.BRepLib.BRepLib_FuseEdges(shape)
+    fuse_edges.SetConcatBSpl(True)
+    fuse_edges.AvoidEdges(argument_edges)
+    fuse_edges.Perform()
+    return fuse_edges.Shape()
+
+
+def cut(shape_to_cut_from, cutting_shape, run_parallel=True):
     r"""Boolean cut
 
     Parameters
     ----------
     shape_to_cut_from : OCC.TopoDS.TopoDS_Shape
-    cutting_shape : OCC.TopoDS.TopoDS_Shape
+    cutting_shape : OCC.TopoDS.TopoDS_Shape or list[OCC.TopoDS.TopoDS_Shape]
+        If a list is given, all the tools whose bounding box overlaps the bounding box of shape_to_cut_from
+        are cut at once. The edges of the result are refined in both cases
+    run_parallel : bool (optional)
+        Use the OCC parallel mode when cutting with a list of tools. The default is True
 
     Returns
     -------
     OCC.TopoDS.TopoDS_Shape
 
     """
+    if isinstance(cutting_shape, (list, tuple)):
+        if len(cutting_shape) == 0:
+            return shape_to_cut_from
+        tree = aocutils.analyze.spatial.BoundingBoxTree(cutting_shape)
+        tools = [cutting_shape[i] for i in
+                 tree.query_box(aocutils.analyze.bounds.BoundingBox(shape_to_cut_from).as_tuple)]
+        logger.debug("%i tools out of %i overlap the shape to cut from" % (len(tools), len(cutting_shape)))
+        if len(tools) == 0:
+            return shape_to_cut_from
+        shape = _bop([shape_to_cut_from], tools, OCC.BOPAlgo.BOPAlgo_CUT, aocutils.exceptions.BooleanCutException,
+                     run_parallel)
+        # same edges refinement as with a single cutting shape
+        return _refine_edges(shape, [shape_to_cut_from] + tools)
+
     try:
         brep_cut = OCC.BRepAlgoAPI.BRepAlgoAPI_Cut(shape_to_cut_from, cutting_shape)
         logger.info('Can work ? : %s' % str(brep_cut.BuilderCanWork()))
@@ -103,3 +189,51 @@ def fuse(shape_to_cut_from, joining_shape):
     shape = join.Shape()
     join.Destroy()
     return shape
+
+
+def _fuse_chunk(shapes, run_parallel=True):
+    r"""Fuse a list of shapes in a single BOPAlgo_BOP run"""
+    if len(shapes) == 1:
+        return shapes[0]
+    return _bop(shapes[:1], shapes[1:], OCC.BOPAlgo.BOPAlgo_FUSE, aocutils.exceptions.BooleanFuseException,
+                run_parallel)
+
+
+def fuse_all(shapes, chunk_size=None, processes=None, run_parallel=True):
+    r"""Fuse many shapes
+
+    Parameters
+    ----------
+    shapes : list[OCC.TopoDS.TopoDS_Shape]
+    chunk_size : int (optional)
+        If None (the default), all the shapes are fused in a single BOPAlgo_BOP run.
+        Otherwise, the shapes are fused by chunks of chunk_size, then the results by chunks of chunk_size ...
+        (balanced tree reduction)
+    processes : int (optional)
+        If not None, the chunks of each level of the reduction are fused in a pool of processes.
+        Only used if chunk_size is not None. The default is None
+    run_parallel : bool (optional)
+        Use the OCC parallel mode. The default is True
+
+    Returns
+    -------
+    OCC.TopoDS.TopoDS_Shape
+
+    """
+    shapes = list(shapes)
+    if len(shapes) == 0:
+        msg = "Nothing to fuse"
+        logger.error(msg)
+        raise aocutils.exceptions.BooleanFuseException(msg)
+    if chunk_size is None:
+        return _fuse_chunk(shapes, run_parallel)
+    chunk_size = max(2, int(chunk_size))
+
+    while len(shapes) > 1:
+        chunks = [shapes[i:i + chunk_size] for i in range(0, len(shapes), chunk_size)]
+        logger.debug("Fusing %i shapes in %i chunks" % (len(shapes), len(chunks)))
+        if processes is None:
+            shapes = [_fuse_chunk(chunk, run_parallel) for chunk in chunks]
+        else:
+            shapes = aocutils.parallel.pool_map_shapes(_fuse_chunk, chunks, (run_parallel,), processes)
+    return shapes[0]
@@ -5,6 +5,7 @@ r"""Interpolation
 
 Functions
 ---------
+filter_indices_by_distance
 filter_points_by_distance
 points_to_bspline
 points
@@ -39,6 +40,7 @@ The curve is defined by a table of points through which it passes, and if requir
 
 import logging
 
+import numpy as np
 import OCC.GeomAPI
 import OCC.TColgp
 import OCC.TColStd
@@ -50,29 +52,74 @@ import aocutils.collections
 logger = logging.getLogger(__name__)
 
 
+def filter_indices_by_distance(points, distance=0.1):
+    r"""Indices of the points to keep so that no 2 kept points are within distance of each other
+
+    A point is dropped if it lies within distance of a point kept before it (first kept semantics).
+    The kept points are found with a voxel hash of cell size distance.
+
+    Parameters
+    ----------
+    points : array_like or list[OCC.gp.gp_Pnt]
+        (N, 3) points
+    distance : float, optional
+        (the default value is 0.1)
+
+    Returns
+    -------
+    np.ndarray
+        Sorted indices of the kept points
+
+    """
+    if len(points) > 0 and hasattr(points[0], "Coord"):
+        points = [pnt.Coord() for pnt in points]
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    if len(points) == 0:
+        return np.zeros(0, dtype=np.int64)
+    if distance <= 0:
+        return np.sort(np.unique(points, axis=0, return_index=True)[1])
+
+    squared_distance = distance * distance
+    cells = np.floor(points / distance).astype(np.int64)
+    offsets = [(i, j, k) for i in (-1, 0, 1) for j in (-1, 0, 1) for k in (-1, 0, 1)]
+    # cell -> kept points in the cell
+    grid = dict()
+    kept = list()
+    for index, ((x, y, z), (cx, cy, cz)) in enumerate(zip(points.tolist(), cells.tolist())):
+        close = False
+        for i, j, k in offsets:
+            for ox, oy, oz in grid.get((cx + i, cy + j, cz + k), ()):
+                if (x - ox) ** 2 + (y - oy) ** 2 + (z - oz) ** 2 <= squared_distance:
+                    close = True
+                    break
+            if close:
+                break
+        if not close:
+            grid.setdefault((cx, cy, cz), list()).append((x, y, z))
+            kept.append(index)
+    return np.array(kept, dtype=np.int64)
+
+
 def filter_points_by_distance(list_of_point, distance=0.1):
     r"""Get rid of those point that lie within tolerance of a consecutive series of points
 
     Parameters
     ----------
-    list_of_point : list[OCC.gp.gp_Pnt]
-        List of gp_Pnt
+    list_of_point : list[OCC.gp.gp_Pnt] or np.ndarray
+        List of gp_Pnt or (N, 3) array
     distance : float, optional
         (the default value is 0.1)
 
     Returns
     -------
-    list
-        Filtered list of gp_Pnt
+    list or np.ndarray
+        Filtered list of gp_Pnt, or filtered (M, 3) array if an array was given
 
     """
-    tmp = [list_of_point[0]]
-    for a in list_of_point[1:]:
-        if any([a.IsEqual(i, distance) for i in tmp]):
-            continue
-        else:
-            tmp.append(a)
-    return tmp
+    indices = filter_indices_by_distance(list_of_point, distance)
+    if isinstance(list_of_point, np.ndarray):
+        return list_of_point[indices]
+    return [list_of_point[i] for i in indices]
 
 
 def points_to_bspline(pnts):
@@ -6,39 +6,76 @@ r"""
 Functions
 ---------
 point_on_curve
+points_on_curve
 point_on_plane
 edge_onto_plane
 
 """
 
+import logging
+
 import OCC.GeomAPI
 import OCC.GeomProjLib
 import OCC.ProjLib
 import OCC.TopoDS
 
-import aocutils.convert.adapt
+import aocutils.brep.edge
 import aocutils.brep.edge_make
 
+logger = logging.getLogger(__name__)
+
 
 def point_on_curve(crv, pnt):
-    r"""Project a point on a curve
+    r"""Project a point on an edge or a curve
+
+    The point is projected on the whole underlying curve of an edge, see Edge.project_vertex()
 
     Parameters
     ----------
-    crv
-    pnt
+    crv : OCC.TopoDS.TopoDS_Edge or Handle_Geom_Curve
+    pnt : OCC.gp.gp_Pnt
 
     Returns
     -------
+    float, OCC.gp.gp_Pnt
+        Parameter on the curve and projected point
 
     """
     if isinstance(crv, OCC.TopoDS.TopoDS_Shape):
-        # get the curve handle...
-        crv = aocutils.convert.adapt.edge_to_curve(crv).Curve().Curve()
-    else:
-        raise NotImplementedError('expected a OCC.TopoDS.TopoDS_Edge...')
-    rrr = OCC.GeomAPI.GeomAPI_ProjectPointOnCurve(pnt, crv)
-    return rrr.LowerDistanceParameter(), rrr.NearestPoint()
+        return aocutils.brep.edge.Edge(crv).project_vertex(pnt)
+    projection = OCC.GeomAPI.GeomAPI_ProjectPointOnCurve(pnt, crv)
+    return projection.LowerDistanceParameter(), projection.NearestPoint()
+
+
+def points_on_curve(crv, points, processes=None):
+    r"""Project many points on an edge
+
+    Parameters
+    ----------
+    crv : OCC.TopoDS.TopoDS_Edge or Handle_Geom_Curve
+        A curve is projected on over its whole parameter range, which must be bounded
+    points : array_like
+        (N, 3)
+    processes : int (optional)
+        If not None, the points are split across a pool of processes. The default is None
+
+    Returns
+    -------
+    parameters : np.ndarray
+        (N,) parameters of the projections on the edge
+    feet : np.ndarray
+        (N, 3) projected points
+    distances : np.ndarray
+        (N,) distances from points to their projections
+
+    """
+    if not isinstance(crv, OCC.TopoDS.TopoDS_Edge):
+        if isinstance(crv, OCC.TopoDS.TopoDS_Shape) or not hasattr(crv, "GetObject"):
+            msg = "Expecting a TopoDS_Edge or a Handle_Geom_Curve, got a %s" % str(crv.__class__)
+            logger.error(msg)
+            raise TypeError(msg)
+        crv = aocutils.brep.edge_make.edge(crv)
+    return aocutils.brep.edge.CurveProjector(crv).project(points, processes)
 
 
 def point_on_plane(plane, point):
@@ -11,12 +11,17 @@ mirror_pnt_dir
 mirror_axe2
 rotate
 
+Classes
+-------
+Transform
+
 """
 
 import math
 
 import OCC.BRepBuilderAPI
 import OCC.gp
+import OCC.TopLoc
 import OCC.TopoDS
 
 import aocutils.common
@@ -48,7 +53,7 @@ def translate(brep_or_iterable, vec, copy=False):
         brep_transform.Build()
         return aocutils.topology.shape_to_topology(brep_transform.Shape())
     else:
-        return [translate(brep_or_iterable, vec, copy) for _ in brep_or_iterable]
+        return [translate(brep, vec, copy) for brep in brep_or_iterable]
 
 
 def rotate(brep, axe, degree, copy=False):
@@ -144,3 +149,179 @@ def mirror_axe2(brep, axe2, copy=False):
     with aocutils.common.AssertIsDone(brep_trns, 'could not produce mirror'):
         brep_trns.Build()
         return brep_trns.Shape()
+
+
+class Transform(object):
+    r"""Chain of transformations composed in a single gp_Trsf
+
+    The transformations are applied in the order they are added,
+    e.g. Transform().rotate(axe, 90.).translate(vec) rotates then translates
+
+    Parameters
+    ----------
+    trsf : OCC.gp.gp_Trsf (optional)
+        Initial transformation. The default is None (identity)
+
+    """
+    def __init__(self, trsf=None):
+        self._trsf = OCC.gp.gp_Trsf()
+        if trsf is not None:
+            self._trsf.Multiply(trsf)
+
+    @property
+    def trsf(self):
+        r"""The composed transformation
+
+        Returns
+        -------
+        OCC.gp.gp_Trsf
+
+        """
+        return self._trsf
+
+    @property
+    def is_rigid(self):
+        r"""True if the transformation has no scaling nor mirroring (i.e. it can be a TopLoc_Location)"""
+        return abs(self._trsf.ScaleFactor() - 1.) <= OCC.gp.gp_Resolution()
+
+    def _then(self, trsf):
+        r"""Apply trsf after the current transformation"""
+        self._trsf.PreMultiply(trsf)
+        return self
+
+    def then(self, other):
+        r"""Apply another Transform after this one
+
+        Parameters
+        ----------
+        other : Transform
+
+        Returns
+        -------
+        Transform
+            self
+
+        """
+        return self._then(other.trsf)
+
+    def translate(self, vec):
+        r"""Add a translation
+
+        Parameters
+        ----------
+        vec : OCC.gp.gp_Vec
+
+        Returns
+        -------
+        Transform
+            self
+
+        """
+        trsf = OCC.gp.gp_Trsf()
+        trsf.SetTranslation(vec)
+        return self._then(trsf)
+
+    def rotate(self, axe, degree):
+        r"""Add a rotation around an axis
+
+        Parameters
+        ----------
+        axe : OCC.gp.gp_Ax1
+        degree : float
+            Rotation angle in degrees
+
+        Returns
+        -------
+        Transform
+            self
+
+        """
+        trsf = OCC.gp.gp_Trsf()
+        trsf.SetRotation(axe, math.radians(degree))
+        return self._then(trsf)
+
+    def scale_uniform(self, pnt, factor):
+        r"""Add a uniform scaling
+
+        Parameters
+        ----------
+        pnt : OCC.gp.gp_Pnt
+            Centre of the scaling
+        factor : float
+
+        Returns
+        -------
+        Transform
+            self
+
+        """
+        trsf = OCC.gp.gp_Trsf()
+        trsf.SetScale(pnt, factor)
+        return self._then(trsf)
+
+    def mirror_pnt_dir(self, pnt, direction):
+        r"""Add a mirror with respect to an axis
+
+        Parameters
+        ----------
+        pnt : OCC.gp.gp_Pnt
+        direction : OCC.gp.gp_Dir
+
+        Returns
+        -------
+        Transform
+            self
+
+        """
+        trsf = OCC.gp.gp_Trsf()
+        trsf.SetMirror(OCC.gp.gp_Ax1(pnt, direction))
+        return self._then(trsf)
+
+    def mirror_axe2(self, axe2):
+        r"""Add a mirror with respect to a plane
+
+        Parameters
+        ----------
+        axe2 : OCC.gp.gp_Ax2
+
+        Returns
+        -------
+        Transform
+            self
+
+        """
+        trsf = OCC.gp.gp_Trsf()
+        trsf.SetMirror(axe2)
+        return self._then(trsf)
+
+    def apply(self, brep_or_iterable, copy=False):
+        r"""Apply the transformation
+
+        Rigid transformations without copy only move the shapes (shared TopLoc_Location, no geometry is built),
+        the other ones use BRepBuilderAPI_Transform
+
+        Parameters
+        ----------
+        brep_or_iterable : TopoDS_Shape or iterable[TopoDS_Shape]
+        copy : bool (optional)
+            Copy the geometry. The default is False
+
+        Returns
+        -------
+        OCC.TopoDS.TopoDS_* or list[OCC.TopoDS.TopoDS_*]
+
+        """
+        if issubclass(brep_or_iterable.__class__, OCC.TopoDS.TopoDS_Shape):
+            return self.apply([brep_or_iterable], copy)[0]
+
+        if not copy and self.is_rigid:
+            location = OCC.TopLoc.TopLoc_Location(self._trsf)
+            return [aocutils.topology.shape_to_topology(brep.Moved(location)) for brep in brep_or_iterable]
+
+        transformed = list()
+        for brep in brep_or_iterable:
+            brep_transform = OCC.BRepBuilderAPI.BRepBuilderAPI_Transform(brep, self._trsf, copy)
+            with aocutils.common.AssertIsDone(brep_transform, 'could not transform'):
+                brep_transform.Build()
+                transformed.append(aocutils.topology.shape_to_topology(brep_transform.Shape()))
+        return transformed
@@ -0,0 +1,236 @@
+#!/usr/bin/python
+# coding: utf-8
+
+r"""parallel.py
+
+Summary
+-------
+
+Helpers to distribute work on shapes over a pool of processes
+
+Notes
+-----
+TopoDS shapes cannot be pickled : they are exchanged with the worker processes as BRep strings
+(BRepTools format, which also stores the triangulations)
+
+"""
+
+import logging
+import multiprocessing
+import os
+import tempfile
+
+import numpy as np
+import OCC.BRep
+import OCC.BRepTools
+import OCC.TopoDS
+
+import aocutils.exceptions
+
+logger = logging.getLogger(__name__)
+
+
+def shape_to_string(shape):
+    r"""Serialize a shape to a string in BRep format
+
+    Parameters
+    ----------
+    shape : OCC.TopoDS.TopoDS_Shape
+
+    Returns
+    -------
+    str
+
+    """
+    handle, filename = tempfile.mkstemp(suffix=".brep")
+    os.close(handle)
+    try:
+        if not OCC.BRepTools.breptools_Write(shape, filename):
+            msg = "Could not serialize the shape"
+            logger.error(msg)
+            raise aocutils.exceptions.BRepBuildingException(msg)
+        with open(filename) as f:
+            return f.read()
+    finally:
+        os.remove(filename)
+
+
+def shape_from_string(brep_string):
+    r"""Deserialize a shape from a string in BRep format
+
+    Parameters
+    ----------
+    brep_string : str
+        As returned by shape_to_string()
+
+    Returns
+    -------
+    OCC.TopoDS.TopoDS_Shape
+
+    """
+    handle, filename = tempfile.mkstemp(suffix=".brep")
+    os.close(handle)
+    try:
+        with open(filename, "w") as f:
+            f.write(brep_string)
+        shape = OCC.TopoDS.TopoDS_Shape()
+        builder = OCC.BRep.BRep_Builder()
+        if not OCC.BRepTools.breptools_Read(shape, filename, builder):
+            msg = "Could not deserialize the shape"
+            logger.error(msg)
+            raise aocutils.exceptions.BRepBuildingException(msg)
+        return shape
+    finally:
+        os.remove(filename)
+
+
+def _check_processes(processes):
+    r"""Raise a ValueError if processes is neither None nor a positive number of processes"""
+    if processes is not None and processes < 1:
+        msg = "The number of processes must be at least 1, got %s" % str(processes)
+        logger.error(msg)
+        raise ValueError(msg)
+
+
+def pool_map(func, iterable, processes=None):
+    r"""Map func over iterable using a pool of processes
+
+    Parameters
+    ----------
+    func : callable
+        Must be picklable (i.e. defined at module level) as well as its arguments and return values
+    iterable : iterable
+    processes : int, optional
+        Number of processes. Default is None (i.e. the number of CPUs).
+        If 1, func is simply mapped in the current process
+
+    Returns
+    -------
+    list
+        Results in the order of iterable
+
+    """
+    _check_processes(processes)
+    if processes == 1:
+        return list(map(func, iterable))
+    pool = multiprocessing.Pool(processes)
+    try:
+        return pool.map(func, iterable)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _serialize(item, brep_strings):
+    r"""Replace the shapes of item (a shape, or a list or tuple of shapes) by BRep strings
+
+    brep_strings memoizes the strings by shape object, so that a shape used in several items is serialized once
+
+    """
+    if isinstance(item, (list, tuple)):
+        return type(item)(_serialize(shape, brep_strings) for shape in item)
+    if id(item) not in brep_strings:
+        brep_strings[id(item)] = shape_to_string(item)
+    return brep_strings[id(item)]
+
+
+def _deserialize(item):
+    r"""Inverse of _serialize()"""
+    if isinstance(item, (list, tuple)):
+        return type(item)(_deserialize(brep_string) for brep_string in item)
+    return shape_from_string(item)
+
+
+def _call_on_brep_strings(args):
+    r"""Worker of pool_map_shapes() and pool_map_chunks()
+
+    Parameters
+    ----------
+    args : tuple
+        (func, serialized shapes item, extra arguments)
+
+    Returns
+    -------
+    bool, object
+        True and a BRep string if func returned a shape, False and the result of func otherwise
+
+    """
+    func, item, extra_args = args
+    shapes = _deserialize(item)
+    if isinstance(shapes, tuple):
+        result = func(*(shapes + tuple(extra_args)))
+    else:
+        result = func(shapes, *extra_args)
+    if isinstance(result, OCC.TopoDS.TopoDS_Shape):
+        return True, shape_to_string(result)
+    return False, result
+
+
+def _map_serialized(func, items, extra_args_per_item, processes):
+    r"""Serialize the items, map func over them in a pool of processes and deserialize the shape results"""
+    brep_strings = dict()
+    args = [(func, _serialize(item, brep_strings), extra_args)
+            for item, extra_args in zip(items, extra_args_per_item)]
+    return [shape_from_string(result) if is_shape else result
+            for is_shape, result in pool_map(_call_on_brep_strings, args, processes)]
+
+
+def pool_map_shapes(func, shapes, extra_args=(), processes=None):
+    r"""Map func over shapes using a pool of processes
+
+    The shapes are sent to the workers as BRep strings, and the shapes returned by func are sent back the same way
+
+    Parameters
+    ----------
+    func : callable
+        Must be picklable (i.e. defined at module level) as well as extra_args and the results that are not shapes
+    shapes : list
+        Each item is a TopoDS_Shape, passed as the first argument of func, a list of TopoDS_Shape, also passed as
+        the first argument, or a tuple of TopoDS_Shape, passed as the first arguments (as with itertools.starmap)
+    extra_args : tuple, optional
+        Arguments passed to every call after the shapes. Default is ()
+    processes : int, optional
+        Number of processes. Default is None (i.e. the number of CPUs)
+
+    Returns
+    -------
+    list
+        Results in the order of shapes
+
+    """
+    _check_processes(processes)
+    shapes = list(shapes)
+    return _map_serialized(func, shapes, [tuple(extra_args)] * len(shapes), processes)
+
+
+def pool_map_chunks(func, shape, array, extra_args=(), processes=None):
+    r"""Call func on chunks of array using a pool of processes
+
+    Parameters
+    ----------
+    func : callable
+        Called as func(shape, chunk, *extra_args), must return an array or a tuple of arrays.
+        Must be picklable (i.e. defined at module level) as well as extra_args
+    shape : OCC.TopoDS.TopoDS_Shape
+        Sent once per chunk to the workers as a BRep string
+    array : np.ndarray
+        Split along its first axis in one chunk per process
+    extra_args : tuple, optional
+        Arguments passed to every call after the chunk. Default is ()
+    processes : int, optional
+        Number of processes. Default is None (i.e. the number of CPUs)
+
+    Returns
+    -------
+    np.ndarray or tuple of np.ndarray
+        The results of the chunks concatenated along their first axis
+
+    """
+    _check_processes(processes)
+    n_chunks = processes if processes is not None else multiprocessing.cpu_count()
+    chunks = np.array_split(array, max(1, min(n_chunks, len(array))))
+    results = _map_serialized(func, [(shape,)] * len(chunks), [(chunk,) + tuple(extra_args) for chunk in chunks],
+                              processes)
+    if isinstance(results[0], tuple):
+        return tuple(np.concatenate(arrays) for arrays in zip(*results))
+    return np.concatenate(results)
@@ -13,6 +13,7 @@ from __future__ import print_function
 
 import logging
 
+import numpy as np
 import OCC.BRep
 import OCC.BRepTools
 import OCC.TopAbs
@@ -70,8 +71,7 @@ class WireExplorer(object):
             self._reinitialize()
         topology_type = OCC.TopoDS.topods_Edge if edges else OCC.TopoDS.topods_Vertex
         python_list_of_shape = list()
-        hashes = list()  # list that stores hashes to avoid redundancy
-        toptools_list_of_shape = OCC.TopTools.TopTools_ListOfShape()
+        seen = OCC.TopTools.TopTools_MapOfShape()  # map of the shapes already seen, to avoid redundancy
         while self.wire_explorer.More():
             # loop edges
             if edges:
@@ -79,18 +79,9 @@ class WireExplorer(object):
             # loop vertices
             else:
                 current_item = self.wire_explorer.CurrentVertex()
-            current_item_hash = current_item.__hash__()
-            if current_item_hash not in hashes:
-                hashes.append(current_item_hash)
-                toptools_list_of_shape.Append(current_item)
+            if seen.Add(current_item):
+                python_list_of_shape.append(topology_type(current_item))
             self.wire_explorer.Next()
-
-        # Convert occ_seq to python list
-        occ_iterator = OCC.TopTools.TopTools_ListIteratorOfListOfShape(toptools_list_of_shape)
-        while occ_iterator.More():
-            topo_to_add = topology_type(occ_iterator.Value())
-            python_list_of_shape.append(topo_to_add)
-            occ_iterator.Next()
         self.done = True
         return iter(python_list_of_shape)
 
@@ -138,13 +129,32 @@ class Topo(object):
         filter out TopoDS_* entities of similar TShape but different Orientation
     return_iter : bool
         If True, return iterators. If False, return lists
+    cached : bool
+        If True, the sub-shapes of my_shape and the shape -> ancestors maps are computed once, on first use, and
+        reused by all subsequent queries. Use it when many queries are made on a shape that is not modified anymore.
 
     """
 
-    def __init__(self, my_shape, ignore_orientation=False, return_iter=True):
+    def __init__(self, my_shape, ignore_orientation=False, return_iter=True, cached=False):
         self._my_shape = my_shape
         self._ignore_orientation = ignore_orientation
         self._return_iter = return_iter
+        self._cached = cached
+        # key: (topology_type, topology_type_to_avoid); value: list of sub-shapes of self._my_shape
+        self._sub_shapes_cache = dict()
+        # key: (topo_type_a, topo_type_b); value: TopTools_IndexedDataMapOfShapeListOfShape
+        self._ancestors_maps_cache = dict()
+
+    @property
+    def cached(self):
+        r"""Are the sub-shapes and the ancestors maps cached?
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._cached
 
     def _loop_topo(self, topology_type, topological_entity=None, topology_type_to_avoid=None):
         """Iterating over shape topology
@@ -164,8 +174,9 @@ class Topo(object):
 
         Returns
         -------
-        list of TopoDS_*
-            Depending on the topology_type input
+        list, iterator or generator of TopoDS_*
+            Depending on the topology_type input. A generator is returned if return_iter is True and the orientation
+            is not ignored (and the sub-shapes are not read from the cache)
 
         """
         # topo_types = {OCC.TopAbs.TopAbs_VERTEX: OCC.TopoDS.TopoDS_Vertex,
@@ -183,56 +194,91 @@ class Topo(object):
             logger.critical(msg)
             raise aocutils.exceptions.WrongTopologicalType(msg)
 
-        self.topexp_explorer = OCC.TopExp.TopExp_Explorer()
-        # use self._my_shape if nothing is specified
-        if topological_entity is None and topology_type_to_avoid is None:
-            self.topexp_explorer.Init(self._my_shape, topology_type)
+        if self._cached and topological_entity is None:
+            # copy, the cached list must not be modified by the caller
+            seq = list(self._cached_sub_shapes(topology_type, topology_type_to_avoid))
+        elif self._return_iter and not self._ignore_orientation:
+            # generator: sub-shapes are produced one by one, as the explorer advances
+            return self._iter_topo(topology_type, topological_entity, topology_type_to_avoid)
+        else:
+            seq = self._explore(topology_type, topological_entity, topology_type_to_avoid)
 
-        elif topological_entity is None and topology_type_to_avoid is not None:
-            self.topexp_explorer.Init(self._my_shape, topology_type, topology_type_to_avoid)
+        if self._ignore_orientation:
+            return seq
+        else:
+            if self._return_iter:
+                return iter(seq)  # iterator
+            else:
+                return seq  # list
 
-        elif topology_type_to_avoid is None:
-            self.topexp_explorer.Init(topological_entity, topology_type)
+    def _cached_sub_shapes(self, topology_type, topology_type_to_avoid=None):
+        r"""Sub-shapes of the wrapped shape, explored once and then read from the cache
 
-        elif topology_type_to_avoid:
-            self.topexp_explorer.Init(topological_entity, topology_type, topology_type_to_avoid)
+        Parameters
+        ----------
+        topology_type
+        topology_type_to_avoid
 
-        seq = list()
-        hashes = list()  # list that stores hashes to avoid redundancy
-        occ_seq = OCC.TopTools.TopTools_ListOfShape()
-        while self.topexp_explorer.More():
-            current_item = self.topexp_explorer.Current()
-            current_item_hash = current_item.__hash__()
+        Returns
+        -------
+        list of TopoDS_*
+            The cached list itself, not a copy
 
-            if current_item_hash not in hashes:
-                hashes.append(current_item_hash)
-                occ_seq.Append(current_item)
+        """
+        key = (topology_type, topology_type_to_avoid)
+        if key not in self._sub_shapes_cache:
+            self._sub_shapes_cache[key] = self._explore(topology_type, topology_type_to_avoid=topology_type_to_avoid)
+        return self._sub_shapes_cache[key]
 
-            self.topexp_explorer.Next()
-        # Convert occ_seq to python list
-        occ_iterator = OCC.TopTools.TopTools_ListIteratorOfListOfShape(occ_seq)
-        while occ_iterator.More():
-            topo_to_add = aocutils.types.topo_factory[topology_type](occ_iterator.Value())
-            seq.append(topo_to_add)
-            occ_iterator.Next()
+    def _explore(self, topology_type, topological_entity=None, topology_type_to_avoid=None):
+        r"""Explore the topology and build the list of unique sub-shapes
 
-        if self._ignore_orientation:
-            # filter out those entities that share the same TShape but do *not* share the same orientation
-            filter_orientation_seq = list()
-            for i in seq:
-                _present = False
-                for j in filter_orientation_seq:
-                    if i.IsSame(j):
-                        _present = True
-                        break
-                if _present is False:
-                    filter_orientation_seq.append(i)
-            return filter_orientation_seq
+        Parameters
+        ----------
+        topology_type
+        topological_entity
+        topology_type_to_avoid
+
+        Returns
+        -------
+        list of TopoDS_*
+
+        """
+        return list(self._iter_topo(topology_type, topological_entity, topology_type_to_avoid))
+
+    def _iter_topo(self, topology_type, topological_entity=None, topology_type_to_avoid=None):
+        r"""Lazily explore the topology, yielding the unique sub-shapes as the explorer advances
+
+        Each call uses its own TopExp_Explorer, so that several iterations can be nested or interleaved
+
+        Parameters
+        ----------
+        topology_type
+        topological_entity
+        topology_type_to_avoid
+
+        Returns
+        -------
+        generator of TopoDS_*
+
+        """
+        topexp_explorer = OCC.TopExp.TopExp_Explorer()
+        # use self._my_shape if nothing is specified
+        shape = self._my_shape if topological_entity is None else topological_entity
+        if topology_type_to_avoid is None:
+            topexp_explorer.Init(shape, topology_type)
         else:
-            if self._return_iter:
-                return iter(seq)  # iterator
-            else:
-                return seq  # list
+            topexp_explorer.Init(shape, topology_type, topology_type_to_avoid)
+
+        # TopTools_MapOfShape hashes on TShape and Location and compares with IsSame: a sub-shape that was already
+        # seen, whatever its orientation, is not yielded twice (this also covers the _ignore_orientation case)
+        seen = OCC.TopTools.TopTools_MapOfShape()
+        downcast = aocutils.types.topo_factory[topology_type]
+        while topexp_explorer.More():
+            current_item = topexp_explorer.Current()
+            if seen.Add(current_item):
+                yield downcast(current_item)
+            topexp_explorer.Next()
 
     @property
     def faces(self):
@@ -259,10 +305,26 @@ class Topo(object):
         # return n
         return len(list(iterable))
 
+    def _number_of_sub_shapes(self, topology_type):
+        r"""Number of sub-shapes of a given type in the wrapped shape
+
+        Parameters
+        ----------
+        topology_type
+
+        Returns
+        -------
+        int
+
+        """
+        if self._cached:
+            return len(self._cached_sub_shapes(topology_type))
+        return self._number_of_topo(self._loop_topo(topology_type))
+
     @property
     def number_of_faces(self):
         r"""Number of faces"""
-        return self._number_of_topo(self.faces)
+        return self._number_of_sub_shapes(OCC.TopAbs.TopAbs_FACE)
 
     @property
     def vertices(self):
@@ -272,7 +334,7 @@ class Topo(object):
     @property
     def number_of_vertices(self):
         r"""Number of vertices"""
-        return self._number_of_topo(self.vertices)
+        return self._number_of_sub_shapes(OCC.TopAbs.TopAbs_VERTEX)
 
     @property
     def edges(self):
@@ -282,7 +344,7 @@ class Topo(object):
     @property
     def number_of_edges(self):
         r"""Number of edges"""
-        return self._number_of_topo(self.edges)
+        return self._number_of_sub_shapes(OCC.TopAbs.TopAbs_EDGE)
 
     @property
     def wires(self):
@@ -292,7 +354,7 @@ class Topo(object):
     @property
     def number_of_wires(self):
         r"""Number of wires"""
-        return self._number_of_topo(self.wires)
+        return self._number_of_sub_shapes(OCC.TopAbs.TopAbs_WIRE)
 
     @property
     def shells(self):
@@ -302,7 +364,7 @@ class Topo(object):
     @property
     def number_of_shells(self):
         r"""Number of shells"""
-        return self._number_of_topo(self.shells)
+        return self._number_of_sub_shapes(OCC.TopAbs.TopAbs_SHELL)
 
     @property
     def solids(self):
@@ -312,7 +374,7 @@ class Topo(object):
     @property
     def number_of_solids(self):
         r"""Number of solids"""
-        return self._number_of_topo(self.solids)
+        return self._number_of_sub_shapes(OCC.TopAbs.TopAbs_SOLID)
 
     @property
     def comp_solids(self):
@@ -322,7 +384,7 @@ class Topo(object):
     @property
     def number_of_comp_solids(self):
         r"""Number of compound solids"""
-        return self._number_of_topo(self.comp_solids)
+        return self._number_of_sub_shapes(OCC.TopAbs.TopAbs_COMPSOLID)
 
     @property
     def compounds(self):
@@ -332,7 +394,7 @@ class Topo(object):
     @property
     def number_of_compounds(self):
         r"""Number of compounds"""
-        return self._number_of_topo(self.compounds)
+        return self._number_of_sub_shapes(OCC.TopAbs.TopAbs_COMPOUND)
 
     @staticmethod
     def ordered_vertices_from_wire(wire):
@@ -393,6 +455,30 @@ class Topo(object):
         """
         return self._number_of_topo(self.ordered_edges_from_wire(wire))
 
+    def _ancestors_map(self, topo_type_a, topo_type_b):
+        r"""Map of the sub-shapes of type topo_type_a to their ancestors of type topo_type_b
+
+        The map is built once per (topo_type_a, topo_type_b) pair if the Topo is cached, at each call otherwise
+
+        Parameters
+        ----------
+        topo_type_a
+        topo_type_b
+
+        Returns
+        -------
+        OCC.TopTools.TopTools_IndexedDataMapOfShapeListOfShape
+
+        """
+        key = (topo_type_a, topo_type_b)
+        if self._cached and key in self._ancestors_maps_cache:
+            return self._ancestors_maps_cache[key]
+        _map = OCC.TopTools.TopTools_IndexedDataMapOfShapeListOfShape()
+        OCC.TopExp.topexp_MapShapesAndAncestors(self._my_shape, topo_type_a, topo_type_b, _map)
+        if self._cached:
+            self._ancestors_maps_cache[key] = _map
+        return _map
+
     def _map_shapes_and_ancestors(self, topo_type_a, topo_type_b, topological_entity):
         """Mapping of shapes to ancestors
 
@@ -412,9 +498,9 @@ class Topo(object):
 
         """
         topo_set = set()
-        _map = OCC.TopTools.TopTools_IndexedDataMapOfShapeListOfShape()
-        OCC.TopExp.topexp_MapShapesAndAncestors(self._my_shape, topo_type_a, topo_type_b, _map)
-        results = _map.FindFromKey(topological_entity)
+        # IsSame based map, used to skip the entities that only differ by their orientation
+        same_map = OCC.TopTools.TopTools_MapOfShape()
+        results = self._ancestors_map(topo_type_a, topo_type_b).FindFromKey(topological_entity)
         if results.IsEmpty():
             yield None
 
@@ -425,12 +511,7 @@ class Topo(object):
             # return the entity if not in set to insure we're not returning entities several times
             if topo_entity not in topo_set:
                 if self._ignore_orientation:
-                    unique = True
-                    for i in topo_set:
-                        if i.IsSame(topo_entity):
-                            unique = False
-                            break
-                    if unique:
+                    if same_map.Add(topo_entity):
                         yield topo_entity
                 else:
                     yield topo_entity
@@ -456,9 +537,7 @@ class Topo(object):
             The number of shape ancestors
         """
         topo_set = set()
-        _map = OCC.TopTools.TopTools_IndexedDataMapOfShapeListOfShape()
-        OCC.TopExp.topexp_MapShapesAndAncestors(self._my_shape, topo_type_a, topo_type_b, _map)
-        results = _map.FindFromKey(topological_entity)
+        results = self._ancestors_map(topo_type_a, topo_type_b).FindFromKey(topological_entity)
         if results.IsEmpty():
             return None  # left as is on purpose, maybe 0 would be a better return value
         topology_iterator = OCC.TopTools.TopTools_ListIteratorOfListOfShape(results)
@@ -467,6 +546,70 @@ class Topo(object):
             topology_iterator.Next()
         return len(topo_set)
 
+    def adjacency(self, topo_type_a, topo_type_b):
+        r"""Adjacency of the sub-shapes of type topo_type_a to their ancestors of type topo_type_b in CSR form
+
+        The adjacency is built from a single topexp_MapShapesAndAncestors pass (that is cached if the Topo is cached).
+        The ancestors of sources[i] are targets[j] for j in indices[indptr[i]:indptr[i + 1]].
+
+        Examples
+        --------
+        Face -> edge adjacency of a shape, as a scipy sparse matrix (faces in rows, edges in columns)
+
+        >>> indptr, indices, edges, faces = Topo(shape).adjacency(TopAbs_EDGE, TopAbs_FACE)
+        >>> m = scipy.sparse.csr_matrix((np.ones(len(indices)), indices, indptr), shape=(len(edges), len(faces))).T
+
+        Parameters
+        ----------
+        topo_type_a : TopAbs_ShapeEnum
+            Type of the sub-shapes (rows)
+        topo_type_b : TopAbs_ShapeEnum
+            Type of the ancestors (columns)
+
+        Returns
+        -------
+        indptr : numpy.ndarray
+            int32 array of length len(sources) + 1
+        indices : numpy.ndarray
+            int32 array of the ancestors indices, each ancestor appears at most once per row
+        sources : list of TopoDS_*
+            index -> sub-shape of type topo_type_a table
+        targets : list of TopoDS_*
+            index -> ancestor of type topo_type_b table
+
+        """
+        for topology_type in (topo_type_a, topo_type_b):
+            if topology_type not in aocutils.types.topo_type_class.keys():
+                msg = '%s not one of %s' % (topology_type, aocutils.types.topo_type_class.keys())
+                logger.critical(msg)
+                raise aocutils.exceptions.WrongTopologicalType(msg)
+
+        _map = self._ancestors_map(topo_type_a, topo_type_b)
+        downcast_a = aocutils.types.topo_factory[topo_type_a]
+        downcast_b = aocutils.types.topo_factory[topo_type_b]
+
+        # indexes the ancestors as they are met, using IsSame semantics
+        targets_map = OCC.TopTools.TopTools_IndexedMapOfShape()
+        nb_sources = _map.Extent()
+        indptr = np.zeros(nb_sources + 1, dtype=np.int32)
+        indices = list()
+        sources = list()
+        for i in range(1, nb_sources + 1):
+            sources.append(downcast_a(_map.FindKey(i)))
+            row = set()
+            topology_iterator = OCC.TopTools.TopTools_ListIteratorOfListOfShape(_map.FindFromIndex(i))
+            while topology_iterator.More():
+                # TopTools_IndexedMapOfShape indices start at 1
+                j = targets_map.Add(topology_iterator.Value()) - 1
+                if j not in row:
+                    row.add(j)
+                    indices.append(j)
+                topology_iterator.Next()
+            indptr[i] = len(indices)
+
+        targets = [downcast_b(targets_map.FindKey(j)) for j in range(1, targets_map.Extent() + 1)]
+        return indptr, np.array(indices, dtype=np.int32), sources, targets
+
     # ======================================================================
     # Edge <-> Face
     # ======================================================================
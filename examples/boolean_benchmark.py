@@ -0,0 +1,67 @@
+#!/usr/bin/python
+# coding: utf-8
+
+r"""boolean_benchmark.py
+
+Cut a grid of holes from a plate : sequential BRepAlgoAPI_Cut loop vs a single batch cut,
+and fuse a row of cubes : sequential loop vs fuse_all()
+
+"""
+
+from __future__ import print_function
+
+import time
+
+import OCC.BRepPrimAPI
+import OCC.gp
+
+import aocutils.operations.boolean
+
+
+def holes(n, pitch=2., radius=0.5, height=2.):
+    r"""n x n cylinders on a grid"""
+    return [OCC.BRepPrimAPI.BRepPrimAPI_MakeCylinder(OCC.gp.gp_Ax2(OCC.gp.gp_Pnt(pitch * (i + 0.5),
+                                                                                 pitch * (j + 0.5), -0.5),
+                                                                   OCC.gp.gp_Dir(0, 0, 1)), radius, height).Shape()
+            for i in range(n) for j in range(n)]
+
+
+def cubes(n):
+    r"""n overlapping unit cubes along x"""
+    return [OCC.BRepPrimAPI.BRepPrimAPI_MakeBox(OCC.gp.gp_Pnt(0.5 * i, 0, 0), 1, 1, 1).Shape() for i in range(n)]
+
+
+def timed(label, func, *args, **kwargs):
+    start = time.time()
+    result = func(*args, **kwargs)
+    print("%-40s %8.2f s" % (label, time.time() - start))
+    return result
+
+
+def sequential_cut(shape, tools):
+    for tool in tools:
+        shape = aocutils.operations.boolean.cut(shape, tool)
+    return shape
+
+
+def sequential_fuse(shapes):
+    shape = shapes[0]
+    for other in shapes[1:]:
+        shape = aocutils.operations.boolean.fuse(shape, other)
+    return shape
+
+
+if __name__ == '__main__':
+    n = 15
+    plate = OCC.BRepPrimAPI.BRepPrimAPI_MakeBox(2. * n, 2. * n, 1.).Shape()
+    tools = holes(n)
+    timed("sequential cut (%i holes)" % len(tools), sequential_cut, plate, tools)
+    timed("batch cut (%i holes)" % len(tools), aocutils.operations.boolean.cut, plate, tools)
+
+    shapes = cubes(100)
+    timed("sequential fuse (%i cubes)" % len(shapes), sequential_fuse, shapes)
+    timed("fuse_all (%i cubes)" % len(shapes), aocutils.operations.boolean.fuse_all, shapes)
+    timed("fuse_all, chunks of 10 (%i cubes)" % len(shapes), aocutils.operations.boolean.fuse_all, shapes,
+          chunk_size=10)
+    timed("fuse_all, chunks of 10, 4 processes", aocutils.operations.boolean.fuse_all, shapes, chunk_size=10,
+          processes=4)
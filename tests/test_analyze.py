@@ -6,8 +6,11 @@ r"""analyze package tests"""
 import pytest
 import math
 
+import numpy as np
+
 import OCC.gp
 import OCC.TopAbs
+import OCC.TopLoc
 
 import aocutils.primitives
 import aocutils.tolerance
@@ -17,12 +20,15 @@ import aocutils.exceptions
 import aocutils.brep.edge_make
 import aocutils.brep.wire_make
 import aocutils.brep.face_make
+import aocutils.brep.compound_make
 
 
 import aocutils.analyze.bounds
 import aocutils.analyze.distance
 import aocutils.analyze.global_
 import aocutils.analyze.inclusion
+import aocutils.analyze.report
+import aocutils.analyze.spatial
 
 box_dim_x = 10.
 box_dim_y = 20.
@@ -82,6 +88,124 @@ def test_bounds_sphere_boundingbox_middle():
     assert bb.centre.Z() < tol / 10.
 
 
+def test_bounds_options_and_cache(monkeypatch):
+    r"""Bounding box options and cache"""
+    aocutils.analyze.bounds.clear_cache()
+    aocutils.analyze.bounds.BoundingBox(box)
+    assert len(aocutils.analyze.bounds._cache_entries) == 0
+
+    bb = aocutils.analyze.bounds.BoundingBox(box, use_cache=True)
+    assert len(aocutils.analyze.bounds._cache_entries) == 1
+    assert aocutils.analyze.bounds.BoundingBox(box, use_cache=True).as_tuple == bb.as_tuple
+    assert len(aocutils.analyze.bounds._cache_entries) == 1
+
+    # the same box somewhere else is another cache entry
+    trsf = OCC.gp.gp_Trsf()
+    trsf.SetTranslation(OCC.gp.gp_Vec(100, 0, 0))
+    moved_bb = aocutils.analyze.bounds.BoundingBox(box.Moved(OCC.TopLoc.TopLoc_Location(trsf)), use_cache=True)
+    assert abs(moved_bb.x_min - bb.x_min - 100.) < tol
+    assert len(aocutils.analyze.bounds._cache_entries) == 2
+
+    not_cached_bb = aocutils.analyze.bounds.BoundingBox(box)
+    assert not_cached_bb.as_tuple == bb.as_tuple
+    assert not not_cached_bb.bnd_box.IsOut(OCC.gp.gp_Pnt(1., 1., 1.))
+
+    geometric_bb = aocutils.analyze.bounds.BoundingBox(sphere, use_triangulation=False)
+    assert 2 * sphere_radius <= geometric_bb.x_span
+    optimal_bb = aocutils.analyze.bounds.BoundingBox(box, tol=0., optimal=True)
+    assert box_dim_x - tol <= optimal_bb.x_span <= box_dim_x + tol
+
+    # meshing a shape changes its triangulation state : its cached box is not reused
+    aocutils.analyze.bounds.clear_cache()
+    new_sphere = aocutils.primitives.sphere(OCC.gp.gp_Pnt(0, 0, 0), sphere_radius)
+    aocutils.analyze.bounds.BoundingBox(new_sphere, use_cache=True)
+    aocutils.mesh.mesh(new_sphere, factor=10.)
+    aocutils.analyze.bounds.BoundingBox(new_sphere, use_cache=True)
+    assert len(aocutils.analyze.bounds._cache_entries) == 2
+
+    # the oldest entries are dropped when the cache is full
+    monkeypatch.setattr(aocutils.analyze.bounds, "_CACHE_MAX_SIZE", 2)
+    aocutils.analyze.bounds.BoundingBox(box, use_cache=True)
+    assert len(aocutils.analyze.bounds._cache_entries) == 2
+    assert aocutils.analyze.bounds._cache_entries[-1][1] is box
+    assert sum(len(bucket) for bucket in aocutils.analyze.bounds._cache.values()) == 2
+
+    aocutils.analyze.bounds.clear_cache()
+    assert len(aocutils.analyze.bounds._cache) == 0
+    assert len(aocutils.analyze.bounds._cache_entries) == 0
+
+
+def test_bounds_cache_callers():
+    r"""Repeated bounding box tests and meshing reuse the cached box"""
+    aocutils.analyze.bounds.clear_cache()
+    new_box = aocutils.primitives.box(box_dim_x, box_dim_y, box_dim_z)
+    for _ in range(3):
+        assert aocutils.analyze.inclusion.point_in_boundingbox(new_box, OCC.gp.gp_Pnt(1., 1., 1.))
+    assert len(aocutils.analyze.bounds._cache_entries) == 1
+
+    # mesh() reuses the cached box, the meshed shape (new triangulation state) gets its own entry
+    aocutils.mesh.mesh(new_box, factor=10.)
+    assert len(aocutils.analyze.bounds._cache_entries) == 1
+    assert aocutils.analyze.inclusion.point_in_boundingbox(new_box, OCC.gp.gp_Pnt(1., 1., 1.))
+    assert len(aocutils.analyze.bounds._cache_entries) == 2
+    aocutils.analyze.bounds.clear_cache()
+
+
+def test_point_in_solid_cached_prefilter():
+    r"""Repeated point_in_solid calls compute the bounding box of the shape once"""
+    aocutils.analyze.bounds.clear_cache()
+    new_box = aocutils.primitives.box(box_dim_x, box_dim_y, box_dim_z)
+    assert aocutils.analyze.inclusion.point_in_solid(new_box, OCC.gp.gp_Pnt(1., 1., 1.)) == True
+    assert aocutils.analyze.inclusion.point_in_solid(new_box, OCC.gp.gp_Pnt(-1., 1., 1.)) == False
+    assert aocutils.analyze.inclusion.point_in_solid(new_box, OCC.gp.gp_Pnt(2., 2., 2.)) == True
+    assert len(aocutils.analyze.bounds._cache_entries) == 1
+    aocutils.analyze.bounds.clear_cache()
+
+
+def test_oriented_bounding_box():
+    r"""Oriented bounding box of a rotated box"""
+    trsf = OCC.gp.gp_Trsf()
+    trsf.SetRotation(OCC.gp.gp_Ax1(OCC.gp.gp_Pnt(0, 0, 0), OCC.gp.gp_Dir(0, 0, 1)), math.pi / 6.)
+    rotated_box = aocutils.primitives.box(box_dim_x, box_dim_y, box_dim_z).Moved(OCC.TopLoc.TopLoc_Location(trsf))
+
+    obb = aocutils.analyze.bounds.OrientedBoundingBox(rotated_box, tol=0.)
+    assert np.allclose(sorted(2 * obb.half_sizes), [box_dim_x, box_dim_y, box_dim_z], atol=1e-6)
+    assert abs(obb.volume - box_dim_x * box_dim_y * box_dim_z) < 1e-3
+    assert obb.corners.shape == (8, 3)
+    assert obb.volume < aocutils.analyze.bounds.BoundingBox(rotated_box).x_span * \
+        aocutils.analyze.bounds.BoundingBox(rotated_box).y_span * box_dim_z
+
+
+def test_bounding_box_tree():
+    r"""Spatial index over the faces of the box"""
+    tree = aocutils.analyze.spatial.BoundingBoxTree.from_shape(box, OCC.TopAbs.TopAbs_FACE, leaf_size=2)
+    assert len(tree) == 6
+    assert tree.boxes.shape == (6, 6)
+
+    # the centre of the box is in no face box, a corner is in 3 face boxes
+    point_indices, shape_indices = tree.query_points([[box_dim_x / 2., box_dim_y / 2., box_dim_z / 2.],
+                                                      [0., 0., 0.]])
+    assert point_indices.tolist() == [1, 1, 1]
+    assert len(set(shape_indices.tolist())) == 3
+
+    # a box overlapping the x_max side only
+    assert len(tree.query_box([box_dim_x - 1., 1., 1., box_dim_x + 1., 2., 2.])) == 1
+
+    # a ray along x through the middle of the box hits the x_min face first, then the x_max face
+    shape_indices, entry_parameters = tree.query_ray([-10., box_dim_y / 2., box_dim_z / 2.], [1., 0., 0.])
+    assert len(shape_indices) == 2
+    assert abs(entry_parameters[0] - 10.) < 2 * tol
+    assert abs(entry_parameters[1] - 10. - box_dim_x) < 2 * tol
+    assert tree.query_ray([-10., box_dim_y / 2., box_dim_z / 2.], [-1., 0., 0.])[0].size == 0
+
+    # above the box, the face z = box_dim_z comes first and the face z = 0 cannot be the closest
+    shape_indices, lower_bounds = tree.nearest_candidates([box_dim_x / 2., box_dim_y / 2., box_dim_z + 5.])
+    assert np.allclose(tree.boxes[shape_indices[0], [2, 5]], box_dim_z, atol=2 * tol)
+    assert abs(lower_bounds[0] - 5.) < 2 * tol
+    assert len(shape_indices) == 5
+    assert np.all(np.diff(lower_bounds) >= 0)
+
+
 def test_minimum_distance():
     md = aocutils.analyze.distance.MinimumDistance(sphere, sphere_2)
     assert md.minimum_distance == 20.
@@ -89,6 +213,46 @@ def test_minimum_distance():
     assert type(md.point_pairs[0][0]) == OCC.gp.gp_Pnt
 
 
+def test_minimum_distances():
+    r"""All pairs minimum distances with pruning"""
+    sphere_3 = aocutils.primitives.sphere(OCC.gp.gp_Pnt(200, 0, 0), sphere_radius)
+    shapes = [sphere, sphere_2, sphere_3]
+
+    pairs, distances, points = aocutils.analyze.distance.minimum_distances(shapes)
+    assert pairs.tolist() == [[0, 1], [0, 2], [1, 2]]
+    assert np.allclose(distances, [20., 180., 140.])
+    assert points.shape == (3, 2, 3)
+    assert np.allclose(points[0], [[sphere_radius, 0, 0], [40 - sphere_radius, 0, 0]])
+
+    # sphere_3 is far from the others
+    assert aocutils.analyze.distance.candidate_pairs(shapes, threshold=30.).tolist() == [[0, 1]]
+    for processes in (None, 2):
+        pairs, distances, points = aocutils.analyze.distance.minimum_distances(shapes, threshold=30.,
+                                                                               processes=processes)
+        assert pairs.tolist() == [[0, 1]]
+        assert np.allclose(distances, [20.])
+
+    matrix = aocutils.analyze.distance.distance_matrix(pairs, distances, len(shapes))
+    assert matrix.shape == (3, 3)
+    assert matrix[0, 1] == matrix[1, 0] == distances[0]
+    assert matrix[0, 2] == 0
+
+
+def test_minimum_distances_without_solution(monkeypatch):
+    r"""Pairs without minimum distance solution are dropped"""
+    class NoSolution(object):
+        minimum_distance = 0.
+        nb_solutions = 0
+        point_pairs = list()
+
+        def __init__(self, shape_1, shape_2):
+            pass
+
+    monkeypatch.setattr(aocutils.analyze.distance, "MinimumDistance", NoSolution)
+    pairs, distances, points = aocutils.analyze.distance.minimum_distances([sphere, sphere_2])
+    assert len(pairs) == len(distances) == len(points) == 0
+
+
 def test_global_properties_box():
     r"""Properties of a the box"""
 
@@ -197,3 +361,55 @@ def test_inclusion():
                                                                                  sphere_radius - 1.,
                                                                                  sphere_radius - 1.)) == False
     assert aocutils.analyze.inclusion.point_in_solid(sphere_shell, OCC.gp.gp_Pnt(sphere_radius, 0, 0)) == None
+
+
+def test_points_in_solid():
+    r"""Batched classification of points"""
+    points = np.array([[sphere_radius - 1., 0, 0],
+                       [sphere_radius - 1., sphere_radius - 1., sphere_radius - 1.],
+                       [sphere_radius, 0, 0],
+                       [100., 0, 0]])
+    expected = [OCC.TopAbs.TopAbs_IN, OCC.TopAbs.TopAbs_OUT, OCC.TopAbs.TopAbs_ON, OCC.TopAbs.TopAbs_OUT]
+
+    states = aocutils.analyze.inclusion.points_in_solid(sphere, points)
+    assert states.dtype == np.int8
+    assert states.tolist() == expected
+    assert aocutils.analyze.inclusion.points_in_solid(sphere, points, processes=2).tolist() == expected
+
+    with pytest.raises(aocutils.exceptions.WrongTopologicalType):
+        aocutils.analyze.inclusion.points_in_solid(edge, points)
+
+
+def test_global_properties_all():
+    r"""All properties from a single integration"""
+    box_properties = aocutils.analyze.global_.GlobalProperties(box, eps=1e-9)
+    assert box_properties.system is box_properties.system
+    assert box_properties.error is not None
+
+    properties = box_properties.properties()
+    assert properties["topo_type"] == "solid"
+    assert abs(properties["volume"] - box_dim_x * box_dim_y * box_dim_z) < 1e-6
+    assert np.allclose(properties["centre"], [box_dim_x / 2., box_dim_y / 2., box_dim_z / 2.])
+    assert properties["matrix_of_inertia"].shape == (3, 3)
+    assert properties["principal_moments"].shape == (3,)
+
+    all_properties = aocutils.analyze.global_.global_properties([box, sphere, edge])
+    assert [p["topo_type"] for p in all_properties] == ["solid", "solid", "edge"]
+    assert all_properties[2]["length"] == pytest.approx(square_side_length)
+    assert all_properties[2]["error"] is None
+
+
+def test_solids_report():
+    r"""Report on the solids of a compound, sequentially and in a pool of processes"""
+    assembly = aocutils.brep.compound_make.compound([box, sphere_2])
+    box_area = 2 * (box_dim_x * box_dim_y + box_dim_y * box_dim_z + box_dim_x * box_dim_z)
+    for processes in (None, 2):
+        report = aocutils.analyze.report.solids_report(assembly, processes=processes)
+        assert report["volume"].shape == (2,)
+        assert report["centre"].shape == (2, 3)
+        assert report["matrix_of_inertia"].shape == (2, 3, 3)
+        assert report["bounds"].shape == (2, 6)
+        assert abs(report["volume"][0] - box_dim_x * box_dim_y * box_dim_z) < 1e-6
+        assert abs(report["area"][0] - box_area) < 1e-6
+        assert np.allclose(report["centre"][1], [40, 0, 0], atol=1e-6)
+        assert np.allclose(report["bounds"][1], [30, -10, -10, 50, 10, 10], atol=2 * tol)
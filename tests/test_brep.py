@@ -6,14 +6,18 @@ r"""tests/test_brep.py
 
 
 import sys
+import math
 import pytest
 
+import numpy as np
+
 import OCC.BRepPrimAPI
 import OCC.Geom
 import OCC.gp
 import OCC.TopAbs
 import OCC.Adaptor3d
 import OCC.GeomLProp
+import OCC.TopoDS
 
 import aocutils.topology
 import aocutils.tolerance
@@ -24,6 +28,9 @@ import aocutils.brep.shell
 import aocutils.brep.wire
 import aocutils.brep.face
 import aocutils.brep.base
+import aocutils.brep.edge_make
+import aocutils.analyze.global_
+import aocutils.operations.interpolate
 import aocutils.exceptions
 
 
@@ -182,6 +189,156 @@ def test_edge_sphere(sphere_shape):
         my_edge.normal(9999.)
 
 
+def test_edge_batch_evaluation(sphere_shape):
+    r"""Batch evaluation of an Edge must match the scalar evaluation
+
+    Parameters
+    ----------
+    sphere_shape : TopoDS_Shape
+        Sphere shape (pytest fixture)
+
+    """
+    my_edge = aocutils.brep.edge.Edge(aocutils.topology.Topo(sphere_shape, return_iter=False).edges[1])
+    us = np.linspace(my_edge.domain_start, my_edge.domain_end, 11)
+
+    points = my_edge.parameters_to_points(us)
+    assert points.shape == (11, 3)
+    assert np.allclose(points[5], my_edge.parameter_to_point(us[5]).Coord())
+
+    tangents = my_edge.tangents(us)
+    assert np.allclose(np.linalg.norm(tangents, axis=1), 1.)
+    assert np.allclose(tangents[5], my_edge.tangent(us[5]).Coord())
+
+    assert np.allclose(my_edge.normals(us)[5], my_edge.normal(us[5]).Coord())
+    assert np.allclose(my_edge.curvatures(us), 1. / sphere_radius)
+    assert my_edge.derivatives(us, 2).shape == (11, 3)
+
+    with pytest.raises(aocutils.exceptions.ParameterOutOfDomainException):
+        my_edge.parameters_to_points([my_edge.domain_start, 9999.])
+
+
+def test_edge_projector():
+    r"""Bulk projection of points on a line segment, clamped to its ends"""
+    topods_edge = aocutils.brep.edge_make.edge(OCC.gp.gp_Pnt(0, 0, 0), OCC.gp.gp_Pnt(10, 0, 0))
+    edge = aocutils.brep.edge.Edge(topods_edge)
+    projector = edge.projector()
+    assert edge.projector() is projector
+
+    points = np.array([[2., 3., 0.], [5., 0., -4.], [-3., 4., 0.], [12., 0., 0.]])
+    parameters, feet, distances = projector.project(points)
+    assert np.allclose(feet, [[2., 0., 0.], [5., 0., 0.], [0., 0., 0.], [10., 0., 0.]], atol=1e-6)
+    assert np.allclose(distances, [3., 4., 5., 2.], atol=1e-6)
+    assert np.allclose([edge.parameter_to_point(u).X() for u in parameters], feet[:, 0], atol=1e-6)
+
+    u, pnt = edge.project_vertex(OCC.gp.gp_Pnt(2., 3., 0.))
+    assert abs(u - parameters[0]) < 1e-6
+    assert pnt.Distance(OCC.gp.gp_Pnt(2., 0., 0.)) < 1e-6
+
+    # beyond an end, project_vertex projects on the underlying (infinite) line, the projector on that end
+    u, pnt = edge.project_vertex(OCC.gp.gp_Pnt(12., 1., 0.))
+    assert abs(u - (edge.domain[1] + 2.)) < 1e-6
+    assert pnt.Distance(OCC.gp.gp_Pnt(12., 0., 0.)) < 1e-6
+    assert abs(projector.project_point(OCC.gp.gp_Pnt(12., 1., 0.)) - edge.domain[1]) < 1e-6
+
+    parameters_parallel, feet_parallel, distances_parallel = projector.project(points, processes=2)
+    assert np.allclose(parameters_parallel, parameters)
+    assert np.allclose(feet_parallel, feet)
+    assert np.allclose(distances_parallel, distances)
+
+
+def test_edge_arc_length():
+    r"""Arc length table of an edge"""
+    radius = 5.
+    circle = aocutils.brep.edge.Edge(aocutils.brep.edge_make.circle(OCC.gp.gp_Pnt(0, 0, 0), radius))
+    # a plain length query does not build the table
+    assert abs(circle.length() - 2. * math.pi * radius) < 1e-6
+    assert "_arc_length_table" not in circle._property_cache
+    assert np.allclose(circle.parameters_at_lengths([0., math.pi * radius / 2., 2. * math.pi * radius]),
+                       [0., math.pi / 2., 2. * math.pi], atol=1e-6)
+    assert np.allclose(circle.lengths_at_parameters([math.pi]), [math.pi * radius], atol=1e-6)
+    with pytest.raises(aocutils.exceptions.ParameterOutOfDomainException):
+        circle.parameters_at_lengths([-1.])
+    assert abs(circle.length() - 2. * math.pi * radius) < 1e-6
+    assert abs(circle.distance_on_curve(math.pi * radius / 2., math.pi, math.pi) - 3. * math.pi / 2.) < 1e-6
+    assert abs(circle.distance_on_curve(-math.pi * radius, math.pi, math.pi)) < 1e-6
+    with pytest.raises(aocutils.exceptions.ParameterOutOfDomainException):
+        circle.distance_on_curve(2. * math.pi * radius, math.pi, math.pi)
+
+    pnts = [OCC.gp.gp_Pnt(x, x ** 2 / 4., math.sin(x)) for x in np.linspace(0., 6., 12)]
+    spline = aocutils.brep.edge.Edge(aocutils.brep.edge_make.edge(
+        aocutils.operations.interpolate.points_to_bspline(pnts)))
+    first, last = spline.domain
+    us = np.linspace(first, last, 7)
+    expected = [spline.length(first, u) if u > first else 0. for u in us]
+    assert np.allclose(spline.lengths_at_parameters(us), expected, atol=1e-4)
+    assert np.allclose(spline.parameters_at_lengths(expected), us, atol=1e-4)
+
+    parameters, points = spline.uniform_points(11)
+    assert parameters[0] == first and parameters[-1] == last
+    assert np.allclose(np.diff(spline.lengths_at_parameters(parameters)), spline.length() / 10.)
+    assert len(spline.divide_by_number_of_points(11)) == 11
+
+    # many oscillations of the speed along the curve
+    pnts = [OCC.gp.gp_Pnt(x, math.sin(4. * x), 0.) for x in np.linspace(0., 30., 240)]
+    wavy = aocutils.brep.edge.Edge(aocutils.brep.edge_make.edge(
+        aocutils.operations.interpolate.points_to_bspline(pnts)))
+    first, last = wavy.domain
+    us = np.linspace(first, last, 23)
+    expected = [wavy.length(first, u) if u > first else 0. for u in us]
+    assert np.allclose(wavy.lengths_at_parameters(us), expected, rtol=0., atol=1e-5)
+    assert np.allclose(wavy.length(), expected[-1], rtol=0., atol=1e-5)
+
+    # divide_by_number_of_points integrates the spacing
+    parameters = [parameter for parameter, _ in wavy.divide_by_number_of_points(9)]
+    steps = [wavy.length(a, b) for a, b in zip(parameters[:-1], parameters[1:])]
+    assert np.allclose(steps, wavy.length() / 8., rtol=0., atol=1e-5)
+
+
+def test_edge_discretize():
+    r"""Discretization of a circle edge in the three modes"""
+    radius = 5.
+    circle = aocutils.brep.edge.Edge(aocutils.brep.edge_make.circle(OCC.gp.gp_Pnt(0, 0, 0), radius))
+
+    for mode in [aocutils.brep.edge.DISCRETIZE_DEFLECTION, aocutils.brep.edge.DISCRETIZE_TANGENTIAL]:
+        points = circle.discretize(mode, deflection=1e-2)
+        assert points.shape[1] == 3 and len(points) > 4
+        assert np.allclose(np.linalg.norm(points, axis=1), radius)
+        # sagitta of the chords
+        chords = np.linalg.norm(np.diff(points, axis=0), axis=1)
+        assert np.all(radius - np.sqrt(radius ** 2 - (chords / 2.) ** 2) <= 1e-2 + 1e-9)
+
+    points = circle.discretize(aocutils.brep.edge.DISCRETIZE_ABSCISSA, n_pts=5)
+    assert np.allclose(points[[0, -1]], points[[-1, 0]])
+    assert np.allclose(np.linalg.norm(np.diff(points, axis=0), axis=1), radius * math.sqrt(2.))
+    assert np.allclose(circle.points_from_tangential_deflection(),
+                       circle.discretize(aocutils.brep.edge.DISCRETIZE_TANGENTIAL))
+
+    with pytest.raises(ValueError):
+        circle.discretize(aocutils.brep.edge.DISCRETIZE_ABSCISSA)
+    with pytest.raises(ValueError):
+        circle.discretize("unknown")
+
+
+def test_cached_properties(sphere_shape):
+    r"""Derived properties are computed once and forgotten when the wrapped instance changes"""
+    edge = aocutils.brep.edge.Edge(aocutils.topology.Topo(sphere_shape, return_iter=False).edges[0])
+    assert edge.adaptor is edge.adaptor
+    assert edge.brep_local_props is edge.brep_local_props
+    assert edge.domain == edge.domain
+
+    face = aocutils.brep.face.Face(aocutils.topology.Topo(sphere_shape, return_iter=False).faces[0])
+    assert face.surface_handle is face.surface_handle
+    assert face.adaptor_handle is face.adaptor_handle
+
+    my_vertex = aocutils.brep.vertex.Vertex(1., 2., -2.6)
+    old_vertex = my_vertex.wrapped_instance
+    my_vertex._property_cache['dummy'] = 1
+    my_vertex.x = 3.
+    assert my_vertex.wrapped_instance is not old_vertex
+    assert my_vertex._property_cache == dict()
+    assert aocutils.brep.vertex.Vertex.to_pnt(my_vertex.wrapped_instance).X() == 3.
+
+
 def test_face_flat(box_shape):
     r"""aocutils flat Face test
 
@@ -266,6 +423,104 @@ def test_face_flat(box_shape):
     assert isinstance(my_face.tangent(u_domain_middle, v_domain_middle)[1], OCC.gp.gp_Vec)
 
 
+def test_face_batch_evaluation(sphere_shape):
+    r"""Grid and scattered evaluation of a spherical Face
+
+    Parameters
+    ----------
+    sphere_shape : TopoDS_Shape
+        Sphere shape (pytest fixture)
+
+    """
+    my_face = aocutils.brep.face.Face(aocutils.topology.Topo(sphere_shape, return_iter=False).faces[0])
+
+    grid = my_face.evaluate_grid(5, 7)
+    assert grid['uv'].shape == (5, 7, 2)
+    assert grid['points'].shape == (5, 7, 3)
+    assert grid['normals'].shape == (5, 7, 3)
+    assert grid['gaussian_curvature'].shape == (5, 7)
+    # all the points lie on the sphere
+    assert np.allclose(np.linalg.norm(grid['points'], axis=2), sphere_radius)
+
+    u_min, u_max, v_min, v_max = my_face.domain
+    uv = np.array([[(u_min + u_max) / 2., (v_min + v_max) / 2.], [u_min + 0.1, v_min + 0.2]])
+    scattered = my_face.evaluate(uv)
+    assert np.allclose(scattered['points'][0], my_face.parameter_to_point(*uv[0]).Coord())
+    assert np.allclose(np.abs(scattered['mean_curvature']), 1. / sphere_radius)
+    assert np.allclose(scattered['gaussian_curvature'], 1. / sphere_radius ** 2)
+
+    with pytest.raises(aocutils.exceptions.ParameterOutOfDomainException):
+        my_face.evaluate([[u_max + 1., v_min]])
+
+
+def test_geodesic_paths(sphere_shape):
+    r"""Geodesics between points at 45 degrees of latitude bend towards the pole"""
+    face = aocutils.brep.face.Face(aocutils.topology.Topo(sphere_shape, return_iter=False).faces[0])
+    c = sphere_radius * math.cos(math.pi / 4.)
+    # longitudes 30 and 120 degrees : the paths stay away from the seam of the sphere (longitude 0)
+    longitude_a, longitude_b = math.radians(30.), math.radians(120.)
+    pnts_a = [OCC.gp.gp_Pnt(c * math.cos(longitude_a), c * math.sin(longitude_a), z) for z in (c, -c)]
+    pnts_b = [OCC.gp.gp_Pnt(c * math.cos(longitude_b), c * math.sin(longitude_b), z) for z in (c, -c)]
+
+    edges = aocutils.brep.edge_make.geodesic_paths(pnts_a, pnts_b, face, n_segments=10, _tolerance=1e-3, n_iter=200)
+    assert len(edges) == 2
+    parallel_arc_length = c * math.pi / 2.
+    great_circle_length = sphere_radius * math.pi / 3.
+    for edge, pnt_a, pnt_b in zip(edges, pnts_a, pnts_b):
+        wrapped_edge = aocutils.brep.edge.Edge(edge)
+        first, last = wrapped_edge.domain
+        assert wrapped_edge.parameter_to_point(first).Distance(pnt_a) < 1e-6
+        assert wrapped_edge.parameter_to_point(last).Distance(pnt_b) < 1e-6
+        length = aocutils.analyze.global_.GlobalProperties(edge).length
+        assert great_circle_length - 1e-2 < length < parallel_arc_length - 0.5
+
+    edge = aocutils.brep.edge_make.geodesic_path(pnts_a[0], pnts_b[0], face)
+    assert isinstance(edge, OCC.TopoDS.TopoDS_Edge)
+
+
+def test_geodesic_paths_across_seam(sphere_shape):
+    r"""Geodesics between longitudes -45 and 45 degrees cross the seam of the sphere (longitude 0)"""
+    face = aocutils.brep.face.Face(aocutils.topology.Topo(sphere_shape, return_iter=False).faces[0])
+    c = sphere_radius * math.cos(math.pi / 4.)
+    longitude_a, longitude_b = math.radians(-45.), math.radians(45.)
+    pnts_a = [OCC.gp.gp_Pnt(c * math.cos(longitude_a), c * math.sin(longitude_a), z) for z in (c, -c)]
+    pnts_b = [OCC.gp.gp_Pnt(c * math.cos(longitude_b), c * math.sin(longitude_b), z) for z in (c, -c)]
+
+    edges = aocutils.brep.edge_make.geodesic_paths(pnts_a, pnts_b, face, n_segments=10, _tolerance=1e-3, n_iter=200)
+    parallel_arc_length = c * math.pi / 2.
+    great_circle_length = sphere_radius * math.pi / 3.
+    for edge, pnt_a, pnt_b in zip(edges, pnts_a, pnts_b):
+        wrapped_edge = aocutils.brep.edge.Edge(edge)
+        first, last = wrapped_edge.domain
+        assert wrapped_edge.parameter_to_point(first).Distance(pnt_a) < 1e-6
+        assert wrapped_edge.parameter_to_point(last).Distance(pnt_b) < 1e-6
+        # the short way goes through x > 0, the long way round through x < 0
+        assert wrapped_edge.parameter_to_point((first + last) / 2.).X() > 0.
+        length = aocutils.analyze.global_.GlobalProperties(edge).length
+        assert great_circle_length - 1e-2 < length < parallel_arc_length - 0.5
+
+
+def test_face_projector(sphere_shape):
+    r"""Bulk projection of points on a sphere face"""
+    face = aocutils.brep.face.Face(aocutils.topology.Topo(sphere_shape, return_iter=False).faces[0])
+    projector = face.projector()
+    assert face.projector() is projector
+
+    angles = np.linspace(0.1, 1.4, 20)
+    points = (sphere_radius + 2.) * np.column_stack([np.cos(angles), np.sin(angles), np.zeros_like(angles)])
+    uv, projected, distances = projector.project(points)
+    assert uv.shape == (20, 2)
+    assert np.allclose(distances, 2., atol=1e-6)
+    assert np.allclose(np.linalg.norm(projected, axis=1), sphere_radius, atol=1e-6)
+
+    uv_warm, projected_warm, _ = projector.project(points, warm_start=True)
+    assert np.allclose(uv_warm, uv, atol=1e-6)
+    assert np.allclose(projected_warm, projected, atol=1e-6)
+
+    u, v = face.point_to_parameter(OCC.gp.gp_Pnt(*points[0]))
+    assert np.allclose((u, v), uv[0], atol=1e-6)
+
+
 def test_wire(box_shape):
     r"""aocutils Wire test
 
@@ -293,6 +548,24 @@ def test_wire(box_shape):
     assert issubclass(curve.__class__, OCC.Geom.Geom_Curve)
 
 
+def test_wire_discretize(box_shape):
+    r"""Polyline of a closed wire of 4 edges"""
+    face = aocutils.topology.Topo(box_shape, return_iter=False).faces[0]
+    wire = aocutils.brep.wire.Wire(aocutils.topology.Topo(face, return_iter=False).wires[0])
+
+    points = wire.discretize(aocutils.brep.edge.DISCRETIZE_ABSCISSA, n_pts=3)
+    # 3 points per edge, the 4 vertices are not duplicated, the polyline is not closed back
+    assert points.shape == (8, 3)
+    assert len(np.unique(np.round(points, 6), axis=0)) == 8
+    # consecutive points are half an edge apart
+    steps = np.linalg.norm(np.diff(np.vstack([points, points[:1]]), axis=0), axis=1)
+    assert np.all(np.isclose(steps, box_y_dim / 2.) | np.isclose(steps, box_z_dim / 2.))
+
+    # straight edges are discretized by their ends
+    corners = wire.discretize()
+    assert corners.shape == (4, 3)
+
+
 def test_vertex(box_shape):
     r"""aocutils Vertex test
 
@@ -0,0 +1,36 @@
+#!/usr/bin/python
+# coding: utf-8
+
+r"""collections.py tests"""
+
+import numpy as np
+
+import OCC.gp
+
+import aocutils.collections
+
+
+def test_array_conversions():
+    r"""NumPy arrays to TCol* arrays and back"""
+    points = np.arange(12, dtype=np.float64).reshape(4, 3)
+    pts = aocutils.collections.array_to_tcolgp_array1_of_pnt(points)
+    assert (pts.Lower(), pts.Upper()) == (0, 3)
+    assert pts.Value(2).IsEqual(OCC.gp.gp_Pnt(6., 7., 8.), 0.)
+    assert np.array_equal(aocutils.collections.tcolgp_array1_of_pnt_to_array(pts), points)
+    pts = aocutils.collections.point_list_to_tcolgp_array1_of_pnt(points)
+    assert np.array_equal(aocutils.collections.tcolgp_array1_of_pnt_to_array(pts), points)
+
+    points_2d = points[:, :2]
+    pts_2d = aocutils.collections.array_to_tcolgp_array1_of_pnt2d(points_2d, start_at_one=True)
+    assert (pts_2d.Lower(), pts_2d.Upper()) == (1, 4)
+    assert np.array_equal(aocutils.collections.tcolgp_array1_of_pnt2d_to_array(pts_2d), points_2d)
+
+    reals = aocutils.collections.array_to_tcolstd_array1_of_real([0.5, 1.5, 2.5])
+    assert reals.Value(1) == 1.5
+    assert np.array_equal(aocutils.collections.tcolstd_array1_of_real_to_array(reals), [0.5, 1.5, 2.5])
+
+    grid = np.arange(24, dtype=np.float64).reshape(2, 4, 3)
+    pts_2 = aocutils.collections.array_to_tcolgp_array2_of_pnt(grid)
+    assert (pts_2.ColLength(), pts_2.RowLength()) == (2, 4)
+    assert pts_2.Value(2, 3).IsEqual(OCC.gp.gp_Pnt(*grid[1, 2]), 0.)
+    assert np.array_equal(aocutils.collections.tcolgp_array2_of_pnt_to_array(pts_2), grid)
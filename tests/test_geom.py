@@ -8,14 +8,18 @@ import sys
 
 import pytest
 
+import numpy as np
+
 import OCC.BRepPrimAPI
 import OCC.Geom
+import OCC.gp
 
 import aocutils.brep.wire
 import aocutils.topology
 import aocutils.geom.curve
 import aocutils.geom.point
 import aocutils.geom.vector
+import aocutils.exceptions
 
 PY3 = not (int(sys.version.split('.')[0]) <= 2)
 
@@ -96,3 +100,41 @@ def test_divide_vector_by_norm():
 
     assert v1.norm - 1e-5 <= v1.norm <= v1.norm + 1e-5
 
+
+def test_point_array():
+    points = aocutils.geom.point.PointArray([[0, 0, 0], [10, -5, 0]])
+    assert len(points) == 2
+    assert points.array.dtype == np.float64
+    assert np.array_equal(points.midpoints([[10, 0, 0], [0, 5, 0]]).array, [[5, 0, 0], [5, 0, 0]])
+    assert np.array_equal(points.translate([1, 1, 1]).y, [1, -4])
+    assert np.allclose(points.distances([0, 0, 0]), [0, 125 ** .5])
+    assert (points == [[0, 0, 0], [10, -5, 1]]).tolist() == [True, False]
+
+    gp_pnts = points.to_gp()
+    assert isinstance(gp_pnts[1], OCC.gp.gp_Pnt)
+    assert gp_pnts[1].IsEqual(OCC.gp.gp_Pnt(10, -5, 0), 0.)
+    assert np.array_equal(aocutils.geom.point.PointArray.from_gp(gp_pnts).array, points.array)
+    assert np.array_equal(aocutils.geom.point.PointArray.from_tcolgp(points.to_tcolgp()).array, points.array)
+
+    vectors = points - [[1, 0, 0], [0, 0, 0]]
+    assert isinstance(vectors, aocutils.geom.vector.VectorArray)
+    assert np.array_equal(vectors.array, [[-1, 0, 0], [10, -5, 0]])
+
+
+def test_vector_array():
+    v1 = aocutils.geom.vector.VectorArray([[3, 4, 0], [1, 0, 0]])
+    v2 = aocutils.geom.vector.VectorArray([[0, 0, 2], [0, 1, 0]])
+    assert np.array_equal(v1.norms, [5, 1])
+    assert np.allclose(v1.normalized().norms, 1)
+    assert np.array_equal(v1.dot(v2), [0, 0])
+    assert np.array_equal(v1.perpendicular(v2).array, [[8, -6, 0], [0, 0, 1]])
+    assert v1.is_perpendicular(v2).tolist() == [True, True]
+    assert v1.is_perpendicular([1, 0, 0]).tolist() == [False, False]
+    assert np.array_equal((v1 + v2).array, [[3, 4, 2], [1, 1, 0]])
+    assert np.array_equal((v1 - v2).array, [[3, 4, -2], [1, -1, 0]])
+    assert np.array_equal((v1 * 2).array, [[6, 8, 0], [2, 0, 0]])
+    assert np.array_equal((v1 / v1.norms).norms, [1, 1])
+
+    with pytest.raises(aocutils.exceptions.ZeroNormVectorException):
+        v1.perpendicular([0, 0, 0])
+    assert isinstance(v1.to_gp()[0], OCC.gp.gp_Vec)
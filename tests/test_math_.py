@@ -26,3 +26,10 @@ def test_smooth_pnts():
     assert len(smoothed_numbers) == 100
     # smoothed_points = occutils.math_.smooth_pnts(list_gp_pnt)
 
+
+def test_smooth_array():
+    polylines = np.random.random((3, 10, 3))
+    smoothed = aocutils.math_.smooth_array(polylines)
+    assert smoothed.shape == (3, 10, 3)
+    assert np.array_equal(smoothed[:, [0, -1]], polylines[:, [0, -1]])
+    assert np.allclose(smoothed[:, 1], polylines[:, :3].mean(axis=1))
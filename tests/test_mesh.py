@@ -0,0 +1,121 @@
+#!/usr/bin/python
+# coding: utf-8
+
+r"""mesh.py tests"""
+
+import numpy as np
+import pytest
+
+import OCC.BRep
+import OCC.BRepPrimAPI
+import OCC.gp
+import OCC.TopAbs
+import OCC.TopLoc
+
+import aocutils.analyze.distance
+import aocutils.analyze.inclusion
+import aocutils.brep.base
+import aocutils.brep.compound_make
+import aocutils.parallel
+import aocutils.mesh
+import aocutils.topology
+
+
+def _all_faces_triangulated(shape):
+    for face in aocutils.topology.Topo(shape, return_iter=False).faces:
+        if OCC.BRep.BRep_Tool_Triangulation(face, OCC.TopLoc.TopLoc_Location()).IsNull():
+            return False
+    return True
+
+
+def test_mesh_parallel():
+    r"""Mesh with OCC parallel threads"""
+    box = OCC.BRepPrimAPI.BRepPrimAPI_MakeBox(10, 20, 30).Shape()
+    meshed = aocutils.mesh.mesh(box, factor=100., angular_deflection=0.3, parallel=True)
+    assert meshed is box
+    assert _all_faces_triangulated(box)
+
+
+def test_mesh_process_pool():
+    r"""Mesh the solids of a compound in a pool of processes"""
+    box = OCC.BRepPrimAPI.BRepPrimAPI_MakeBox(10, 20, 30).Shape()
+    sphere = OCC.BRepPrimAPI.BRepPrimAPI_MakeSphere(OCC.gp.gp_Pnt(50, 0, 0), 10).Shape()
+    assembly = aocutils.brep.compound_make.compound([box, sphere])
+
+    meshed = aocutils.mesh.mesh(assembly, factor=100., processes=2)
+    assert meshed.ShapeType() == OCC.TopAbs.TopAbs_COMPOUND
+    assert aocutils.topology.Topo(meshed).number_of_solids == 2
+    assert _all_faces_triangulated(meshed)
+
+    original = aocutils.brep.compound_make.compound([box, sphere])
+    base = aocutils.brep.base.BaseObject(original)
+    bounding_box = base.bounding_box
+    meshed = base.mesh(factor=100., processes=2)
+    assert base.is_meshed is True
+    assert base.bounding_box is bounding_box
+    # the wrapped instance is replaced by the meshed compound, which is returned
+    assert meshed is base.wrapped_instance
+    assert not meshed.IsSame(original)
+    assert _all_faces_triangulated(meshed)
+
+    # same options : not meshed again
+    assert base.mesh(factor=100., processes=2) is meshed
+    # any changed option triggers a new meshing
+    assert base.mesh(factor=100., angular_deflection=0.2, processes=2) is not meshed
+
+
+def test_shape_serialization():
+    r"""BRep string round trip"""
+    box = OCC.BRepPrimAPI.BRepPrimAPI_MakeBox(10, 20, 30).Shape()
+    shape = aocutils.parallel.shape_from_string(aocutils.parallel.shape_to_string(box))
+    assert aocutils.topology.Topo(shape).number_of_faces == 6
+
+
+def test_pool_map_shapes():
+    r"""Shapes sent to and returned from a pool of processes"""
+    box = OCC.BRepPrimAPI.BRepPrimAPI_MakeBox(10, 20, 30).Shape()
+    other_box = OCC.BRepPrimAPI.BRepPrimAPI_MakeBox(OCC.gp.gp_Pnt(15, 0, 0), 10, 20, 30).Shape()
+
+    # a tuple of shapes is passed as several arguments
+    results = aocutils.parallel.pool_map_shapes(aocutils.analyze.distance._pair_distance, [(box, other_box)],
+                                                processes=2)
+    assert abs(results[0][0] - 5.) < 1e-6
+
+    # shapes returned by the function are deserialized
+    meshed = aocutils.parallel.pool_map_shapes(aocutils.mesh._mesh_shape, [box, other_box], (1., False, 0.5, False),
+                                               processes=2)
+    assert len(meshed) == 2
+    assert all(_all_faces_triangulated(shape) for shape in meshed)
+
+    states = aocutils.parallel.pool_map_chunks(aocutils.analyze.inclusion._classify, box,
+                                               np.array([[1., 1., 1.], [-1., 1., 1.], [5., 5., 5.]]), (1e-6,),
+                                               processes=2)
+    assert states.tolist() == [OCC.TopAbs.TopAbs_IN, OCC.TopAbs.TopAbs_OUT, OCC.TopAbs.TopAbs_IN]
+
+    with pytest.raises(ValueError):
+        aocutils.parallel.pool_map_shapes(aocutils.mesh._mesh_shape, [box], (1., False, 0.5, False), processes=0)
+
+
+def test_triangulation():
+    r"""Triangulation as NumPy arrays, with the face locations applied"""
+    box = OCC.BRepPrimAPI.BRepPrimAPI_MakeBox(10, 20, 30).Shape()
+    trsf = OCC.gp.gp_Trsf()
+    trsf.SetTranslation(OCC.gp.gp_Vec(100, 0, 0))
+    moved_box = box.Moved(OCC.TopLoc.TopLoc_Location(trsf))
+
+    vertices, triangles, face_ids = aocutils.mesh.triangulation(moved_box, factor=100.)
+    assert vertices.shape[1] == 3
+    assert triangles.shape[1] == 3
+    assert triangles.dtype == np.int32
+    assert len(face_ids) == len(triangles)
+    assert set(face_ids.tolist()) == set(range(6))
+    assert triangles.min() >= 0
+    assert triangles.max() < len(vertices)
+    assert np.allclose(vertices.min(axis=0), [100, 0, 0])
+    assert np.allclose(vertices.max(axis=0), [110, 20, 30])
+
+    # the triangles normals point outwards
+    v0, v1, v2 = vertices[triangles[:, 0]], vertices[triangles[:, 1]], vertices[triangles[:, 2]]
+    normals = np.cross(v1 - v0, v2 - v0)
+    centres = (v0 + v1 + v2) / 3. - [105, 10, 15]
+    assert np.all((normals * centres).sum(axis=1) > 0)
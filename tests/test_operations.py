@@ -0,0 +1,134 @@
+#!/usr/bin/python
+# coding: utf-8
+
+r"""operations package tests"""
+
+import numpy as np
+import pytest
+
+import OCC.BRepPrimAPI
+import OCC.Geom
+import OCC.gp
+
+import aocutils.analyze.bounds
+import aocutils.analyze.global_
+import aocutils.brep.edge_make
+import aocutils.operations.boolean
+import aocutils.operations.interpolate
+import aocutils.operations.project
+import aocutils.operations.transform
+import aocutils.topology
+
+
+def _volume(shape):
+    return sum(aocutils.analyze.global_.GlobalProperties(solid).volume
+               for solid in aocutils.topology.Topo(shape, return_iter=False).solids)
+
+
+def test_batch_cut():
+    r"""Cut many tools at once"""
+    plate = OCC.BRepPrimAPI.BRepPrimAPI_MakeBox(10, 10, 1).Shape()
+    tools = [OCC.BRepPrimAPI.BRepPrimAPI_MakeBox(OCC.gp.gp_Pnt(2 * i + 0.5, 0.5, -1), 1, 1, 3).Shape()
+             for i in range(5)]
+    # a tool far from the plate is filtered out
+    tools.append(OCC.BRepPrimAPI.BRepPrimAPI_MakeBox(OCC.gp.gp_Pnt(100, 100, 100), 1, 1, 1).Shape())
+    result = aocutils.operations.boolean.cut(plate, tools)
+    assert abs(_volume(result) - (100. - 5.)) < 1e-6
+    assert aocutils.operations.boolean.cut(plate, []) is plate
+
+    # cutting with [tool] or tool gives the same topology
+    topo_list = aocutils.topology.Topo(aocutils.operations.boolean.cut(plate, tools[:1]))
+    topo_single = aocutils.topology.Topo(aocutils.operations.boolean.cut(plate, tools[0]))
+    assert topo_list.number_of_faces == topo_single.number_of_faces
+    assert topo_list.number_of_edges == topo_single.number_of_edges
+
+
+def test_fuse_all():
+    r"""Fuse many shapes, at once and by balanced tree reduction"""
+    cubes = [OCC.BRepPrimAPI.BRepPrimAPI_MakeBox(OCC.gp.gp_Pnt(0.5 * i, 0, 0), 1, 1, 1).Shape() for i in range(7)]
+    expected_volume = 0.5 * 6 + 1.
+    assert abs(_volume(aocutils.operations.boolean.fuse_all(cubes)) - expected_volume) < 1e-6
+    for processes in (None, 2):
+        result = aocutils.operations.boolean.fuse_all(cubes, chunk_size=3, processes=processes)
+        assert abs(_volume(result) - expected_volume) < 1e-6
+
+
+def test_translate_iterable():
+    r"""translate() on a list of shapes"""
+    boxes = [OCC.BRepPrimAPI.BRepPrimAPI_MakeBox(1, 1, 1).Shape() for _ in range(3)]
+    translated = aocutils.operations.transform.translate(boxes, OCC.gp.gp_Vec(10, 0, 0))
+    assert len(translated) == 3
+    for shape in translated:
+        assert abs(aocutils.analyze.bounds.BoundingBox(shape, tol=0., use_cache=False).x_min - 10.) < 1e-6
+
+
+def test_transform():
+    r"""Chained transformations applied to many shapes"""
+    box = OCC.BRepPrimAPI.BRepPrimAPI_MakeBox(1, 2, 3).Shape()
+    transform = aocutils.operations.transform.Transform()
+    transform.rotate(OCC.gp.gp_Ax1(OCC.gp.gp_Pnt(0, 0, 0), OCC.gp.gp_Dir(0, 0, 1)), 90.)
+    transform.translate(OCC.gp.gp_Vec(10, 0, 0))
+    assert transform.is_rigid
+
+    # rotation first : the box spans x in [-2, 0] then [8, 10]
+    instances = transform.apply([box] * 100)
+    assert len(instances) == 100
+    assert instances[0].IsPartner(box)
+    bb = aocutils.analyze.bounds.BoundingBox(instances[0], tol=0., use_cache=False)
+    assert abs(bb.x_min - 8.) < 1e-6
+    assert abs(bb.x_max - 10.) < 1e-6
+
+    copied = transform.apply(box, copy=True)
+    assert not copied.IsPartner(box)
+    bb = aocutils.analyze.bounds.BoundingBox(copied, tol=0., use_cache=False)
+    assert abs(bb.x_min - 8.) < 1e-6
+
+    scaled = aocutils.operations.transform.Transform().scale_uniform(OCC.gp.gp_Pnt(0, 0, 0), 2.)
+    assert not scaled.is_rigid
+    assert abs(_volume(scaled.apply(box)) - 48.) < 1e-6
+
+
+def test_points_on_curve():
+    r"""Projection of points on an edge with the operations API"""
+    edge = aocutils.brep.edge_make.edge(OCC.gp.gp_Pnt(0, 0, 0), OCC.gp.gp_Pnt(0, 10, 0))
+    parameters, feet, distances = aocutils.operations.project.points_on_curve(edge, [[1., 5., 0.], [0., 7., 2.]])
+    assert np.allclose(feet, [[0., 5., 0.], [0., 7., 0.]], atol=1e-6)
+    assert np.allclose(distances, [1., 2.], atol=1e-6)
+
+    u, pnt = aocutils.operations.project.point_on_curve(edge, OCC.gp.gp_Pnt(1., 5., 0.))
+    assert abs(u - parameters[0]) < 1e-6
+    assert pnt.Distance(OCC.gp.gp_Pnt(0., 5., 0.)) < 1e-6
+
+    # a curve handle is projected on over its parameter range
+    circle = OCC.Geom.Geom_Circle(OCC.gp.gp_Ax2(OCC.gp.gp_Pnt(0, 0, 0), OCC.gp.gp_Dir(0, 0, 1)), 5.).GetHandle()
+    _, feet, distances = aocutils.operations.project.points_on_curve(circle, [[10., 0., 0.], [0., -2., 0.]])
+    assert np.allclose(feet, [[5., 0., 0.], [0., -5., 0.]], atol=1e-6)
+    assert np.allclose(distances, [5., 3.], atol=1e-6)
+
+    with pytest.raises(TypeError):
+        aocutils.operations.project.points_on_curve(OCC.BRepPrimAPI.BRepPrimAPI_MakeBox(1, 1, 1).Shape(),
+                                                    [[0., 0., 0.]])
+
+
+def test_filter_points_by_distance():
+    r"""First kept semantics on gp_Pnt lists and arrays"""
+    coordinates = [[0., 0., 0.], [0.05, 0., 0.], [0.1, 0., 0.], [0.15, 0., 0.], [1., 1., 1.], [0., 0., 0.]]
+    pnts = [OCC.gp.gp_Pnt(*c) for c in coordinates]
+
+    # 0.1 from the first point is within distance (<=), 0.15 is not
+    indices = aocutils.operations.interpolate.filter_indices_by_distance(pnts, 0.1)
+    assert indices.tolist() == [0, 3, 4]
+    filtered = aocutils.operations.interpolate.filter_points_by_distance(pnts, 0.1)
+    assert filtered == [pnts[0], pnts[3], pnts[4]]
+
+    array = np.array(coordinates)
+    assert np.array_equal(aocutils.operations.interpolate.filter_points_by_distance(array, 0.1), array[[0, 3, 4]])
+    assert aocutils.operations.interpolate.filter_indices_by_distance(array, 0.).tolist() == [0, 1, 2, 3, 4]
+
+    # same result as the pairwise comparison
+    random_points = np.random.RandomState(0).uniform(0., 2., (300, 3))
+    expected = list()
+    for i, point in enumerate(random_points):
+        if not any(np.linalg.norm(random_points[j] - point) <= 0.3 for j in expected):
+            expected.append(i)
+    assert aocutils.operations.interpolate.filter_indices_by_distance(random_points, 0.3).tolist() == expected
@@ -4,11 +4,15 @@
 r"""topology module tests"""
 
 import sys
+import types
 import pytest
 
+import numpy as np
 import OCC.BRepPrimAPI
+import OCC.TopAbs
 import OCC.TopoDS
 
+import aocutils.exceptions
 import aocutils.topology
 import aocutils.primitives
 import aocutils.brep.edge
@@ -312,3 +316,71 @@ def test_wires_out_of_scope(topo):
         _vertices.append(vert)
     for v in _vertices:
         assert not v.IsNull()
+
+
+def test_cached_topo():
+    r"""A cached Topo must answer the same queries as a non cached Topo"""
+    box = aocutils.primitives.box(10, 10, 10)
+    topo = aocutils.topology.Topo(box, return_iter=False)
+    cached_topo = aocutils.topology.Topo(box, return_iter=False, cached=True)
+    assert cached_topo.cached is True
+
+    assert cached_topo.number_of_faces == topo.number_of_faces == 6
+    assert cached_topo.number_of_edges == topo.number_of_edges == 12
+    assert cached_topo.number_of_vertices == topo.number_of_vertices == 8
+
+    # modifying a returned list must not modify the cache
+    cached_topo.faces.pop()
+    assert cached_topo.number_of_faces == 6
+
+    for edg in cached_topo.edges:
+        assert len(list(cached_topo.faces_from_edge(edg))) == 2
+        assert cached_topo.number_of_faces_from_edge(edg) == topo.number_of_faces_from_edge(edg)
+
+
+def test_ignore_orientation():
+    r"""Sub-shapes are unique whether the orientation is ignored or not, and the order is the same"""
+    box = aocutils.primitives.box(10, 10, 10)
+    topo = aocutils.topology.Topo(box, return_iter=False)
+    topo_ignore_orientation = aocutils.topology.Topo(box, ignore_orientation=True)
+
+    edges = topo.edges
+    edges_ignore_orientation = topo_ignore_orientation.edges
+    assert isinstance(edges_ignore_orientation, list)
+    assert len(edges) == len(edges_ignore_orientation) == 12
+    assert all(a.IsSame(b) for a, b in zip(edges, edges_ignore_orientation))
+    assert len(topo_ignore_orientation.vertices) == 8
+
+
+def test_lazy_iteration(topo):
+    r"""With return_iter=True, the sub-shapes are produced lazily
+
+    Parameters
+    ----------
+    topo : aocutils.topology.Topo
+        Topo object (pytest fixture)
+
+    """
+    faces = topo.faces
+    assert isinstance(faces, types.GeneratorType)
+    first_face = next(faces)
+    assert isinstance(first_face, OCC.TopoDS.TopoDS_Face)
+    # the remaining faces are still available and unique
+    assert len(list(faces)) == 5
+
+
+def test_adjacency():
+    r"""Edge -> face adjacency of a box in CSR form"""
+    topo = aocutils.topology.Topo(aocutils.primitives.box(10, 10, 10))
+    indptr, indices, edges, faces = topo.adjacency(OCC.TopAbs.TopAbs_EDGE, OCC.TopAbs.TopAbs_FACE)
+    assert len(edges) == 12
+    assert len(faces) == 6
+    assert indptr.shape == (13,)
+    assert indptr[-1] == len(indices) == 24
+    # each edge of a box is shared by 2 faces ...
+    assert (np.diff(indptr) == 2).all()
+    # ... and each face has 4 edges
+    assert (np.bincount(indices) == 4).all()
+
+    with pytest.raises(aocutils.exceptions.WrongTopologicalType):
+        topo.adjacency(OCC.TopAbs.TopAbs_EDGE, OCC.TopAbs.TopAbs_SHAPE)